@@ -7,6 +7,12 @@ from .word_reader import WordReaderService
 from .data_processor import DataProcessorService, TeknikResimKarakteri
 from .word_save_as import WordSaveAsService
 from .auto_save_recovery import AutoSaveRecoveryService
+from .parse_cache import DocumentParseCache
+from .parsed_dimension_store import ParsedDimensionStore
+from .document_session import DocumentSession
+from .karakter_repository import KarakterRepository
+from .table_index import TableIndex, TableInfo
+from .async_processor import AsyncDocumentProcessor, DocumentResult
 
 # Yeni servisler
 from .project_manager import ProjectManager
@@ -27,6 +33,14 @@ __all__ = [
     'TeknikResimKarakteri',
     'WordSaveAsService',
     'AutoSaveRecoveryService',
+    'DocumentParseCache',
+    'ParsedDimensionStore',
+    'DocumentSession',
+    'KarakterRepository',
+    'TableIndex',
+    'TableInfo',
+    'AsyncDocumentProcessor',
+    'DocumentResult',
     
     # Yeni servisler
     'ProjectManager',
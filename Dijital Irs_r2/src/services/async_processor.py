@@ -0,0 +1,175 @@
+"""
+Toplu doküman işleme - Word dosyalarını süreç havuzunda paralel işler
+services/async_processor.py
+"""
+import asyncio
+import contextlib
+import glob
+import io
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from .word_reader import WordReaderService
+from .data_processor import DataProcessorService, TeknikResimKarakteri
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+@dataclass
+class DocumentResult:
+    """Tek bir Word dosyasının işlenme sonucu"""
+    file_path: str
+    karakterler: List[TeknikResimKarakteri] = field(default_factory=list)
+    row_count: int = 0
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def _process_document(file_path: str, quiet: bool = True) -> DocumentResult:
+    """
+    Worker süreçte çalışır: Word → satırlar → karakterler (DataFrame kurulmaz)
+
+    Hiçbir istisna dışarı sızmaz; hata sonuç objesine yazılır ki bir dosyanın
+    bozuk olması partinin geri kalanını etkilemesin.
+    """
+    start = time.perf_counter()
+    try:
+        # Satır bazlı konsol çıktısı yüzlerce dosyada birbirine karışır
+        output = io.StringIO() if quiet else None
+        with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+            rows = WordReaderService().extract_tables(file_path)
+            karakterler = DataProcessorService().process_rows(rows[1:])
+
+        if not rows:
+            raise ValueError("Word dosyası okunamadı")
+
+        return DocumentResult(
+            file_path=file_path,
+            karakterler=karakterler,
+            row_count=max(len(rows) - 1, 0),
+            elapsed=time.perf_counter() - start
+        )
+    except Exception as e:
+        return DocumentResult(
+            file_path=file_path,
+            error=f"{type(e).__name__}: {e}",
+            elapsed=time.perf_counter() - start
+        )
+
+
+class AsyncDocumentProcessor:
+    """
+    Word dosyalarını ProcessPoolExecutor ile paralel işler
+    - Sonuçlar dosya bittikçe akış halinde döner
+    - Her dosyanın hatası kendi sonucunda kalır
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, quiet: bool = True):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.quiet = quiet
+        self.executor: Optional[ProcessPoolExecutor] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self.executor
+
+    def process_batch(self, file_paths: Iterable[str],
+                      on_result: Optional[Callable[[DocumentResult], None]] = None) -> Iterator[DocumentResult]:
+        """
+        Dosyaları havuza dağıtır ve her biri bittiğinde sonucunu üretir
+
+        Args:
+            file_paths: İşlenecek Word dosyaları
+            on_result: Her sonuç için çağrılacak opsiyonel callback
+
+        Yields:
+            DocumentResult: Bitiş sırasına göre dosya sonuçları
+        """
+        file_paths = list(file_paths)
+        if not file_paths:
+            return
+
+        executor = self._get_executor()
+        futures = {
+            executor.submit(_process_document, path, self.quiet): path
+            for path in file_paths
+        }
+
+        try:
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    # Worker sürecinin kendisi çöktü (BrokenProcessPool vb.)
+                    result = DocumentResult(file_path=futures[future], error=f"{type(e).__name__}: {e}")
+
+                if on_result:
+                    on_result(result)
+                yield result
+        finally:
+            # Tüketici erken çıkarsa bekleyen işleri iptal et
+            for future in futures:
+                future.cancel()
+
+    def process_folder(self, folder: str, pattern: str = "*.docx") -> Iterator[DocumentResult]:
+        """Klasördeki Word dosyalarını işler (Word kilit dosyaları ~$ hariç)"""
+        file_paths = sorted(
+            path for path in glob.glob(os.path.join(folder, pattern))
+            if not os.path.basename(path).startswith("~$")
+        )
+        log.info("📂 %s Word dosyası işlenecek (%s süreç)", len(file_paths), self.max_workers)
+        return self.process_batch(file_paths)
+
+    async def process_document_async(self, file_path: str) -> DocumentResult:
+        """Tek dosyayı event loop'u bloklamadan işler"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), _process_document, file_path, self.quiet)
+
+    def shutdown(self):
+        """Süreç havuzunu kapatır"""
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+
+# Test fonksiyonu
+def test_batch_processing(folder: str = "."):
+    """Klasördeki Word dosyalarını paralel işler ve özet yazdırır"""
+    print("=== TOPLU İŞLEME TEST ===")
+
+    success = 0
+    failed = 0
+    start = time.perf_counter()
+
+    with AsyncDocumentProcessor() as processor:
+        for result in processor.process_folder(folder):
+            name = os.path.basename(result.file_path)
+            if result.ok:
+                success += 1
+                print(f"✓ {name}: {len(result.karakterler)} karakter ({result.elapsed:.2f}s)")
+            else:
+                failed += 1
+                print(f"✗ {name}: {result.error}")
+
+    print(f"Toplam: {success} başarılı, {failed} hatalı ({time.perf_counter() - start:.2f}s)")
+
+
+if __name__ == "__main__":
+    import sys
+    test_batch_processing(sys.argv[1] if len(sys.argv) > 1 else ".")
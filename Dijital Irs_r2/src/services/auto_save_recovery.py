@@ -8,10 +8,16 @@ import pickle
 import time
 import threading
 import atexit
+from dataclasses import fields
 from datetime import datetime
 from typing import List, Dict, Any, Optional
 from pathlib import Path
-from .data_processor import TeknikResimKarakteri
+from .data_processor import DERIVED_FIELDS, TeknikResimKarakteri, karakter_to_dict
+from .karakter_repository import KarakterRepository
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
 
 class AutoSaveRecoveryService:
     """
@@ -45,7 +51,7 @@ class AutoSaveRecoveryService:
         # Program kapatılırken acil kaydet
         atexit.register(self.emergency_save)
         
-        print(f"📁 Otomatik kaydetme klasörü: {self.save_directory}")
+        log.info("📁 Otomatik kaydetme klasörü: %s", self.save_directory)
     
     def start_auto_save(self):
         """Otomatik kaydetmeyi başlatır"""
@@ -53,14 +59,14 @@ class AutoSaveRecoveryService:
             self.auto_save_enabled = True
             self.auto_save_thread = threading.Thread(target=self._auto_save_loop, daemon=True)
             self.auto_save_thread.start()
-            print("🔄 Otomatik kaydetme başlatıldı (30 saniyede bir)")
+            log.info("🔄 Otomatik kaydetme başlatıldı (30 saniyede bir)")
     
     def stop_auto_save(self):
         """Otomatik kaydetmeyi durdurur"""
         self.auto_save_enabled = False
         if self.auto_save_thread:
             self.auto_save_thread.join(timeout=1)
-        print("⏹ Otomatik kaydetme durduruldu")
+        log.info("⏹ Otomatik kaydetme durduruldu")
     
     def _auto_save_loop(self):
         """Arka planda otomatik kaydetme döngüsü"""
@@ -70,7 +76,7 @@ class AutoSaveRecoveryService:
                 if self.auto_save_enabled and self.current_data['karakterler']:
                     self._save_data('auto')
             except Exception as e:
-                print(f"⚠ Otomatik kaydetme hatası: {e}")
+                log.warning("⚠ Otomatik kaydetme hatası: %s", e)
     
     def update_data(self, karakterler: List[TeknikResimKarakteri]):
         """Mevcut veriyi günceller"""
@@ -80,17 +86,9 @@ class AutoSaveRecoveryService:
             measurement_count = 0
             
             for k in karakterler:
-                karakter_data = {
-                    'item_no': k.item_no,
-                    'nominal': k.nominal,
-                    'actual': k.actual,
-                    'upper_limit': getattr(k, 'upper_limit', None),
-                    'lower_limit': getattr(k, 'lower_limit', None),
-                    'tolerans': getattr(k, 'tolerans', None),
-                    'unit': getattr(k, 'unit', None),
-                    'feature_type': getattr(k, 'feature_type', None)
-                }
-                serializable_data.append(karakter_data)
+                # Parse sonuçları (parsed_dimension, tolerance_type, limitler) dahil tüm alanlar;
+                # parsed_actual ACTUAL'dan yeniden hesaplanır, yazılmaz
+                serializable_data.append(karakter_to_dict(k))
                 
                 if k.actual:
                     measurement_count += 1
@@ -101,10 +99,10 @@ class AutoSaveRecoveryService:
                 'measurement_count': measurement_count
             })
             
-            print(f"📊 Veri güncellendi: {len(karakterler)} karakter, {measurement_count} ölçüm")
+            log.debug("📊 Veri güncellendi: %s karakter, %s ölçüm", len(karakterler), measurement_count)
             
         except Exception as e:
-            print(f"⚠ Veri güncelleme hatası: {e}")
+            log.warning("⚠ Veri güncelleme hatası: %s", e)
     
     def _save_data(self, save_type: str = 'manual'):
         """Veriyi dosyaya kaydeder"""
@@ -133,15 +131,15 @@ class AutoSaveRecoveryService:
             self.current_data['last_save_time'] = datetime.now().isoformat()
             
             if save_type == 'auto':
-                print(f"💾 Otomatik kaydetme: {self.current_data['measurement_count']} ölçüm")
+                log.info("💾 Otomatik kaydetme: %s ölçüm", self.current_data['measurement_count'])
             else:
-                print(f"💾 {save_type.title()} kaydetme tamamlandı: {json_file.name}")
+                log.info("💾 %s kaydetme tamamlandı: %s", save_type.title(), json_file.name)
             
             # Eski yedekleri temizle (10'dan fazla varsa)
             self._cleanup_old_backups()
             
         except Exception as e:
-            print(f"⚠ Kaydetme hatası: {e}")
+            log.warning("⚠ Kaydetme hatası: %s", e)
     
     def manual_save(self):
         """Manuel kaydetme"""
@@ -149,7 +147,7 @@ class AutoSaveRecoveryService:
             self._save_data('manual')
             return True
         else:
-            print("⚠ Kaydedilecek veri yok")
+            log.warning("⚠ Kaydedilecek veri yok")
             return False
     
     def emergency_save(self):
@@ -158,9 +156,9 @@ class AutoSaveRecoveryService:
             try:
                 self.stop_auto_save()  # Otomatik kaydetmeyi durdur
                 self._save_data('emergency')
-                print("🚨 Acil durum kaydetmesi tamamlandı")
+                log.info("🚨 Acil durum kaydetmesi tamamlandı")
             except Exception as e:
-                print(f"🚨 Acil durum kaydetme hatası: {e}")
+                log.error("🚨 Acil durum kaydetme hatası: %s", e)
     
     def _cleanup_old_backups(self):
         """Eski yedekleri temizler (disk alanı için)"""
@@ -177,10 +175,10 @@ class AutoSaveRecoveryService:
                     if pickle_file.exists():
                         pickle_file.unlink()
                 except Exception as e:
-                    print(f"⚠ Eski dosya silinemedi {old_file.name}: {e}")
+                    log.warning("⚠ Eski dosya silinemedi %s: %s", old_file.name, e)
                     
         except Exception as e:
-            print(f"⚠ Eski dosya temizleme hatası: {e}")
+            log.warning("⚠ Eski dosya temizleme hatası: %s", e)
     
     def list_available_backups(self) -> List[Dict[str, Any]]:
         """Mevcut yedekleri listeler"""
@@ -210,10 +208,10 @@ class AutoSaveRecoveryService:
                     backups.append(backup_info)
                     
                 except Exception as e:
-                    print(f"⚠ Backup dosyası okunamadı {backup_file.name}: {e}")
+                    log.warning("⚠ Backup dosyası okunamadı %s: %s", backup_file.name, e)
             
         except Exception as e:
-            print(f"⚠ Backup listesi oluşturulamadı: {e}")
+            log.warning("⚠ Backup listesi oluşturulamadı: %s", e)
         
         return backups
     
@@ -236,30 +234,23 @@ class AutoSaveRecoveryService:
                 data = json.load(f)
             
             # TeknikResimKarakteri objelerini yeniden oluştur
+            # Eski formattaki yedeklerde bulunmayan alanlar varsayılan değerini alır
+            field_names = {f.name for f in fields(TeknikResimKarakteri)}.difference(DERIVED_FIELDS)
             karakterler = []
             for k_data in data.get('karakterler', []):
-                karakter = TeknikResimKarakteri(
-                    item_no=k_data.get('item_no', ''),
-                    nominal=k_data.get('nominal'),
-                    tolerans=k_data.get('tolerans'),
-                    unit=k_data.get('unit')
-                )
-                
-                # Diğer özellikleri ekle
-                karakter.actual = k_data.get('actual')
-                karakter.upper_limit = k_data.get('upper_limit')
-                karakter.lower_limit = k_data.get('lower_limit')
-                karakter.feature_type = k_data.get('feature_type')
-                
-                karakterler.append(karakter)
+                values = {name: value for name, value in k_data.items() if name in field_names}
+                values.setdefault('item_no', '')
+                values.setdefault('dimension', '')
+                values.setdefault('tooling', '')
+                karakterler.append(TeknikResimKarakteri(**values))
             
-            print(f"✓ Veri kurtarıldı: {len(karakterler)} karakter, {data.get('measurement_count', 0)} ölçüm")
-            print(f"📅 Oturum zamanı: {data.get('session_start', 'Bilinmiyor')}")
+            log.info("✓ Veri kurtarıldı: %s karakter, %s ölçüm", len(karakterler), data.get('measurement_count', 0))
+            log.info("📅 Oturum zamanı: %s", data.get('session_start', 'Bilinmiyor'))
             
             return karakterler
             
         except Exception as e:
-            print(f"⚠ Veri kurtarma hatası: {e}")
+            log.warning("⚠ Veri kurtarma hatası: %s", e)
             return []
     
     def export_to_excel(self, karakterler: List[TeknikResimKarakteri], filename: str = None):
@@ -276,7 +267,7 @@ class AutoSaveRecoveryService:
             for k in karakterler:
                 row = {
                     'ITEM NO': k.item_no,
-                    'NOMINAL': k.nominal,
+                    'NOMINAL': k.nominal_value,
                     'ACTUAL': k.actual,
                     'UPPER LIMIT': getattr(k, 'upper_limit', None),
                     'LOWER LIMIT': getattr(k, 'lower_limit', None),
@@ -306,14 +297,14 @@ class AutoSaveRecoveryService:
                 stats_df = pd.DataFrame(stats_data)
                 stats_df.to_excel(writer, sheet_name='İstatistikler', index=False)
             
-            print(f"📊 Excel dosyası oluşturuldu: {filename}")
+            log.info("📊 Excel dosyası oluşturuldu: %s", filename)
             return str(filename)
             
         except ImportError:
-            print("⚠ pandas kütüphanesi bulunamadı. Excel export için: pip install pandas openpyxl")
+            log.warning("⚠ pandas kütüphanesi bulunamadı. Excel export için: pip install pandas openpyxl")
             return None
         except Exception as e:
-            print(f"⚠ Excel export hatası: {e}")
+            log.warning("⚠ Excel export hatası: %s", e)
             return None
     
     def get_status(self) -> Dict[str, Any]:
@@ -335,28 +326,29 @@ class CrashSafeDataManager:
     
     def __init__(self, karakterler: List[TeknikResimKarakteri] = None):
         self.auto_save = AutoSaveRecoveryService()
-        self.karakterler = karakterler or []
+        self.karakterler = KarakterRepository(karakterler or [])
         
         # Otomatik kaydetmeyi başlat
         if self.karakterler:
             self.auto_save.update_data(self.karakterler)
         self.auto_save.start_auto_save()
         
-        print("🛡 Çökme güvenli veri yöneticisi aktif")
+        log.info("🛡 Çökme güvenli veri yöneticisi aktif")
     
     def update_measurement(self, item_no: str, actual_value: str):
         """Bir ölçüm değerini günceller ve otomatik kaydeder"""
         try:
-            for karakter in self.karakterler:
-                if karakter.item_no == item_no:
-                    karakter.actual = actual_value
-                    self.auto_save.update_data(self.karakterler)
-                    print(f"📝 {item_no}: {actual_value} (otomatik kaydedildi)")
-                    return True
-            print(f"⚠ Karakter bulunamadı: {item_no}")
-            return False
+            karakter = self.karakterler.get_by_item_no(item_no)
+            if karakter is None:
+                log.warning("⚠ Karakter bulunamadı: %s", item_no)
+                return False
+
+            self.karakterler.set_actual(karakter, actual_value)
+            self.auto_save.update_data(self.karakterler)
+            log.debug("📝 %s: %s (otomatik kaydedildi)", item_no, actual_value)
+            return True
         except Exception as e:
-            print(f"⚠ Ölçüm güncelleme hatası: {e}")
+            log.warning("⚠ Ölçüm güncelleme hatası: %s", e)
             return False
     
     def manual_save_all(self):
@@ -371,22 +363,22 @@ class CrashSafeDataManager:
             
             # Word export dene
             result = word_service.save_with_actual_values(self.karakterler, save_path)
-            print("✓ Word export başarılı")
+            log.info("✓ Word export başarılı")
             return result
             
         except Exception as e:
-            print(f"⚠ Word export hatası: {e}")
+            log.warning("⚠ Word export hatası: %s", e)
             # Hata durumunda Excel'e kaydet
             excel_file = self.auto_save.export_to_excel(self.karakterler)
             if excel_file:
-                print(f"💾 Yedek olarak Excel'e kaydedildi: {excel_file}")
+                log.info("💾 Yedek olarak Excel'e kaydedildi: %s", excel_file)
             raise e
     
     def recover_last_session(self):
         """Son oturumu kurtar"""
         recovered_data = self.auto_save.recover_data()
         if recovered_data:
-            self.karakterler = recovered_data
+            self.karakterler = KarakterRepository(recovered_data)
             self.auto_save.update_data(self.karakterler)
             return True
         return False
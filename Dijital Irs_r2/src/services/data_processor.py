@@ -1,15 +1,55 @@
 """
 Veri işleme servisi - Liste'yi DataFrame'e ve Model'e çevirir
 """
+import sys
 import pandas as pd
-from typing import List, Optional
-from dataclasses import dataclass
-from services.olcu_parser import OlcuYakalayici 
+from typing import Any, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+from dataclasses import asdict, dataclass, field
+from services.olcu_parser import OlcuOnbellegi, OlcuYakalayici
+from services.word_reader import HEADERS
 
+from utils.logger import get_logger
 
-@dataclass
+log = get_logger(__name__)
+
+# process_dataframe'in okuduğu kolonlar: (DataFrame kolonu, model alanı, kolon yoksa değer)
+FIELD_COLUMNS = [
+    ('ITEM NO', 'item_no', ''),
+    ('DIMENSION', 'dimension', ''),
+    ('TOOLING', 'tooling', ''),
+    ('REMARKS', 'remarks', ''),
+    ('B/P ZONE', 'bp_zone', ''),
+    ('INSP. LEVEL', 'inspection_level', '100%'),
+    ('ACTUAL', 'actual', None),
+    ('BADGE', 'badge', ''),
+]
+
+# str() ile metne dönmüş boş değerler
+MISSING_TEXTS = ['nan', 'None']
+
+# Az sayıda farklı değer alan metin alanları (alet, bölge, muayene seviyesi...) ve
+# aynı delik paterni / GD&T çerçevesi için tekrar eden ölçü metni; bu alanlar
+# intern edilir, binlerce karakter aynı string objesini paylaşır
+INTERNED_FIELDS = ('dimension', 'tooling', 'bp_zone', 'inspection_level', 'badge', 'tolerance_type')
+
+
+# Kalıcı kayıtlara (yedek, parse önbelleği) yazılmayan türetilmiş önbellek alanları
+DERIVED_FIELDS = ('parsed_actual',)
+
+
+def intern_text(value):
+    """Metin ise paylaşılan (intern edilmiş) kopyasını, değilse değeri aynen döner"""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(slots=True)
 class TeknikResimKarakteri:
-    """Teknik resim karakteri veri modeli"""
+    """
+    Teknik resim karakteri veri modeli
+    
+    __slots__ ile tutulur (instance başına __dict__ yok); tekrar eden metin
+    alanları intern edilir. Model alanları dışında attribute eklenemez.
+    """
     item_no: str
     dimension: str
     tooling: str
@@ -27,151 +67,384 @@ class TeknikResimKarakteri:
     lower_limit: Optional[float] = None
     # =======================
 
+    # ACTUAL'ın sayısal karşılığı (ham metin, değerler); ham metin değişince
+    # tolerance_engine.actual_values tarafından yeniden hesaplanır
+    parsed_actual: Optional[tuple] = field(default=None, compare=False, repr=False)
+    
+    def __post_init__(self):
+        for name in INTERNED_FIELDS:
+            setattr(self, name, intern_text(getattr(self, name)))
+
+
+def karakter_to_dict(karakter: TeknikResimKarakteri) -> Dict[str, Any]:
+    """Kalıcı kayıt için karakter alanları (türetilmiş önbellek alanları hariç)"""
+    data = asdict(karakter)
+    for name in DERIVED_FIELDS:
+        data.pop(name, None)
+    return data
+
+
+def karakter_from_dict(data: Dict[str, Any]) -> TeknikResimKarakteri:
+    """karakter_to_dict çıktısından model objesi (türetilmiş alanlar yeniden hesaplanır)"""
+    return TeknikResimKarakteri(**{name: value for name, value in data.items() if name not in DERIVED_FIELDS})
+
+
+class _ParseError(NamedTuple):
+    """Saklanan parser hatası; her seferinde yeni örnek oluşturmak için"""
+    error_type: type
+    args: tuple
+
+
+class DimensionDedupParser:
+    """
+    Doküman başına ölçü metni -> parse sonucu tablosu
+
+    OlcuYakalayici.isle her farklı ölçü metni için bir kez çalışır; aynı metni
+    taşıyan karakterler aynı sonuç sözlüğünü referansla paylaşır (sonuç salt
+    okunur kullanılır). Parser hatasının tipi ve argümanları saklanır, her
+    tekrarda yeni bir örnek fırlatılır; böylece satır bazlı uyarılar değişmez
+    ve aynı hata objesinin traceback'i büyümez.
+    """
+
+    def __init__(self, parser: Optional[OlcuYakalayici] = None):
+        self.parser = parser or OlcuYakalayici()
+        self._results: Dict[str, Any] = {}
+        self.total = 0
+
+    def isle(self, olcu: str) -> Optional[Dict[str, Any]]:
+        self.total += 1
+        try:
+            result = self._results[olcu]
+        except KeyError:
+            try:
+                result = self.parser.isle(olcu)
+            except Exception as e:
+                result = _ParseError(type(e), e.args)
+            self._results[sys.intern(olcu)] = result
+
+        if type(result) is _ParseError:
+            raise result.error_type(*result.args)
+        return result
+
+    @property
+    def unique(self) -> int:
+        return len(self._results)
+
+    def stats(self) -> dict:
+        """Parse edilen satır, farklı ölçü sayısı ve tekrar oranı"""
+        return {
+            "satir": self.total,
+            "farkli_olcu": self.unique,
+            "tekrar_orani": (1 - self.unique / self.total) if self.total else 0.0
+        }
+
+    def log_stats(self):
+        if self.total:
+            stats = self.stats()
+            log.info("  Ölçü tekilleştirme: %s satır, %s farklı ölçü (%%%.1f tekrar)",
+                     stats["satir"], stats["farkli_olcu"], stats["tekrar_orani"] * 100)
+
+        onbellek = getattr(self.parser, 'onbellek', None)
+        if onbellek is not None and log.debug_enabled:
+            stats = onbellek.istatistik()
+            log.debug("  Parse önbelleği: %s isabet, %s ıska, %s/%s kayıt, %s çıkarılan",
+                      stats["isabet"], stats["iska"], stats["boyut"], stats["kapasite"], stats["cikarilan"])
+
+
 class DataProcessorService:
     """
     Word içerisinden elde edilen listeyi mantıklı bir DataFrame yapısına çevirir
     """
     
-    def __init__(self):
+    def __init__(self, onbellek: Optional[OlcuOnbellegi] = None):
+        """
+        Args:
+            onbellek: Ölçü parse önbelleği (None ise önbelleksiz parse edilir)
+        """
         self.processed_data = []
         self.dataframe = None
-        self.olcu_parser = OlcuYakalayici()
+        self.olcu_parser = OlcuYakalayici(onbellek)
+        # Son işlenen dokümanın ölçü tekilleştirme istatistikleri
+        self.dedup_stats = {}
     
     @staticmethod
     def from_word_tables(word_reader: 'WordReaderService', file_path: str) -> pd.DataFrame:
         """
         WordReaderService'den veri alıp DataFrame oluşturur
         """
-        print("DataFrame oluşturuluyor...")
+        log.info("DataFrame oluşturuluyor...")
         
+        # Word'den veri çıkar
+        extracted_data = word_reader.extract_tables(file_path)
+        return DataProcessorService.from_extracted_rows(extracted_data)
+    
+    @staticmethod
+    def from_extracted_rows(extracted_data: List) -> pd.DataFrame:
+        """
+        extract_tables çıktısından (header + veri satırları) DataFrame oluşturur
+        """
         try:
-            # Word'den veri çıkar
-            extracted_data = word_reader.extract_tables(file_path)
-            
             if not extracted_data or len(extracted_data) < 2:
-                print("✗ Yeterli veri bulunamadı")
+                log.error("✗ Yeterli veri bulunamadı")
                 return pd.DataFrame()
             
             # Header - sabit 8 kolon
-            headers = ["ITEM NO", "DIMENSION", "ACTUAL", "BADGE", "TOOLING", "REMARKS", "B/P ZONE", "INSP. LEVEL"]
+            headers = list(HEADERS)
             data_rows = extracted_data[1:]
             
-            # Her veri satırını 8 kolona pad et
+            # Her veri satırını 8 kolona pad et (okuyucu zaten tam genişlikte üretir)
             padded_rows = []
             for row in data_rows:
+                if len(row) == len(headers):
+                    padded_rows.append(row)
+                    continue
                 # Eksik kolonları boş string ile doldur
-                padded_row = row + [''] * (len(headers) - len(row))
+                padded_row = list(row) + [''] * (len(headers) - len(row))
                 # Fazla kolonları kes
                 padded_row = padded_row[:len(headers)]
                 padded_rows.append(padded_row)
                 
-            print(f"  Debug - Header uzunluğu: {len(headers)}")
-            print(f"  Debug - İlk satır uzunluğu: {len(padded_rows[0]) if padded_rows else 'Boş'}")
+            log.debug("  Debug - Header uzunluğu: %s", len(headers))
+            log.debug("  Debug - İlk satır uzunluğu: %s", len(padded_rows[0]) if padded_rows else 'Boş')
             
             df = pd.DataFrame(padded_rows, columns=headers)
             
-            print(f"✓ DataFrame oluşturuldu: {len(df)} satır, {len(df.columns)} kolon")
-            print(f"  Kolon isimleri: {list(df.columns)}")
+            log.info("✓ DataFrame oluşturuldu: %s satır, %s kolon", len(df), len(df.columns))
+            log.debug("  Kolon isimleri: %s", list(df.columns))
             
             return df
             
         except Exception as e:
-            print(f"HATA: DataFrame oluşturma hatası: {e}")
+            log.error("HATA: DataFrame oluşturma hatası: %s", e)
             return pd.DataFrame()
     
+    @staticmethod
+    def _clean_column(series: pd.Series) -> pd.Series:
+        """Kolonun her değeri için str(değer).strip() karşılığı"""
+        if pd.api.types.is_string_dtype(series) and not series.hasnans:
+            return series.str.strip()
+        # NaN/None/sayı içeren kolonlarda str() çıktısı ('nan', 'None', '25.5') korunur
+        return series.astype(object).map(str).str.strip()
+    
     def process_dataframe(self, df: pd.DataFrame) -> List[TeknikResimKarakteri]:
         """
         DataFrame'i TeknikResimKarakteri model objelerine dönüştürür
+        
+        Kolonlar pandas string işlemleriyle toplu temizlenir, boş ITEM NO /
+        DIMENSION satırları maskelerle elenir; satır satır sadece model objesi
+        kurulur ve ölçü parse edilir. Sonuç iterrows + _build_karakter ile aynıdır.
         """
-        print("Model objelerine dönüştürülüyor...")
+        log.info("Model objelerine dönüştürülüyor...")
         
         if df.empty:
-            print("✗ Boş DataFrame")
+            log.error("✗ Boş DataFrame")
             return []
         
         try:
             # ===== YENİ EKLEME: Parser'ı başlat =====
 
-            parser = OlcuYakalayici()
+            # Her farklı ölçü metni bir kez parse edilir
+            parser = DimensionDedupParser(self.olcu_parser)
             # ======================================
             
-            karakterler = []
+            # iterrows satırları DataFrame.values'ın ortak tipinden kurar: tamamen sayısal
+            # bir tabloda tam sayılar float'a döner ("3" değil "3.0"); aynısı uygulanır
+            dtypes = list(df.dtypes)
+            if (all(pd.api.types.is_numeric_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype) for dtype in dtypes)
+                    and any(pd.api.types.is_float_dtype(dtype) for dtype in dtypes)):
+                df = df.astype('float64')
+            
+            columns = {}
+            for column, field_name, default in FIELD_COLUMNS:
+                if column in df.columns:
+                    columns[field_name] = self._clean_column(df[column])
+                else:
+                    columns[field_name] = pd.Series([default] * len(df), index=df.index, dtype=object)
+            
+            # Actual: boş, 'nan' ve 'None' değerler None olur
+            if 'ACTUAL' in df.columns:
+                actual = columns['actual']
+                actual_missing = df['ACTUAL'].isna() | actual.eq('') | actual.isin(MISSING_TEXTS)
+                columns['actual'] = actual.astype(object).where(~actual_missing, None)
             
-            for index, row in df.iterrows():
-                try:
-                    # Güvenli veri çıkarma
-                    item_no = str(row.get('ITEM NO', '')).strip()
-                    dimension = str(row.get('DIMENSION', '')).strip()
-                    tooling = str(row.get('TOOLING', '')).strip()
-                    remarks = str(row.get('REMARKS', '')).strip()
-                    bp_zone = str(row.get('B/P ZONE', '')).strip()
-                    inspection_level = str(row.get('INSP. LEVEL', '100%')).strip()
-                    actual = row.get('ACTUAL')
-                    badge = str(row.get('BADGE', '')).strip()
-                    
-                    # Actual değeri işleme
-                    if pd.isna(actual) or str(actual).strip() in ['', 'nan', 'None']:
-                        actual = None
+            # Temel validasyon
+            item_missing = columns['item_no'].eq('') | columns['item_no'].isin(MISSING_TEXTS)
+            dimension_missing = columns['dimension'].eq('') | columns['dimension'].isin(MISSING_TEXTS)
+            valid = ~(item_missing | dimension_missing)
+            
+            if not valid.all():
+                for index, no_item in zip(df.index[~valid], item_missing[~valid]):
+                    if no_item:
+                        log.warning("  ⚠ Satır %s: Item no boş, atlanıyor", index + 1)
                     else:
-                        actual = str(actual).strip()
-                    
-                    # Temel validasyon
-                    if not item_no or item_no in ['nan', 'None']:
-                        print(f"  ⚠ Satır {index + 1}: Item no boş, atlanıyor")
-                        continue
-                    
-                    if not dimension or dimension in ['nan', 'None']:
-                        print(f"  ⚠ Satır {index + 1}: Dimension boş, atlanıyor")
-                        continue
-                    
-                    # Model objesi oluştur
-                    karakter = TeknikResimKarakteri(
-                        item_no=item_no,
-                        dimension=dimension,
-                        tooling=tooling,
-                        remarks=remarks,
-                        bp_zone=bp_zone,
-                        inspection_level=inspection_level,
-                        actual=actual,
-                        badge=badge
-                    )
-                    
-                    # ===== YENİ EKLEME: Dimension Parsing =====
-                    try:
-                        parsed_result = parser.isle(dimension)
-                        if parsed_result:
-                            # Parse edilen verileri karakter objesine ekle
-                            karakter.parsed_dimension = parsed_result
-                            karakter.tolerance_type = parsed_result.get('format')
-                            karakter.nominal_value = parsed_result.get('nominal')
-                            karakter.upper_limit = parsed_result.get('ust_limit')
-                            karakter.lower_limit = parsed_result.get('alt_limit')
-                            print(f"    ✓ {karakter.item_no} - Dimension parsed: {parsed_result.get('format')}")
-                        else:
-                            # Parse edilemedi, ama hata verme - sadece None bırak
-                            karakter.parsed_dimension = None
-                            print(f"    ⚠ {karakter.item_no} - Dimension parse edilemedi: {dimension}")
-                    except Exception as parse_error:
-                        # Parser hatası olsa bile ana işlemi durdurma
-                        print(f"    ⚠ {karakter.item_no} - Parser hatası: {parse_error}")
-                        karakter.parsed_dimension = None
-                    # ==========================================
-                    
-                    karakterler.append(karakter)
-                    print(f"  ✓ {karakter.item_no} eklendi")
-                    
-                except Exception as e:
-                    print(f"  ✗ Satır {index + 1} işlenirken hata: {e}")
-                    continue
+                        log.warning("  ⚠ Satır %s: Dimension boş, atlanıyor", index + 1)
+            
+            # Kolonlar tek seferde Python listesine çevrilip satır demetleri halinde birleştirilir
+            field_names = list(columns)
+            karakterler = []
+            for values in zip(*(columns[name][valid].tolist() for name in field_names)):
+                karakter = TeknikResimKarakteri(**dict(zip(field_names, values)))
+                self._parse_dimension(karakter, parser)
+                karakterler.append(karakter)
             
             self.processed_data = karakterler
-            print(f"✓ {len(karakterler)} karakter başarıyla işlendi")
+            self.dedup_stats = parser.stats()
+            parser.log_stats()
+            log.info("✓ %s karakter başarıyla işlendi", len(karakterler))
             return karakterler
             
         except Exception as e:
-            print(f"HATA: Model dönüştürme hatası: {e}")
+            log.error("HATA: Model dönüştürme hatası: %s", e)
             return []
     
+    def process_rows(self, rows: Iterable[Sequence[str]]) -> List[TeknikResimKarakteri]:
+        """
+        Okuyucunun veri satırlarını (header hariç) DataFrame kurmadan tek geçişte
+        model objelerine dönüştürür
+        
+        Word açılışındaki asıl yol budur; DataFrame sadece isteyen (Excel export
+        vb.) için from_extracted_rows ile oluşturulur.
+        """
+        log.info("Model objelerine dönüştürülüyor...")
+        karakterler = list(self.iter_karakterler(rows))
+        log.info("✓ %s karakter başarıyla işlendi", len(karakterler))
+        return karakterler
+    
+    def iter_karakterler(self, rows: Iterable[Sequence[str]]) -> Iterator[TeknikResimKarakteri]:
+        """
+        Veri satırlarını (header hariç, HEADERS sırasında) okundukça model
+        objelerine dönüştürür - WordReaderService.iter_rows ile birlikte kullanılır
+        
+        process_dataframe ile aynı kuralları uygular, DataFrame oluşturmaz.
+        """
+        parser = DimensionDedupParser(self.olcu_parser)
+        self.processed_data = []
+        
+        for index, row in enumerate(rows):
+            karakter = self._karakter_from_row(row, index, parser)
+            if karakter is not None:
+                self.processed_data.append(karakter)
+                yield karakter
+        
+        self.dedup_stats = parser.stats()
+        parser.log_stats()
+    
+    def _karakter_from_row(self, row: Sequence[str], index: int, parser) -> Optional[TeknikResimKarakteri]:
+        """
+        HEADERS sırasındaki metin satırını doğrudan model objesine dönüştürür
+        
+        _build_karakter'in metin hücreler için hızlı karşılığı; metin olmayan
+        hücre içeren satırlar _build_karakter'e bırakılır.
+        """
+        if len(row) != len(HEADERS):
+            row = (list(row) + [''] * (len(HEADERS) - len(row)))[:len(HEADERS)]
+        
+        try:
+            item_no, dimension, actual, badge, tooling, remarks, bp_zone, inspection_level = (
+                cell.strip() for cell in row
+            )
+        except AttributeError:
+            return self._build_karakter(dict(zip(HEADERS, row)), index, parser)
+        
+        # Temel validasyon
+        if not item_no or item_no in MISSING_TEXTS:
+            log.warning("  ⚠ Satır %s: Item no boş, atlanıyor", index + 1)
+            return None
+        
+        if not dimension or dimension in MISSING_TEXTS:
+            log.warning("  ⚠ Satır %s: Dimension boş, atlanıyor", index + 1)
+            return None
+        
+        karakter = TeknikResimKarakteri(
+            item_no=item_no,
+            dimension=dimension,
+            tooling=tooling,
+            remarks=remarks,
+            bp_zone=bp_zone,
+            inspection_level=inspection_level,
+            actual=None if not actual or actual in MISSING_TEXTS else actual,
+            badge=badge
+        )
+        self._parse_dimension(karakter, parser)
+        return karakter
+    
+    def _build_karakter(self, row, index: int, parser) -> Optional[TeknikResimKarakteri]:
+        """Tek satırı (Series veya dict) model objesine dönüştürür, geçersizse None"""
+        try:
+            # Güvenli veri çıkarma
+            item_no = str(row.get('ITEM NO', '')).strip()
+            dimension = str(row.get('DIMENSION', '')).strip()
+            tooling = str(row.get('TOOLING', '')).strip()
+            remarks = str(row.get('REMARKS', '')).strip()
+            bp_zone = str(row.get('B/P ZONE', '')).strip()
+            inspection_level = str(row.get('INSP. LEVEL', '100%')).strip()
+            actual = row.get('ACTUAL')
+            badge = str(row.get('BADGE', '')).strip()
+            
+            # Actual değeri işleme
+            if pd.isna(actual) or str(actual).strip() in [''] + MISSING_TEXTS:
+                actual = None
+            else:
+                actual = str(actual).strip()
+            
+            # Temel validasyon
+            if not item_no or item_no in MISSING_TEXTS:
+                log.warning("  ⚠ Satır %s: Item no boş, atlanıyor", index + 1)
+                return None
+            
+            if not dimension or dimension in MISSING_TEXTS:
+                log.warning("  ⚠ Satır %s: Dimension boş, atlanıyor", index + 1)
+                return None
+            
+            # Model objesi oluştur
+            karakter = TeknikResimKarakteri(
+                item_no=item_no,
+                dimension=dimension,
+                tooling=tooling,
+                remarks=remarks,
+                bp_zone=bp_zone,
+                inspection_level=inspection_level,
+                actual=actual,
+                badge=badge
+            )
+            
+            self._parse_dimension(karakter, parser)
+            return karakter
+            
+        except Exception as e:
+            log.error("  ✗ Satır %s işlenirken hata: %s", index + 1, e)
+            return None
+    
+    def _parse_dimension(self, karakter: TeknikResimKarakteri, parser):
+        """
+        Ölçüyü parse edip tolerans alanlarını doldurur; parser hatası satırı düşürmez
+
+        parser: OlcuYakalayici veya DimensionDedupParser (isle arayüzü)
+        """
+        # ===== YENİ EKLEME: Dimension Parsing =====
+        try:
+            parsed_result = parser.isle(karakter.dimension)
+            if parsed_result:
+                # Parse edilen verileri karakter objesine ekle
+                karakter.parsed_dimension = parsed_result
+                # Alan kurulumdan sonra atandığı için burada intern edilir
+                karakter.tolerance_type = intern_text(parsed_result.get('format'))
+                karakter.nominal_value = parsed_result.get('nominal')
+                karakter.upper_limit = parsed_result.get('ust_limit')
+                karakter.lower_limit = parsed_result.get('alt_limit')
+                log.debug("    ✓ %s - Dimension parsed: %s", karakter.item_no, parsed_result.get('format'))
+            else:
+                # Parse edilemedi, ama hata verme - sadece None bırak
+                karakter.parsed_dimension = None
+                log.debug("    ⚠ %s - Dimension parse edilemedi: %s", karakter.item_no, karakter.dimension)
+        except Exception as parse_error:
+            # Parser hatası olsa bile ana işlemi durdurma
+            log.warning("    ⚠ %s - Parser hatası: %s", karakter.item_no, parse_error)
+            karakter.parsed_dimension = None
+        # ==========================================
+        
+        log.debug("  ✓ %s eklendi", karakter.item_no)
+    
     def get_summary(self) -> dict:
         """İşlenen verinin özetini döner"""
         if not self.processed_data:
@@ -186,5 +459,43 @@ class DataProcessorService:
         return {
             "toplam_karakter": len(self.processed_data),
             "alet_dagilimi": alet_sayilari,
-            "farkli_alet_sayisi": len(alet_sayilari)
-        }
\ No newline at end of file
+            "farkli_alet_sayisi": len(alet_sayilari),
+            "olcu_tekillestirme": self.dedup_stats
+        }
+
+
+# Benchmark
+def benchmark_process_dataframe(row_count: int = 10000):
+    """iterrows + _build_karakter ile kolon bazlı process_dataframe karşılaştırması"""
+    import time
+
+    dimensions = ["25.55±0.1", "MAX 6.3", "[ Position | ∅0.2 | A | B ]", "Ø250 +0.1/-0.1", " R5 "]
+    rows = [list(HEADERS)]
+    for i in range(row_count):
+        item_no = f" KN{i:05d} " if i % 50 else ""
+        rows.append([item_no, dimensions[i % len(dimensions)], "", "", "CALIPER", "", "A1", "100%"])
+    df = DataProcessorService.from_extracted_rows(rows)
+    service = DataProcessorService()
+
+    start = time.perf_counter()
+    parser = OlcuYakalayici()
+    expected = [k for k in (service._build_karakter(row, index, parser) for index, row in df.iterrows()) if k is not None]
+    iterrows_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = service.process_dataframe(df)
+    fast_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    direct = service.process_rows(rows[1:])
+    direct_time = time.perf_counter() - start
+
+    print(f"=== {row_count} satır ===")
+    print(f"iterrows          : {iterrows_time:.3f}s")
+    print(f"process_dataframe : {fast_time:.3f}s ({iterrows_time / fast_time:.1f}x)")
+    print(f"process_rows      : {direct_time:.3f}s ({iterrows_time / direct_time:.1f}x, DataFrame yok)")
+    print(f"Aynı sonuç        : {expected == actual == direct}")
+
+
+if __name__ == "__main__":
+    benchmark_process_dataframe()
@@ -10,6 +10,10 @@ from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 from abc import ABC, abstractmethod
 
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
 
 class DataSource(ABC):
     """Abstract base class for data sources"""
@@ -44,9 +48,9 @@ class JSONDataSource(DataSource):
             try:
                 with open(self.file_path, 'r', encoding='utf-8') as f:
                     self.data = json.load(f)
-                print(f"✓ JSON veri yüklendi: {self.file_path}")
+                log.info("✓ JSON veri yüklendi: %s", self.file_path)
             except Exception as e:
-                print(f"HATA: JSON yükleme hatası: {e}")
+                log.error("HATA: JSON yükleme hatası: %s", e)
                 self.data = {}
 
     def _save_file(self):
@@ -55,10 +59,10 @@ class JSONDataSource(DataSource):
             os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
             with open(self.file_path, 'w', encoding='utf-8') as f:
                 json.dump(self.data, f, indent=2, ensure_ascii=False)
-            print(f"✓ JSON veri kaydedildi: {self.file_path}")
+            log.info("✓ JSON veri kaydedildi: %s", self.file_path)
             return True
         except Exception as e:
-            print(f"HATA: JSON kaydetme hatası: {e}")
+            log.error("HATA: JSON kaydetme hatası: %s", e)
             return False
 
     def load_data(self, identifier: str) -> Dict[str, Any]:
@@ -101,9 +105,9 @@ class ExcelDataSource(DataSource):
                             'actual_value': row.get('actual_value', '')
                         }
 
-                print(f"✓ Excel veri yüklendi: {self.file_path}")
+                log.info("✓ Excel veri yüklendi: %s", self.file_path)
             except Exception as e:
-                print(f"HATA: Excel yükleme hatası: {e}")
+                log.error("HATA: Excel yükleme hatası: %s", e)
                 self.data = {}
 
     def _save_file(self):
@@ -126,10 +130,10 @@ class ExcelDataSource(DataSource):
             os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
             df.to_excel(self.file_path, sheet_name=self.sheet_name, index=False)
 
-            print(f"✓ Excel veri kaydedildi: {self.file_path}")
+            log.info("✓ Excel veri kaydedildi: %s", self.file_path)
             return True
         except Exception as e:
-            print(f"HATA: Excel kaydetme hatası: {e}")
+            log.error("HATA: Excel kaydetme hatası: %s", e)
             return False
 
     def load_data(self, identifier: str) -> Dict[str, Any]:
@@ -170,9 +174,9 @@ class SQLiteDataSource(DataSource):
                         updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                     )
                 ''')
-            print(f"✓ SQLite tablo oluşturuldu: {self.db_path}")
+            log.info("✓ SQLite tablo oluşturuldu: %s", self.db_path)
         except Exception as e:
-            print(f"HATA: SQLite tablo oluşturma hatası: {e}")
+            log.error("HATA: SQLite tablo oluşturma hatası: %s", e)
 
     def load_data(self, identifier: str) -> Dict[str, Any]:
         """Belirli identifier için veri yükle"""
@@ -193,7 +197,7 @@ class SQLiteDataSource(DataSource):
                     }
             return {}
         except Exception as e:
-            print(f"HATA: SQLite veri yükleme hatası: {e}")
+            log.error("HATA: SQLite veri yükleme hatası: %s", e)
             return {}
 
     def save_data(self, identifier: str, data: Dict[str, Any]) -> bool:
@@ -211,10 +215,10 @@ class SQLiteDataSource(DataSource):
                     data.get('notes', ''),
                     data.get('actual_value', '')
                 ))
-            print(f"✓ SQLite veri kaydedildi: {identifier}")
+            log.info("✓ SQLite veri kaydedildi: %s", identifier)
             return True
         except Exception as e:
-            print(f"HATA: SQLite veri kaydetme hatası: {e}")
+            log.error("HATA: SQLite veri kaydetme hatası: %s", e)
             return False
 
     def list_available_data(self) -> List[str]:
@@ -224,7 +228,7 @@ class SQLiteDataSource(DataSource):
                 cursor = conn.execute('SELECT identifier FROM lot_details')
                 return [row[0] for row in cursor.fetchall()]
         except Exception as e:
-            print(f"HATA: SQLite veri listeleme hatası: {e}")
+            log.error("HATA: SQLite veri listeleme hatası: %s", e)
             return []
 
 
@@ -252,9 +256,9 @@ class CSVDataSource(DataSource):
                             'actual_value': row.get('actual_value', '')
                         }
 
-                print(f"✓ CSV veri yüklendi: {self.file_path}")
+                log.info("✓ CSV veri yüklendi: %s", self.file_path)
             except Exception as e:
-                print(f"HATA: CSV yükleme hatası: {e}")
+                log.error("HATA: CSV yükleme hatası: %s", e)
                 self.data = {}
 
     def _save_file(self):
@@ -274,10 +278,10 @@ class CSVDataSource(DataSource):
             os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
             df.to_csv(self.file_path, index=False)
 
-            print(f"✓ CSV veri kaydedildi: {self.file_path}")
+            log.info("✓ CSV veri kaydedildi: %s", self.file_path)
             return True
         except Exception as e:
-            print(f"HATA: CSV kaydetme hatası: {e}")
+            log.error("HATA: CSV kaydetme hatası: %s", e)
             return False
 
     def load_data(self, identifier: str) -> Dict[str, Any]:
@@ -303,7 +307,7 @@ class DataSourceManager:
         self.sources[name] = source
         if is_primary or not self.primary_source:
             self.primary_source = name
-        print(f"✓ Veri kaynağı eklendi: {name}")
+        log.info("✓ Veri kaynağı eklendi: %s", name)
 
     def remove_source(self, name: str):
         """Veri kaynağını kaldır"""
@@ -311,15 +315,15 @@ class DataSourceManager:
             del self.sources[name]
             if self.primary_source == name:
                 self.primary_source = next(iter(self.sources.keys())) if self.sources else None
-            print(f"✓ Veri kaynağı kaldırıldı: {name}")
+            log.info("✓ Veri kaynağı kaldırıldı: %s", name)
 
     def set_primary_source(self, name: str):
         """Ana veri kaynağını ayarla"""
         if name in self.sources:
             self.primary_source = name
-            print(f"✓ Ana veri kaynağı: {name}")
+            log.info("✓ Ana veri kaynağı: %s", name)
         else:
-            print(f"HATA: Veri kaynağı bulunamadı: {name}")
+            log.error("HATA: Veri kaynağı bulunamadı: %s", name)
 
     def load_data(self, identifier: str, source_name: Optional[str] = None) -> Dict[str, Any]:
         """
@@ -336,14 +340,14 @@ class DataSourceManager:
         if source_name and source_name in self.sources:
             data = self.sources[source_name].load_data(identifier)
             if data:
-                print(f"✓ Veri yüklendi ({source_name}): {identifier}")
+                log.info("✓ Veri yüklendi (%s): %s", source_name, identifier)
                 return data
 
         # Ana kaynaktan yükle
         if self.primary_source and self.primary_source in self.sources:
             data = self.sources[self.primary_source].load_data(identifier)
             if data:
-                print(f"✓ Veri yüklendi (ana kaynak): {identifier}")
+                log.info("✓ Veri yüklendi (ana kaynak): %s", identifier)
                 return data
 
         # Tüm kaynaklardan yükle
@@ -353,10 +357,10 @@ class DataSourceManager:
 
             data = source.load_data(identifier)
             if data:
-                print(f"✓ Veri yüklendi ({name}): {identifier}")
+                log.info("✓ Veri yüklendi (%s): %s", name, identifier)
                 return data
 
-        print(f"⚠ Veri bulunamadı: {identifier}")
+        log.warning("⚠ Veri bulunamadı: %s", identifier)
         return {}
 
     def save_data(self, identifier: str, data: Dict[str, Any],
@@ -390,7 +394,7 @@ class DataSourceManager:
                 try:
                     source.save_data(identifier, data)
                 except Exception as e:
-                    print(f"HATA: {name} kaynağına kaydetme hatası: {e}")
+                    log.error("HATA: %s kaynağına kaydetme hatası: %s", name, e)
 
         return success
 
@@ -401,7 +405,7 @@ class DataSourceManager:
             try:
                 all_data[name] = source.list_available_data()
             except Exception as e:
-                print(f"HATA: {name} kaynağı listeleme hatası: {e}")
+                log.error("HATA: %s kaynağı listeleme hatası: %s", name, e)
                 all_data[name] = []
         return all_data
 
@@ -435,11 +439,11 @@ class DataSourceManager:
             sqlite_source = SQLiteDataSource(sqlite_path)
             self.add_source("sqlite", sqlite_source)
 
-            print(f"✓ Proje veri kaynakları oluşturuldu: {project_folder}")
+            log.info("✓ Proje veri kaynakları oluşturuldu: %s", project_folder)
             return True
 
         except Exception as e:
-            print(f"HOTA: Proje veri kaynakları oluşturma hatası: {e}")
+            log.error("HOTA: Proje veri kaynakları oluşturma hatası: %s", e)
             return False
 
 
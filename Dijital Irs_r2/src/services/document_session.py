@@ -0,0 +1,109 @@
+"""
+Doküman Oturumu - Bir Word dosyası proje boyunca tek kez açılır ve parse edilir;
+okuyucu, yazıcı ve görüntüleyici aynı paket, doküman ağacı, tablo indeksi ve
+HTML önizlemesini paylaşır
+services/document_session.py
+"""
+import io
+from typing import List, Optional
+
+from docx import Document
+
+from .docx_package import LazyPackage
+from .docx_xml import iter_body_tables
+from .table_index import TableIndex, build_table_index
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+class DocumentSession:
+    """
+    Tek bir Word dosyasının paylaşılan parse sonucu
+
+    - Paket belleğe eşlenir; medya parçaları okunmadan medyasız iskelet paket
+      bir kez oluşturulur (gerekirse .rels onarımıyla) ve bayt olarak tutulur
+    - python-docx dokümanı ilk ihtiyaçta bir kez kurulur; tabloları okuyucu ve
+      görüntüleyici sadece okur, ACTUAL yazımını yalnızca yazıcı yapar
+    - mammoth HTML çıktısı ilk dönüşümden sonra saklanır
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        # Pakete bellekte uygulanan .rels onarımları
+        self.repairs: List[str] = []
+        # Muayene tablosu indeksi (okuyucu veya parse önbelleği doldurur)
+        self.table_index: Optional[TableIndex] = None
+        self._lazy: Optional[LazyPackage] = None
+        self._package: Optional[bytes] = None
+        self._document = None
+        self._html: Optional[str] = None
+
+    def package(self) -> io.BytesIO:
+        """Medyasız, onarılmış paket üzerinde yeni bir akış döner"""
+        if self._package is None:
+            self._lazy = LazyPackage(self.file_path)
+            self._package = self._lazy.skeleton()
+            self.repairs = self._lazy.repairs
+        return io.BytesIO(self._package)
+
+    @property
+    def document(self):
+        """Paylaşılan python-docx dokümanı (ilk erişimde parse edilir)"""
+        if self._document is None:
+            self._document = Document(self.package())
+            log.info("✓ Word dosyası yüklendi: %s", self.file_path)
+        return self._document
+
+    @property
+    def is_parsed(self) -> bool:
+        return self._document is not None
+
+    def tables(self) -> List:
+        """Gövdedeki üst seviye w:tbl elemanları (document.tables sırasıyla)"""
+        return [table._tbl for table in self.document.tables]
+
+    def get_table_index(self) -> TableIndex:
+        """Tablo indeksini döner, henüz yoksa iskelet paketi akış halinde tarayarak oluşturur"""
+        if self.table_index is None:
+            self.table_index = build_table_index(iter_body_tables(self.package()))
+        return self.table_index
+
+    def html(self) -> Optional[str]:
+        """
+        mammoth ile üretilen HTML gövdesi (ilk çağrıdan sonra önbellekten)
+
+        mammoth kurulu değilse veya dönüşüm başarısızsa None döner.
+        """
+        if self._html is None:
+            try:
+                import mammoth
+            except ImportError:
+                return None
+
+            try:
+                # Medya okunmadığından görseller sadece alternatif metinle gösterilir
+                skipped_image = mammoth.images.img_element(
+                    lambda image: {"alt": image.alt_text or "[Görsel]"}
+                )
+                result = mammoth.convert_to_html(self.package(), convert_image=skipped_image)
+                self._html = result.value
+            except Exception as e:
+                log.error("HTML dönüştürme hatası: %s", e)
+                return None
+        return self._html
+
+    def save(self, save_path: str):
+        """Paylaşılan dokümanı kaydeder; medya parçaları orijinal dosyadan aynen aktarılır"""
+        self.package()
+        self._lazy.save(self.document, save_path)
+
+    def release(self):
+        """Paket eşlemesini, baytlarını, doküman ağacını ve HTML'i bırakır"""
+        if self._lazy is not None:
+            self._lazy.close()
+        self._lazy = None
+        self._package = None
+        self._document = None
+        self._html = None
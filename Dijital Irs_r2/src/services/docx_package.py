@@ -0,0 +1,220 @@
+"""
+Tembel Paket Yükleyici - Word paketini belleğe eşler (mmap), sadece ölçüm akışının
+ihtiyaç duyduğu parçaları okur; word/media altındaki çizim taramaları hiç açılmaz
+ve kaydederken sıkıştırılmış halleriyle aynen aktarılır
+services/docx_package.py
+"""
+import io
+import mmap
+import os
+import struct
+import tempfile
+import zipfile
+from typing import Dict, List, Optional
+
+from .docx_repair import REPAIR_LOG, clean_rels
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# İçeriği okunmayan, kaydederken ham olarak aktarılan parça klasörleri
+SKIPPED_PART_PREFIXES = ("word/media/", "word/embeddings/")
+
+# Yerel dosya başlığında isim ve extra uzunluklarının konumu (PKWARE APPNOTE 4.3.7)
+_LOCAL_HEADER_NAME_LENGTHS = struct.Struct("<HH")
+_LOCAL_HEADER_NAME_LENGTHS_OFFSET = 26
+
+# Veri tanımlayıcısı (data descriptor) biti; ham kopyada boyutlar başlığa yazılır
+_DATA_DESCRIPTOR_FLAG = 0x08
+
+
+class _MappedFile(io.RawIOBase):
+    """mmap üzerinde zipfile'ın beklediği salt okunur dosya arayüzü"""
+
+    def __init__(self, mapped: mmap.mmap):
+        self._mapped = mapped
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        return self._mapped.read(size)
+
+    def readinto(self, buffer) -> int:
+        data = self._mapped.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        self._mapped.seek(offset, whence)
+        return self._mapped.tell()
+
+    def tell(self) -> int:
+        return self._mapped.tell()
+
+
+def is_skipped_part(name: str) -> bool:
+    """Parça içeriği okunmadan geçilecek (medya/gömülü nesne) mi?"""
+    return name.startswith(SKIPPED_PART_PREFIXES)
+
+
+def read_raw_entry(fp, info: zipfile.ZipInfo) -> bytes:
+    """Zip girdisinin sıkıştırılmış verisini açmadan okur"""
+    fp.seek(info.header_offset + _LOCAL_HEADER_NAME_LENGTHS_OFFSET)
+    name_length, extra_length = _LOCAL_HEADER_NAME_LENGTHS.unpack(fp.read(4))
+    fp.seek(info.header_offset + zipfile.sizeFileHeader + name_length + extra_length)
+    return fp.read(info.compress_size)
+
+
+def write_raw_entry(zout: zipfile.ZipFile, info: zipfile.ZipInfo, raw: bytes):
+    """
+    Sıkıştırılmış veriyi tekrar sıkıştırmadan hedef zip'e yazar
+    (ZipFile.writestr'in başlık yazımıyla aynı adımlar)
+    """
+    entry = zipfile.ZipInfo(info.filename, info.date_time)
+    entry.compress_type = info.compress_type
+    entry.CRC = info.CRC
+    entry.compress_size = info.compress_size
+    entry.file_size = info.file_size
+    entry.external_attr = info.external_attr
+    entry.create_system = info.create_system
+    entry.flag_bits = info.flag_bits & ~_DATA_DESCRIPTOR_FLAG
+
+    entry.header_offset = zout.fp.tell()
+    zout.fp.write(entry.FileHeader())
+    zout.fp.write(raw)
+    zout.filelist.append(entry)
+    zout.NameToInfo[entry.filename] = entry
+    zout.start_dir = zout.fp.tell()
+    zout._didModify = True
+
+
+class LazyPackage:
+    """
+    Belleğe eşlenmiş Word paketi
+
+    - skeleton(): medya parçaları boş bırakılmış, .rels parçaları onarılmış
+      küçük bir paket; python-docx ve mammoth bunu açar
+    - save(): python-docx çıktısındaki boş medya parçalarını orijinal
+      dosyadaki sıkıştırılmış verilerle değiştirerek kaydeder
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        # Bellekte uygulanan .rels onarımları
+        self.repairs: List[str] = []
+        # İçeriği okunmayan parçalar: ad -> orijinal ZipInfo
+        self.skipped: Dict[str, zipfile.ZipInfo] = {}
+        self._file = None
+        self._mapped: Optional[mmap.mmap] = None
+        self._zip: Optional[zipfile.ZipFile] = None
+
+    def _open(self) -> zipfile.ZipFile:
+        if self._zip is None:
+            self._file = open(self.file_path, 'rb')
+            try:
+                self._mapped = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                self._zip = zipfile.ZipFile(_MappedFile(self._mapped))
+            except Exception:
+                self.close()
+                raise
+        return self._zip
+
+    def read(self, name: str) -> bytes:
+        """Tek bir parçanın açılmış içeriği"""
+        return self._open().read(name)
+
+    def skeleton(self) -> bytes:
+        """
+        Medyasız paket baytları
+
+        Değişmeyen parçalar sıkıştırılmış halleriyle kopyalanır, sadece kırık
+        ilişki içeren .rels parçaları açılıp yeniden yazılır. Daha önce taranmış
+        dosyada .rels parçaları kontrol edilmez, onarım kaydı kullanılır.
+        """
+        zin = self._open()
+        part_names = set(zin.namelist())
+        known = REPAIR_LOG.get(self.file_path)
+        self.repairs, cleaned = known if known is not None else ([], {})
+        self.skipped = {}
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zout:
+            for info in zin.infolist():
+                if is_skipped_part(info.filename):
+                    self.skipped[info.filename] = info
+                    zout.writestr(info.filename, b"")
+                    continue
+
+                if info.filename.endswith(".rels") and known is None:
+                    content, repairs = clean_rels(info.filename, zin.read(info), part_names)
+                    if repairs:
+                        self.repairs.extend(repairs)
+                        cleaned[info.filename] = content
+
+                if info.filename in cleaned:
+                    zout.writestr(info, cleaned[info.filename])
+                    continue
+
+                write_raw_entry(zout, info, read_raw_entry(zin.fp, info))
+
+        if known is None:
+            REPAIR_LOG.record(self.file_path, self.repairs, cleaned)
+        if self.repairs:
+            log.info("🔧 Word paketi bellekte onarıldı (%s kırık ilişki)", len(self.repairs))
+            for repair in self.repairs:
+                log.debug("    %s", repair)
+        if self.skipped:
+            skipped_size = sum(info.file_size for info in self.skipped.values())
+            log.debug("  %s medya parçası okunmadan geçildi (%s bayt)", len(self.skipped), skipped_size)
+        return buffer.getvalue()
+
+    def save(self, document, save_path: str):
+        """
+        python-docx dokümanını kaydeder; atlanan medya parçaları orijinal
+        dosyadan ham olarak aktarılır
+        """
+        output = io.BytesIO()
+        document.save(output)
+
+        folder = os.path.dirname(os.path.abspath(save_path))
+        fd, temp_path = tempfile.mkstemp(suffix=".docx", dir=folder)
+        try:
+            zin = self._open()
+            with os.fdopen(fd, 'wb') as f, zipfile.ZipFile(f, 'w') as zout, \
+                    zipfile.ZipFile(output) as saved:
+                for info in saved.infolist():
+                    original = self.skipped.get(info.filename)
+                    if original is not None and info.file_size == 0:
+                        write_raw_entry(zout, original, read_raw_entry(zin.fp, original))
+                    else:
+                        write_raw_entry(zout, info, read_raw_entry(saved.fp, info))
+
+            # Orijinalin üzerine kaydediliyorsa eşleme önce kapatılmalı (Windows kilidi)
+            overwrite = os.path.abspath(save_path) == os.path.abspath(self.file_path)
+            if overwrite:
+                self.close()
+            os.replace(temp_path, save_path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        if overwrite:
+            # Eski ZipInfo ofsetleri yeniden yazılan arşivi göstermez; sonraki
+            # kayıtlar için medya girdileri yeni dosyadan okunur
+            zin = self._open()
+            self.skipped = {name: zin.getinfo(name) for name in self.skipped}
+
+    def close(self):
+        """Zip, eşleme ve dosya tanıtıcısını kapatır (sonraki erişimde yeniden açılır)"""
+        for resource in (self._zip, self._mapped, self._file):
+            if resource is not None:
+                resource.close()
+        self._zip = None
+        self._mapped = None
+        self._file = None
@@ -0,0 +1,251 @@
+"""
+Paket Onarımı - SharePoint/bozuk Word dosyalarındaki kırık ilişkileri (.rels)
+bellekte temizler; geçici dosya kullanılmaz
+services/docx_repair.py
+"""
+import io
+import os
+import json
+import posixpath
+import zipfile
+from typing import Any, Dict, List, Optional, Tuple, Union
+from urllib.parse import unquote
+
+from lxml import etree
+
+from .docx_xml import PKG_REL_NS
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+REL_TAG = f"{{{PKG_REL_NS}}}Relationship"
+
+# SharePoint'in boş bıraktığı hedefler
+NULL_TARGETS = ("NULL", "../NULL")
+
+REPAIR_LOG_FILE_NAME = "repair_log.json"
+
+# Kayıt dosyası formatı değiştiğinde artırılır
+REPAIR_LOG_SCHEMA_VERSION = 1
+
+# Saklanacak en fazla dosya sayısı (en eski kayıt düşer)
+MAX_REPAIR_LOG_ENTRIES = 200
+
+
+def _file_key(file_path: str) -> str:
+    """Kayıt anahtarı: mutlak yol, boyut ve mtime (dosya değişirse kayıt kullanılmaz)"""
+    stat = os.stat(file_path)
+    return f"{os.path.abspath(file_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+
+
+class RepairLog:
+    """
+    Dosya → (uygulanan onarımlar, temizlenmiş .rels içerikleri) kaydı
+
+    - Temiz bulunan dosya tekrar taranmaz; onarılmış dosyada .rels parçaları
+      yeniden parse edilmez, kayıtlı temiz içerikler kullanılır
+    - Klasör verilirse kayıtlar parse_cache.json ile aynı klasördeki
+      repair_log.json dosyasında saklanır ve uygulama yeniden açıldığında da
+      geçerlidir; klasör yoksa yalnızca bellekte tutulur
+    """
+
+    def __init__(self, folder: Optional[str] = None):
+        self.log_file: Optional[str] = None
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        if folder:
+            self.use_folder(folder)
+
+    def use_folder(self, folder: str):
+        """
+        Kayıt dosyasının klasörünü ayarlar ve dosyadaki kayıtları yükler
+
+        Önceki klasörün kayıtları bırakılır; aksi halde bir sonraki record()
+        başka projelerin .rels içeriklerini bu klasörün dosyasına yazar.
+        """
+        log_file = os.path.join(folder, REPAIR_LOG_FILE_NAME)
+        if log_file == self.log_file:
+            return
+        self.log_file = log_file
+        self._entries = {}
+
+        if not os.path.exists(log_file):
+            return
+        try:
+            with open(log_file, 'r', encoding='utf-8') as f:
+                stored = json.load(f)
+            if stored.get('schema_version') == REPAIR_LOG_SCHEMA_VERSION:
+                self._entries = dict(stored.get('entries', {}))
+        except Exception as e:
+            log.warning("⚠ Onarım kaydı okunamadı: %s", e)
+
+    def get(self, file_path: str) -> Optional[Tuple[List[str], Dict[str, bytes]]]:
+        """Dosyanın kayıtlı (onarımlar, temiz .rels içerikleri) çifti; taranmadıysa None"""
+        entry = self._entries.get(_file_key(file_path))
+        if entry is None:
+            return None
+        cleaned = {name: content.encode('utf-8') for name, content in entry['cleaned'].items()}
+        return list(entry['repairs']), cleaned
+
+    def record(self, file_path: str, repairs: List[str], cleaned: Dict[str, bytes]):
+        """Tarama sonucunu kaydeder ve klasör ayarlıysa dosyaya yazar"""
+        key = _file_key(file_path)
+        # Yeniden eklenen kayıt sona taşınır, en eski kayıt baştadır
+        self._entries.pop(key, None)
+        self._entries[key] = {
+            'repairs': list(repairs),
+            'cleaned': {name: content.decode('utf-8') for name, content in cleaned.items()}
+        }
+        while len(self._entries) > MAX_REPAIR_LOG_ENTRIES:
+            del self._entries[next(iter(self._entries))]
+        self._write()
+
+    def _write(self) -> bool:
+        """Kaydı geçici dosya üzerinden atomik olarak yazar"""
+        if not self.log_file:
+            return False
+        try:
+            temp_file = f"{self.log_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump({'schema_version': REPAIR_LOG_SCHEMA_VERSION, 'entries': self._entries},
+                          f, ensure_ascii=False)
+            os.replace(temp_file, self.log_file)
+            return True
+        except Exception as e:
+            log.warning("⚠ Onarım kaydı kaydedilemedi: %s", e)
+            return False
+
+
+# Okuyucu, yazıcı ve doküman oturumunun paylaştığı kayıt
+REPAIR_LOG = RepairLog()
+
+
+def _source_folder(rels_name: str) -> str:
+    """İlişki dosyasının ait olduğu parçanın klasörü (word/_rels/document.xml.rels -> word)"""
+    return posixpath.dirname(posixpath.dirname(rels_name))
+
+
+def _broken_reason(rel, rels_name: str, part_names: set) -> str:
+    """İlişki kırıksa sebebini, sağlamsa boş string döner"""
+    if rel.get("TargetMode") == "External":
+        return ""
+
+    target = rel.get("Target", "")
+    if target in NULL_TARGETS:
+        return "NULL hedef"
+    if target.startswith("#_"):
+        return "iç yer imi hedefi"
+
+    if target.startswith("/"):
+        part_name = target.lstrip("/")
+    else:
+        part_name = posixpath.join(_source_folder(rels_name), target)
+    part_name = posixpath.normpath(unquote(part_name))
+    if part_name not in part_names:
+        return "eksik parça"
+    return ""
+
+
+def clean_rels(rels_name: str, content: bytes, part_names: set) -> Tuple[bytes, List[str]]:
+    """
+    .rels içeriğinden kırık ilişkileri çıkarır
+
+    Returns:
+        Tuple[bytes, List[str]]: (temiz içerik, uygulanan onarımlar); onarım yoksa içerik aynen döner
+    """
+    root = etree.fromstring(content)
+    repairs = []
+    for rel in list(root.iter(REL_TAG)):
+        reason = _broken_reason(rel, rels_name, part_names)
+        if reason:
+            repairs.append(f"{rels_name}: {rel.get('Id')} -> {rel.get('Target')} kaldırıldı ({reason})")
+            rel.getparent().remove(rel)
+
+    if not repairs:
+        return content, []
+    return etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True), repairs
+
+
+def scan_rels(zin: zipfile.ZipFile) -> Tuple[Dict[str, bytes], List[str]]:
+    """
+    Paketteki tüm .rels parçalarını kontrol eder
+
+    Returns:
+        Tuple: (onarılan parça adı -> temiz içerik, uygulanan onarımlar)
+    """
+    part_names = set(zin.namelist())
+    cleaned = {}
+    repairs = []
+    for name in zin.namelist():
+        if not name.endswith(".rels"):
+            continue
+        content, rel_repairs = clean_rels(name, zin.read(name), part_names)
+        if rel_repairs:
+            cleaned[name] = content
+            repairs.extend(rel_repairs)
+    return cleaned, repairs
+
+
+def repair_package(file_path: str, known: Optional[Tuple[List[str], Dict[str, bytes]]] = None
+                   ) -> Tuple[Union[str, io.BytesIO], List[str], Dict[str, bytes]]:
+    """
+    Paketi tek seferde kontrol eder, gerekiyorsa .rels parçalarını bellekte
+    temizleyip yeni zip'i BytesIO olarak döner
+
+    Args:
+        known: Kayıtlı (onarımlar, temiz .rels içerikleri); verilirse paket taranmaz
+
+    Returns:
+        Tuple: (sağlamsa file_path, onarıldıysa BytesIO; uygulanan onarımlar; temiz .rels içerikleri)
+    """
+    with zipfile.ZipFile(file_path) as zin:
+        if known is None:
+            cleaned, repairs = scan_rels(zin)
+        else:
+            repairs, cleaned = known
+
+        if not cleaned:
+            return file_path, repairs, cleaned
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zout:
+            for item in zin.infolist():
+                zout.writestr(item, cleaned.get(item.filename) or zin.read(item))
+
+    buffer.seek(0)
+    return buffer, repairs, cleaned
+
+
+def open_package(file_path: str) -> Tuple[Union[str, io.BytesIO], List[str]]:
+    """
+    Word dosyasını parse'a hazırlar: Document() ve zipfile'a verilecek kaynağı döner
+
+    Daha önce taranmış dosya (aynı yol/boyut/mtime) tekrar taranmaz: temizse
+    doğrudan açılır, onarıldıysa kayıtlı .rels içerikleriyle yeniden paketlenir.
+    Zip olmayan dosyalar olduğu gibi döner; hatayı parser raporlar.
+    """
+    try:
+        known = REPAIR_LOG.get(file_path)
+        if known is not None and not known[1]:
+            return file_path, []
+
+        source, repairs, cleaned = repair_package(file_path, known)
+        if known is None:
+            REPAIR_LOG.record(file_path, repairs, cleaned)
+        if repairs:
+            log.info("🔧 Word paketi bellekte onarıldı (%s kırık ilişki)", len(repairs))
+            for repair in repairs:
+                log.debug("    %s", repair)
+        return source, repairs
+    except (OSError, zipfile.BadZipFile, etree.XMLSyntaxError) as e:
+        log.warning("⚠ Paket kontrolü yapılamadı: %s", e)
+        return file_path, []
+
+
+def applied_repairs(file_path: str) -> List[str]:
+    """Dosyaya uygulanan onarımlar (hiç taranmadıysa boş liste)"""
+    try:
+        known = REPAIR_LOG.get(file_path)
+    except OSError:
+        return []
+    return known[0] if known else []
@@ -0,0 +1,221 @@
+"""
+Karakter Deposu - Yüklenen karakterleri doküman sırasıyla tutar; item_no,
+"dimension_item_no" tanımlayıcısı ve doküman pozisyonu üzerinden O(1) erişim,
+ölçülen / bekleyen / tolerans içi / tolerans dışı kümelerini ölçüm girildikçe
+günceller; istatistik panelleri bu sayaçları okur
+services/karakter_repository.py
+"""
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from .data_processor import TeknikResimKarakteri
+from .tolerance_engine import actual_values, evaluate_karakterler, write_actual
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+
+def karakter_identifier(karakter: TeknikResimKarakteri) -> str:
+    """Lot detaylarında kullanılan "dimension_item_no" tanımlayıcısı"""
+    return f"{karakter.dimension}_{karakter.item_no}"
+
+
+def is_out_of_tolerance(karakter: TeknikResimKarakteri) -> bool:
+    """
+    ACTUAL değerlerinden biri limit dışında mı?
+
+    '/' ile ayrılmış çoklu değerler tek tek kontrol edilir; sayısal olmayan
+    değerler ve limiti olmayan karakterler tolerans içinde sayılır
+    (kural tolerance_engine'de, WordSaveAsService ile ortak).
+    """
+    if not karakter.actual:
+        return False
+
+    if karakter.lower_limit is None and karakter.upper_limit is None:
+        return False
+
+    return not evaluate_karakterler([karakter]).karakter_ok[0]
+
+
+class KarakterRepository:
+    """
+    İndeksli karakter deposu
+
+    - Liste gibi davranır (len, iterasyon, pozisyonla erişim, extend);
+      akış halinde yüklemede gruplar eklendikçe indeksler de güncellenir
+    - Aynı item_no / tanımlayıcı birden fazla satırda varsa ilk satır döner
+    - ACTUAL değişiklikleri set_actual ile yapılır; karakter dışarıda
+      değiştirildiyse refresh ile kümeler yeniden hesaplanır
+    """
+
+    def __init__(self, karakterler: Iterable[TeknikResimKarakteri] = ()):
+        self._karakterler: List[TeknikResimKarakteri] = []
+        self._by_item_no: Dict[str, int] = {}
+        self._by_identifier: Dict[str, int] = {}
+        # Model __slots__ ile tutulduğundan ve eşitlik tanımlı olduğundan
+        # hash'lenemez; obje kimliği pozisyona eşlenir
+        self._by_object: Dict[int, int] = {}
+
+        # İkincil kümeler (pozisyon kümeleri)
+        self._measured: Set[int] = set()
+        self._unmeasured: Set[int] = set()
+        self._out_of_tolerance: Set[int] = set()
+        # Ölçülen ve tüm değerleri limit içinde olanlar
+        self._compliant: Set[int] = set()
+
+        # Yüklemeden sonra değişmeyen alanların sayaçları
+        self._tolerance_typed = 0
+        self._parsed_dimensions = 0
+
+        self.extend(karakterler)
+
+    # ===== Liste arayüzü =====
+
+    def __len__(self) -> int:
+        return len(self._karakterler)
+
+    def __iter__(self) -> Iterator[TeknikResimKarakteri]:
+        return iter(self._karakterler)
+
+    def __getitem__(self, position):
+        return self._karakterler[position]
+
+    def _index(self, karakter: TeknikResimKarakteri) -> int:
+        position = len(self._karakterler)
+        self._karakterler.append(karakter)
+        self._by_item_no.setdefault(karakter.item_no, position)
+        self._by_identifier.setdefault(karakter_identifier(karakter), position)
+        self._by_object[id(karakter)] = position
+        if karakter.tolerance_type:
+            self._tolerance_typed += 1
+        if karakter.parsed_dimension:
+            self._parsed_dimensions += 1
+        return position
+
+    def add(self, karakter: TeknikResimKarakteri) -> int:
+        """Karakteri doküman sırasının sonuna ekler, pozisyonunu döner"""
+        position = self._index(karakter)
+        self._classify(position, karakter)
+        return position
+
+    append = add
+
+    def extend(self, karakterler: Iterable[TeknikResimKarakteri]):
+        """Birden fazla karakteri sırayla ekler; tolerans durumu tek vektörel çağrıda hesaplanır"""
+        karakterler = list(karakterler)
+        positions = [self._index(karakter) for karakter in karakterler]
+        tolerance = evaluate_karakterler(karakterler)
+        for position, karakter, in_tolerance, value_count in zip(
+                positions, karakterler, tolerance.karakter_ok.tolist(), tolerance.value_counts.tolist()):
+            self._set_status(position, karakter, not in_tolerance, value_count > 0)
+
+    # ===== Erişim =====
+
+    def get_by_item_no(self, item_no: str) -> Optional[TeknikResimKarakteri]:
+        position = self._by_item_no.get(item_no)
+        return None if position is None else self._karakterler[position]
+
+    def get_by_identifier(self, identifier: str) -> Optional[TeknikResimKarakteri]:
+        """"dimension_item_no" tanımlayıcısıyla karakter"""
+        position = self._by_identifier.get(identifier)
+        return None if position is None else self._karakterler[position]
+
+    def get_by_position(self, position: int) -> Optional[TeknikResimKarakteri]:
+        if 0 <= position < len(self._karakterler):
+            return self._karakterler[position]
+        return None
+
+    def position_of(self, karakter: TeknikResimKarakteri) -> Optional[int]:
+        """Karakterin doküman pozisyonu, depoda değilse None"""
+        return self._by_object.get(id(karakter))
+
+    # ===== Güncelleme =====
+
+    def set_actual(self, karakter: TeknikResimKarakteri, actual: Optional[str]) -> bool:
+        """ACTUAL değerini yazar ve kümeleri günceller; karakter depoda yoksa False"""
+        position = self.position_of(karakter)
+        if position is None:
+            log.warning("⚠ Karakter depoda bulunamadı: %s", karakter.item_no)
+            return False
+
+        write_actual(karakter, actual)
+        self._classify(position, karakter)
+        return True
+
+    def refresh(self, karakter: TeknikResimKarakteri) -> bool:
+        """Dışarıda değiştirilen karakterin kümelerini yeniden hesaplar"""
+        position = self.position_of(karakter)
+        if position is None:
+            return False
+
+        self._classify(position, karakter)
+        return True
+
+    def _classify(self, position: int, karakter: TeknikResimKarakteri):
+        self._set_status(position, karakter, is_out_of_tolerance(karakter), bool(actual_values(karakter)))
+
+    def _set_status(self, position: int, karakter: TeknikResimKarakteri, out_of_tolerance: bool,
+                    has_values: bool):
+        """Pozisyonu eski kümelerinden çıkarıp yenilerine ekler (O(1))"""
+        if karakter.actual:
+            self._measured.add(position)
+            self._unmeasured.discard(position)
+        else:
+            self._unmeasured.add(position)
+            self._measured.discard(position)
+
+        if out_of_tolerance:
+            self._out_of_tolerance.add(position)
+        else:
+            self._out_of_tolerance.discard(position)
+
+        if karakter.actual and has_values and not out_of_tolerance:
+            self._compliant.add(position)
+        else:
+            self._compliant.discard(position)
+
+    # ===== İkincil kümeler =====
+
+    def _in_order(self, positions: Set[int]) -> List[TeknikResimKarakteri]:
+        return [self._karakterler[position] for position in sorted(positions)]
+
+    def get_measured(self) -> List[TeknikResimKarakteri]:
+        return self._in_order(self._measured)
+
+    def get_unmeasured(self) -> List[TeknikResimKarakteri]:
+        return self._in_order(self._unmeasured)
+
+    def get_tolerance_violations(self) -> List[TeknikResimKarakteri]:
+        return self._in_order(self._out_of_tolerance)
+
+    def get_measured_count(self) -> int:
+        return len(self._measured)
+
+    def get_unmeasured_count(self) -> int:
+        return len(self._unmeasured)
+
+    def get_tolerance_violation_count(self) -> int:
+        return len(self._out_of_tolerance)
+
+    def get_tolerance_compliant_count(self) -> int:
+        return len(self._compliant)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """
+        Sayaçlardan ölçüm istatistikleri (WordSaveAsService.get_statistics formatı)
+
+        Karakterler tekrar dolaşılmaz; kümeler her ölçüm değişikliğinde güncellenir.
+        """
+        total = len(self._karakterler)
+        measured = len(self._measured)
+        return {
+            'total': total,
+            'measured': measured,
+            'unmeasured': len(self._unmeasured),
+            'completion_percentage': (measured / total * 100) if total > 0 else 0,
+            'tolerance_violations': len(self._out_of_tolerance),
+            'tolerance_compliant': len(self._compliant),
+            'no_tolerance_defined': measured - len(self._out_of_tolerance) - len(self._compliant),
+            'tolerance_typed': self._tolerance_typed,
+            'parsed_dimensions': self._parsed_dimensions
+        }
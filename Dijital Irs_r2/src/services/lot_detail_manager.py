@@ -8,6 +8,12 @@ from typing import Dict, Optional, Callable, Any
 import json
 import os
 
+from .tolerance_engine import parse_actual
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
 class LotDetailDialog:
     def __init__(self, parent, lot_manager, identifier: str, 
                  item_no: str, dimension: str, actual_value: str = ""):
@@ -189,18 +195,9 @@ class LotDetailDialog:
         if not part_numbers:
             return self.actual_value
         
-        values = []
-        for part_value in part_numbers.values():
-            try:
-                if '/' in part_value:
-                    for v in part_value.split('/'):
-                        if v.strip():
-                            values.append(float(v.strip()))
-                else:
-                    if part_value.strip():
-                        values.append(float(part_value.strip()))
-            except ValueError:
-                continue
+        # Parça değerleri ACTUAL ile aynı kuralla parse edilir ('/' ve virgül dahil)
+        values = [value for part_value in part_numbers.values()
+                  for value in parse_actual(part_value).values if value is not None]
         
         if values:
             min_val = min(values)
@@ -231,9 +228,9 @@ class LotDetailManager:
             try:
                 with open(self.data_file, 'r', encoding='utf-8') as f:
                     self.lot_data = json.load(f)
-                print(f"✓ Lot data yüklendi: {len(self.lot_data)} kayıt")
+                log.info("✓ Lot data yüklendi: %s kayıt", len(self.lot_data))
             except Exception as e:
-                print(f"Lot data yükleme hatası: {e}")
+                log.error("Lot data yükleme hatası: %s", e)
                 self.lot_data = {}
     
     def save_data_file(self):
@@ -244,7 +241,7 @@ class LotDetailManager:
                     json.dump(self.lot_data, f, indent=2, ensure_ascii=False)
                 return True
             except Exception as e:
-                print(f"Lot data kaydetme hatası: {e}")
+                log.error("Lot data kaydetme hatası: %s", e)
                 return False
         return False
     
@@ -285,5 +282,5 @@ class LotDetailManager:
             # Diğer formatlar için pandas gerekli
             return False
         except Exception as e:
-            print(f"Export hatası: {e}")
+            log.error("Export hatası: %s", e)
             return False
\ No newline at end of file
@@ -0,0 +1,283 @@
+"""
+Ölçü Parser Benchmark - olcu_veri_seti korpusu üzerinde OlcuYakalayici.isle
+hız / doğruluk ölçümü ve kayıtlı baz değere göre regresyon kontrolü
+services/olcu_benchmark.py
+
+Kullanım:
+    python -m services.olcu_benchmark                     # 3000 ölçü, rapor
+    python -m services.olcu_benchmark --n 1000000         # büyük korpus
+    python -m services.olcu_benchmark --save-baseline     # baz değeri kaydet
+    python -m services.olcu_benchmark --threshold 15      # %15'ten fazla düşüşte çıkış kodu 1
+"""
+import os
+import sys
+import json
+import time
+import argparse
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any, Tuple
+
+import numpy as np
+
+from .olcu_parser import OlcuYakalayici, PARSER_VERSION
+from .olcu_veri_seti import generate_labeled_olcu_dataset
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+ESLESMEDI = "eşleşmedi"
+
+VARSAYILAN_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "olcu_benchmark_baseline.json")
+
+# Toplam hız bu orandan fazla düşerse regresyon sayılır
+VARSAYILAN_ESIK_YUZDE = 20.0
+
+# Kategori → parser'dan beklenen sonuç etiketleri; None olan kategoriler
+# (derece, diş, karmaşık) parser'ın modellemediği formatlardır, yalnızca
+# dağılımları raporlanır
+KATEGORI_BEKLENTILERI: Dict[str, Optional[Tuple[str, ...]]] = {
+    'form': ("Form",),
+    'orientation': ("Oryantasyon",),
+    'location': ("Lokasyon",),
+    'profile': ("Profil",),
+    'runout': ("Runout",),
+    'dimensional': ("toleranslı",),
+    'plus_minus': ("artı-eksi", "toleranslı"),  # "+/-" yazımı ± formatına düşer
+    'max_min': ("maksimum", "minimum"),
+    'symbol': ("sembol",),
+    'degree': None,
+    'thread': None,
+    'complex': None,
+}
+
+
+def sonuc_etiketi(sonuc: Optional[Dict[str, Any]]) -> str:
+    """isle() sonucunun rapor etiketi: GD&T için tip, diğerlerinde format"""
+    if sonuc is None:
+        return ESLESMEDI
+    if sonuc["format"] == "geometrik":
+        return sonuc["tip"]
+    return sonuc["format"]
+
+
+@dataclass
+class KategoriSonucu:
+    adet: int = 0
+    sure: float = 0.0
+    etiketler: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def throughput(self) -> float:
+        return self.adet / self.sure if self.sure else 0.0
+
+    @property
+    def eslesmeyen_orani(self) -> float:
+        return self.etiketler.get(ESLESMEDI, 0) / self.adet if self.adet else 0.0
+
+
+@dataclass
+class BenchmarkSonucu:
+    """
+    Benchmark sonucu
+
+    Süreler yalnızca isle() çağrılarını kapsar (korpus üretimi ve etiketleme
+    hariç); gecikmeler çağrı başına mikrosaniyedir.
+    """
+    olcu_sayisi: int
+    seed: int
+    sure: float
+    p50_us: float
+    p99_us: float
+    kategoriler: Dict[str, KategoriSonucu]
+    parser_version: int = PARSER_VERSION
+
+    @property
+    def throughput(self) -> float:
+        return self.olcu_sayisi / self.sure if self.sure else 0.0
+
+    @property
+    def eslesmeyen_orani(self) -> float:
+        eslesmeyen = sum(k.etiketler.get(ESLESMEDI, 0) for k in self.kategoriler.values())
+        return eslesmeyen / self.olcu_sayisi if self.olcu_sayisi else 0.0
+
+    def beklenmeyenler(self, kategori: str) -> Dict[str, int]:
+        """Kategoride beklenen etiketler dışında kalan sonuçlar"""
+        beklenen = KATEGORI_BEKLENTILERI.get(kategori)
+        if beklenen is None:
+            return {}
+        return {etiket: adet for etiket, adet in self.kategoriler[kategori].etiketler.items()
+                if etiket not in beklenen}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Baz değer dosyası için özet"""
+        return {
+            'parser_version': self.parser_version,
+            'olcu_sayisi': self.olcu_sayisi,
+            'seed': self.seed,
+            'throughput': self.throughput,
+            'p50_us': self.p50_us,
+            'p99_us': self.p99_us,
+            'eslesmeyen_orani': self.eslesmeyen_orani,
+            'kategoriler': {ad: {'adet': k.adet, 'throughput': k.throughput}
+                            for ad, k in self.kategoriler.items()},
+        }
+
+
+def calistir(n: int = 3000, seed: int = 0, yakalayici: Optional[OlcuYakalayici] = None) -> BenchmarkSonucu:
+    """
+    n ölçülük korpusu tek tek isle() ile parse eder
+
+    Varsayılan yakalayıcının önbelleği kapalıdır; korpustaki tekrarlar da
+    her seferinde parse edilir.
+    """
+    veri = generate_labeled_olcu_dataset(n, seed)
+    isle = (yakalayici or OlcuYakalayici(onbellek=None)).isle
+    saat = time.perf_counter_ns
+
+    sureler = np.empty(len(veri), dtype=np.int64)
+    etiketler: List[str] = []
+    for sira, (_, olcu) in enumerate(veri):
+        baslangic = saat()
+        sonuc = isle(olcu)
+        sureler[sira] = saat() - baslangic
+        etiketler.append(sonuc_etiketi(sonuc))
+
+    kategoriler: Dict[str, KategoriSonucu] = {}
+    for (kategori, _), sure, etiket in zip(veri, sureler.tolist(), etiketler):
+        ozet = kategoriler.get(kategori)
+        if ozet is None:
+            ozet = kategoriler[kategori] = KategoriSonucu()
+        ozet.adet += 1
+        ozet.sure += sure / 1e9
+        ozet.etiketler[etiket] = ozet.etiketler.get(etiket, 0) + 1
+
+    p50, p99 = np.percentile(sureler, [50, 99]) / 1000 if len(veri) else (0.0, 0.0)
+    return BenchmarkSonucu(
+        olcu_sayisi=len(veri),
+        seed=seed,
+        sure=float(sureler.sum()) / 1e9,
+        p50_us=float(p50),
+        p99_us=float(p99),
+        kategoriler=dict(sorted(kategoriler.items())),
+    )
+
+
+def rapor(sonuc: BenchmarkSonucu) -> str:
+    """Hız, gecikme, eşleşmeyen oranı ve kategori bazlı karışıklık raporu"""
+    satirlar = [
+        f"=== Ölçü parser benchmark: {sonuc.olcu_sayisi:,} ölçü (seed {sonuc.seed}, parser v{sonuc.parser_version}) ===",
+        f"Toplam      : {sonuc.sure:.3f}s, {sonuc.throughput:,.0f} ölçü/s",
+        f"Gecikme     : p50 {sonuc.p50_us:.1f} µs, p99 {sonuc.p99_us:.1f} µs",
+        f"Eşleşmeyen  : %{sonuc.eslesmeyen_orani * 100:.1f}",
+        "",
+        f"{'Kategori':<12} {'Adet':>9} {'ölçü/s':>11} {'Eşleşmeyen':>11} {'Beklenen':>9}",
+    ]
+    for ad, kategori in sonuc.kategoriler.items():
+        if KATEGORI_BEKLENTILERI.get(ad) is None:
+            beklenen = "-"
+        else:
+            dogru = kategori.adet - sum(sonuc.beklenmeyenler(ad).values())
+            beklenen = f"%{dogru / kategori.adet * 100:.1f}"
+        satirlar.append(f"{ad:<12} {kategori.adet:>9,} {kategori.throughput:>11,.0f} "
+                        f"{'%' + format(kategori.eslesmeyen_orani * 100, '.1f'):>11} {beklenen:>9}")
+
+    satirlar += ["", "--- Karışıklık raporu (kategori → sonuç etiketi) ---"]
+    for ad, kategori in sonuc.kategoriler.items():
+        dagilim = ", ".join(f"{etiket} {adet:,}" for etiket, adet in
+                            sorted(kategori.etiketler.items(), key=lambda item: -item[1]))
+        satirlar.append(f"{ad:<12} {dagilim}")
+        beklenmeyen = sonuc.beklenmeyenler(ad)
+        if beklenmeyen:
+            satirlar.append(f"{'':<12} ⚠ beklenmeyen: " +
+                            ", ".join(f"{etiket} {adet:,}" for etiket, adet in beklenmeyen.items()))
+    return "\n".join(satirlar)
+
+
+# ===== Regresyon kontrolü =====
+
+def baseline_kaydet(sonuc: BenchmarkSonucu, yol: str = VARSAYILAN_BASELINE) -> bool:
+    """Sonuç özetini baz değer olarak kaydeder"""
+    try:
+        with open(yol, 'w', encoding='utf-8') as f:
+            json.dump(sonuc.to_dict(), f, ensure_ascii=False, indent=2)
+        log.info("💾 Benchmark baz değeri kaydedildi: %s", yol)
+        return True
+    except Exception as e:
+        log.error("❌ Benchmark baz değeri kaydedilemedi: %s", e)
+        return False
+
+
+def baseline_yukle(yol: str = VARSAYILAN_BASELINE) -> Optional[Dict[str, Any]]:
+    """Kayıtlı baz değer, yoksa veya okunamazsa None"""
+    if not os.path.exists(yol):
+        return None
+    try:
+        with open(yol, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        log.warning("⚠ Benchmark baz değeri okunamadı: %s", e)
+        return None
+
+
+def regresyon_kontrol(sonuc: BenchmarkSonucu, baseline: Dict[str, Any],
+                      esik_yuzde: float = VARSAYILAN_ESIK_YUZDE) -> Tuple[bool, List[str]]:
+    """
+    Toplam hız baz değere göre esik_yuzde'den fazla düştüyse başarısız
+
+    Kategori hızları daha gürültülü olduğundan yalnızca raporlanır.
+    Dönüş: (geçti mi, rapor satırları)
+    """
+    def degisim(simdi: float, once: float) -> float:
+        return (simdi - once) / once * 100 if once else 0.0
+
+    satirlar = []
+    if baseline.get('parser_version') != sonuc.parser_version or baseline.get('olcu_sayisi') != sonuc.olcu_sayisi:
+        satirlar.append(f"⚠ Baz değer farklı koşulda alınmış (parser v{baseline.get('parser_version')}, "
+                        f"{baseline.get('olcu_sayisi')} ölçü)")
+
+    toplam = degisim(sonuc.throughput, baseline.get('throughput', 0.0))
+    gecti = toplam >= -esik_yuzde
+    satirlar.append(f"{'✓' if gecti else '✗'} Toplam hız: {sonuc.throughput:,.0f} ölçü/s "
+                    f"(baz {baseline.get('throughput', 0.0):,.0f}, %{toplam:+.1f}, eşik -%{esik_yuzde:g})")
+
+    for ad, kategori in sonuc.kategoriler.items():
+        once = baseline.get('kategoriler', {}).get(ad)
+        if once:
+            satirlar.append(f"  {ad:<12} %{degisim(kategori.throughput, once['throughput']):+.1f}")
+    return gecti, satirlar
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Ölçü parser hız / doğruluk benchmark'ı")
+    parser.add_argument("--n", type=int, default=3000, help="üretilecek ölçü sayısı")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=1, help="tekrar sayısı (en hızlı sonuç kullanılır)")
+    parser.add_argument("--baseline", default=VARSAYILAN_BASELINE, help="baz değer dosyası")
+    parser.add_argument("--threshold", type=float, default=VARSAYILAN_ESIK_YUZDE,
+                        help="izin verilen hız düşüşü (yüzde)")
+    parser.add_argument("--save-baseline", action="store_true", help="sonucu baz değer olarak kaydet")
+    args = parser.parse_args(argv)
+
+    # Isınma: desen derleme ve ilk çağrı maliyetleri ölçüme girmesin
+    calistir(min(args.n, 1000), args.seed)
+    sonuc = max((calistir(args.n, args.seed) for _ in range(max(args.repeat, 1))),
+                key=lambda s: s.throughput)
+    print(rapor(sonuc))
+
+    if args.save_baseline:
+        return 0 if baseline_kaydet(sonuc, args.baseline) else 1
+
+    baseline = baseline_yukle(args.baseline)
+    if baseline is None:
+        print(f"\nBaz değer yok ({args.baseline}); kaydetmek için --save-baseline")
+        return 0
+
+    gecti, satirlar = regresyon_kontrol(sonuc, baseline, args.threshold)
+    print("\n--- Regresyon kontrolü ---")
+    print("\n".join(satirlar))
+    return 0 if gecti else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
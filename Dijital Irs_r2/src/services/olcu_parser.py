@@ -1,468 +1,546 @@
+"""
+Ölçü Parser - Teknik resim ölçü metnini (±, +x/-y, MAX/MIN, GD&T çerçevesi,
+sembol) nominal/limit veya geometrik tolerans bilgisine çevirir
+
+Desenler modül yüklenirken bir kez derlenir. Formatlar durum tutmaz: eslestir()
+değişmez bir OlcuSonucu döner, tek bir OlcuYakalayici aynı anda birden fazla
+thread'e hizmet edebilir.
+services/olcu_parser.py
+"""
 import re
+import threading
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Dict, Any, List
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterable, NamedTuple, Optional, Tuple, Dict, Any, List
+
+# Parse çıktısını değiştiren her düzenlemede artırılır (önbellekler bu sürümle geçersizleşir)
+PARSER_VERSION = 3
+
+# Paylaşılan parse önbelleğinin kayıt sınırı; tüm parça kataloğundaki farklı
+# ölçü metinleri birkaç bin civarındadır
+VARSAYILAN_ONBELLEK_BOYUTU = 8192
+
+# ===== Derlenmiş desenler =====
+_ESIT_TOLERANS = re.compile(r"(\d+\.?\d*)\s*(±|\+/-)\s*(\d+\.?\d*)", re.IGNORECASE)
+_ARTI_EKSI = re.compile(r".*?(\d+\.?\d*)\s*\+\s*(\d+\.?\d*)\s*/\s*-\s*(\d+\.?\d*)", re.IGNORECASE)
+_MAX_DESENLERI = tuple(re.compile(desen, re.IGNORECASE) for desen in (
+    r"MAX\s*(\d+\.?\d*)",
+    r"R?\s*(\d+\.?\d*)\s+MAX",
+    r"R(\d+\.?\d*)\s+MAX",
+))
+_MIN_DESENLERI = tuple(re.compile(desen, re.IGNORECASE) for desen in (
+    r"MIN\s+R?\s*(\d+\.?\d*)",
+    r"R?\s*(\d+\.?\d*)\s+MIN",
+    r"R(\d+\.?\d*)\s+MIN",
+))
+
+# Tek satırda tek '[ ... ]' çerçevesi, çerçeve dışında '|' yok; hücreler ayraçtan bölünür
+_TEK_CERCEVE = re.compile(r'[^|\[\]\n]*\[([^\[\]\n]*)\][^|\[\]\n]*')
+
+# Köşeli parantezli çerçeve: [ tip | değer ] ve [ tip | değer | referanslar ]
+# (_TEK_CERCEVE'ye uymayan metinler için yedek)
+_KOSELI_IKILI = re.compile(r'\[\s*([^|]+)\s*\|\s*([^|]+)\s*\]', re.IGNORECASE)
+_KOSELI = re.compile(r'\[\s*([^|]+)\s*\|\s*([^|]+)\s*(?:\|\s*(.+))?\s*\]', re.IGNORECASE)
+
+# Referanslar: A-B birleşik, '| A |' hücresi ve serbest metindeki tek harf
+_BIRLESIK_REFERANS = re.compile(r'([A-Z])-([A-Z])', re.IGNORECASE)
+_HUCRE_REFERANSI = re.compile(r'\|\s*([A-Z])(?:\s*\([MLPUF]\))?\s*(?=\||$)', re.IGNORECASE)
+_SERBEST_REFERANS = re.compile(r'\b([A-Z])\b', re.IGNORECASE)
+_OZELLIK = re.compile(r'\(([MLPUF])\)', re.IGNORECASE)
+_UNILATERAL = re.compile(r'(\d+\.?\d*)\(U\)(\d+\.?\d*)', re.IGNORECASE)
+_SAYI = re.compile(r'(\d+\.?\d*)', re.IGNORECASE)
+
+
+@dataclass(frozen=True)
+class OlcuSonucu:
+    """
+    Bir formatın eşleşme sonucu (değişmez)
+
+    alanlar isle() sözlüğünün anahtar sırasını korur; liste değerler
+    tuple olarak tutulur ve degerler() her çağrıda yeni liste üretir.
+    """
+    alanlar: Tuple[Tuple[str, Any], ...]
+
+    @property
+    def format(self) -> str:
+        return dict(self.alanlar)["format"]
+
+    def degerler(self) -> Dict[str, Any]:
+        return {ad: list(deger) if isinstance(deger, tuple) else deger for ad, deger in self.alanlar}
+
+    @classmethod
+    def degerlerden(cls, degerler: Dict[str, Any]) -> 'OlcuSonucu':
+        """isle() çıktısından (ör. diskte saklanan sonuç) sonucu geri kurar"""
+        return cls(tuple((ad, tuple(deger) if isinstance(deger, list) else deger)
+                         for ad, deger in degerler.items()))
+
+
+_YOK = object()
+
+
+class OlcuOnbellegi:
+    """
+    isle() önünde sınırlı LRU önbellek (ölçü metni -> OlcuSonucu veya None)
+
+    - Değişmez sonuç saklanır, her isabette yeni sözlük üretilir
+    - Kapasite dolunca en uzun süredir kullanılmayan kayıt çıkarılır
+    - İsabet / ıska / çıkarma sayaçları istatistik() ile izlenir
+    - Kilit sadece sözlük işlemlerini korur; parse kilit dışında yapılır
+    """
+
+    def __init__(self, maxsize: int = VARSAYILAN_ONBELLEK_BOYUTU):
+        if maxsize <= 0:
+            raise ValueError("Önbellek kapasitesi pozitif olmalı")
+        self.maxsize = maxsize
+        self._kayitlar: 'OrderedDict[str, Optional[OlcuSonucu]]' = OrderedDict()
+        self._kilit = threading.Lock()
+        self.isabet = 0
+        self.iska = 0
+        self.cikarilan = 0
+
+    def __len__(self) -> int:
+        return len(self._kayitlar)
+
+    def getir(self, olcu: str, hesapla: Callable[[str], Optional[OlcuSonucu]]) -> Optional[OlcuSonucu]:
+        """Önbellekteki sonucu döner, yoksa hesaplayıp ekler"""
+        with self._kilit:
+            sonuc = self._kayitlar.get(olcu, _YOK)
+            if sonuc is not _YOK:
+                self._kayitlar.move_to_end(olcu)
+                self.isabet += 1
+                return sonuc
+            self.iska += 1
+
+        sonuc = hesapla(olcu)
+        self._ekle(olcu, sonuc)
+        return sonuc
+
+    def _ekle(self, olcu: str, sonuc: Optional[OlcuSonucu]):
+        with self._kilit:
+            self._kayitlar[olcu] = sonuc
+            self._kayitlar.move_to_end(olcu)
+            while len(self._kayitlar) > self.maxsize:
+                self._kayitlar.popitem(last=False)
+                self.cikarilan += 1
+
+    def isit(self, kayitlar: Iterable[Tuple[str, Optional[Dict[str, Any]]]]) -> int:
+        """
+        Önbelleği saklanmış (ölçü, isle çıktısı) çiftleriyle önceden doldurur
+
+        Kayıtlar verilen sırayla en yeni kabul edilir: son verilen en son
+        çıkarılır, zaten önbellekte olan kayıt da sona taşınır. Sayaçlar
+        değişmez; yeni eklenen kayıt sayısını döner.
+        """
+        eklenen = 0
+        for olcu, degerler in kayitlar:
+            if not isinstance(olcu, str):
+                continue
+            with self._kilit:
+                if olcu in self._kayitlar:
+                    self._kayitlar.move_to_end(olcu)
+                    continue
+            self._ekle(olcu, OlcuSonucu.degerlerden(degerler) if degerler else None)
+            eklenen += 1
+        return eklenen
+
+    def temizle(self):
+        with self._kilit:
+            self._kayitlar.clear()
+            self.isabet = self.iska = self.cikarilan = 0
+
+    def istatistik(self) -> Dict[str, Any]:
+        toplam = self.isabet + self.iska
+        return {
+            "isabet": self.isabet,
+            "iska": self.iska,
+            "cikarilan": self.cikarilan,
+            "boyut": len(self._kayitlar),
+            "kapasite": self.maxsize,
+            "isabet_orani": self.isabet / toplam if toplam else 0.0
+        }
+
+
+# Süreç genelinde paylaşılan önbellek; arayüzün doküman yükleme yolu açıkça kullanır
+PAYLASILAN_ONBELLEK = OlcuOnbellegi()
+
+
+def _boyutsal(nominal, alt_limit, ust_limit, format_adi: str) -> OlcuSonucu:
+    return OlcuSonucu((
+        ("nominal", nominal),
+        ("alt_limit", alt_limit),
+        ("ust_limit", ust_limit),
+        ("format", format_adi),
+    ))
+
 
 class OlcuFormati(ABC):
+    # Formatın eşleşebilmesi için ölçünün büyük harfli halinde geçmesi gereken
+    # ifadeler (en az biri); boşsa format her ölçü için denenir
+    tetikleyiciler: Tuple[str, ...] = ()
+
     @abstractmethod
-    def eslestir(self, olcu: str) -> bool:
-        pass
-    
-    @abstractmethod
-    def degerler(self) -> Dict[str, Any]:
+    def eslestir(self, olcu: str) -> Optional[OlcuSonucu]:
+        """Ölçü bu formattaysa sonucu, değilse None döner (durum tutmaz)"""
         pass
 
 class EsitToleransliOlcu(OlcuFormati):
-    def __init__(self):
-        self.desen = r"(\d+\.?\d*)\s*(±|\+/-)\s*(\d+\.?\d*)"
-        self.nominal = None
-        self.tolerans = None
-    
-    def eslestir(self, olcu: str) -> bool:
-        eslesen = re.search(self.desen, olcu, re.IGNORECASE)
+    desen = _ESIT_TOLERANS
+    tetikleyiciler = ("±", "+/-")
+
+    def eslestir(self, olcu: str) -> Optional[OlcuSonucu]:
+        eslesen = self.desen.search(olcu)
         if eslesen:
-            self.nominal = float(eslesen.group(1))
-            self.tolerans = float(eslesen.group(3))
-            return True
-        return False
-    
-    def degerler(self) -> Dict[str, Any]:
-        return {
-            "nominal": self.nominal,
-            "alt_limit": self.nominal - self.tolerans if self.nominal is not None else None,
-            "ust_limit": self.nominal + self.tolerans if self.nominal is not None else None,
-            "format": "toleranslı"
-        }
+            nominal = float(eslesen.group(1))
+            tolerans = float(eslesen.group(3))
+            return _boyutsal(nominal, nominal - tolerans, nominal + tolerans, "toleranslı")
+        return None
+
 
 class ArtiEksiOlcu(OlcuFormati):
-    def __init__(self):
-        self.desen = r".*?(\d+\.?\d*)\s*\+\s*(\d+\.?\d*)\s*/\s*-\s*(\d+\.?\d*)"
-        self.nominal = None
-        self.ust_tol = None
-        self.alt_tol = None
-    
-    def eslestir(self, olcu: str) -> bool:
-        eslesen = re.search(self.desen, olcu, re.IGNORECASE)
+    desen = _ARTI_EKSI
+    tetikleyiciler = ("+",)
+
+    def eslestir(self, olcu: str) -> Optional[OlcuSonucu]:
+        eslesen = self.desen.search(olcu)
         if eslesen:
-            self.nominal = float(eslesen.group(1))
-            self.ust_tol = float(eslesen.group(2))
-            self.alt_tol = float(eslesen.group(3))
-            return True
-        return False
-    
-    def degerler(self) -> Dict[str, Any]:
-        return {
-            "nominal": self.nominal,
-            "alt_limit": self.nominal - self.alt_tol if self.nominal is not None else None,
-            "ust_limit": self.nominal + self.ust_tol if self.nominal is not None else None,
-            "format": "artı-eksi"
-        }
+            nominal = float(eslesen.group(1))
+            ust_tol = float(eslesen.group(2))
+            alt_tol = float(eslesen.group(3))
+            return _boyutsal(nominal, nominal - alt_tol, nominal + ust_tol, "artı-eksi")
+        return None
+
 
 class MaxOlcu(OlcuFormati):
-    def __init__(self):
-        self.desenler = [
-            r"MAX\s*(\d+\.?\d*)",
-            r"R?\s*(\d+\.?\d*)\s+MAX",
-            r"R(\d+\.?\d*)\s+MAX",
-        ]            
-        self.deger = None
-    
-    def eslestir(self, olcu: str) -> bool:
+    desenler = _MAX_DESENLERI
+    tetikleyiciler = ("MAX",)
+
+    def eslestir(self, olcu: str) -> Optional[OlcuSonucu]:
         for desen in self.desenler:
-            eslesen = re.search(desen, olcu, re.IGNORECASE)
+            eslesen = desen.search(olcu)
             if eslesen:
-                self.deger = float(eslesen.group(1))
-                return True
-        return False
-    
-    def degerler(self) -> Dict[str, Any]:
-        return {
-            "nominal": None,
-            "alt_limit": None,
-            "ust_limit": self.deger,
-            "format": "maksimum"
-        }
+                return _boyutsal(None, None, float(eslesen.group(1)), "maksimum")
+        return None
+
 
 class MinOlcu(OlcuFormati):
-    def __init__(self):
-        self.desenler = [
-            r"MIN\s+R?\s*(\d+\.?\d*)",
-            r"R?\s*(\d+\.?\d*)\s+MIN",
-            r"R(\d+\.?\d*)\s+MIN",
-        ]
-        self.deger = None
-    
-    def eslestir(self, olcu: str) -> bool:
+    desenler = _MIN_DESENLERI
+    tetikleyiciler = ("MIN",)
+
+    def eslestir(self, olcu: str) -> Optional[OlcuSonucu]:
         for desen in self.desenler:
-            eslesen = re.search(desen, olcu, re.IGNORECASE)
+            eslesen = desen.search(olcu)
             if eslesen:
-                self.deger = float(eslesen.group(1))
-                return True
-        return False
-    
-    def degerler(self) -> Dict[str, Any]:
-        return {
-            "nominal": None,
-            "alt_limit": self.deger,
-            "ust_limit": None,
-            "format": "minimum"
-        }
+                return _boyutsal(None, float(eslesen.group(1)), None, "minimum")
+        return None
+
+
+# ===== GD&T çerçeve ayrıştırıcı =====
+
+# GD&T anahtar kelime / kısaltma tablosu: (ifade, tip, alt tip). İfade tip
+# hücresinde (çerçeve yoksa tüm metinde) büyük harfle aranır; aynı tipin
+# satırları bu sırayla denenir (ör. POSITION, TRUE POSITION'dan önce)
+GDT_TABLOSU: Tuple[Tuple[str, str, str], ...] = (
+    ('STRAIGHTNESS', 'Form', 'Straightness'),
+    ('FLATNESS', 'Form', 'Flatness'),
+    ('CIRCULARITY', 'Form', 'Circularity'),
+    ('CYLINDRICITY', 'Form', 'Cylindricity'),
+    ('PERPENDICULARITY', 'Oryantasyon', 'Perpendicularity'),
+    ('ANGULARITY', 'Oryantasyon', 'Angularity'),
+    ('PARALLELISM', 'Oryantasyon', 'Parallelism'),
+    ('ANG', 'Oryantasyon', 'Angularity'),  # Kısaltma
+    ('POSITION', 'Lokasyon', 'Position'),
+    ('TRUE POSITION', 'Lokasyon', 'True Position'),
+    ('TP', 'Lokasyon', 'True Position'),
+    ('CONCENTRICITY', 'Lokasyon', 'Concentricity'),
+    ('SYMMETRY', 'Lokasyon', 'Symmetry'),
+    ('PROFILE OF A LINE', 'Profil', 'Profile of a Line'),
+    ('PROFILE OF A SURFACE', 'Profil', 'Profile of a Surface'),
+    ('LP', 'Profil', 'Profile of a Line'),
+    ('SP', 'Profil', 'Profile of a Surface'),
+    ('CIRCULAR RUNOUT', 'Runout', 'Circular Runout'),
+    ('TOTAL RUNOUT', 'Runout', 'Total Runout'),
+    ('RUNOUT', 'Runout', 'Runout'),
+)
+
+# Serbest metinde referans sayılmayan harfler (özellik kısaltmaları)
+_OZELLIK_HARFLERINI_SIL = str.maketrans("", "", "MLPUF")
+
+
+def _gdt_anahtarlari(tip: str) -> Tuple[Tuple[str, str], ...]:
+    """Tablodan bir tipin (ifade, alt tip) satırları"""
+    return tuple((ifade, alt_tip) for ifade, satir_tipi, alt_tip in GDT_TABLOSU if satir_tipi == tip)
+
+
+class Cerceve(NamedTuple):
+    """
+    Ölçü metninin GD&T çerçeve parçaları (cerceve_ayristir çıktısı, değişmez)
+
+    koseli / koseli_ikili: [ tip | değer | ... ] ve yalnızca [ tip | değer ]
+    çerçevesinin (büyük harfli tip hücresi, değer hücresi, değerdeki ilk sayı)
+    üçlüsü; çerçeve yoksa None. Referans ve özellikler yalnızca eşleşen tip
+    isterse metinden çıkarılır.
+    """
+    olcu: str
+    koseli: Optional[Tuple[str, str, Optional[float]]]
+    koseli_ikili: Optional[Tuple[str, str, Optional[float]]]
+
+    def referanslar(self) -> Tuple[str, ...]:
+        """
+        Önce A-B birleşik referansı, yoksa tek harfli '| A |' hücreleri, o da
+        yoksa metindeki tek harfli kelimeler (özellik harfleri hariç, tekrarsız,
+        metin sırasıyla)
+        """
+        if "-" in self.olcu:
+            birlesik = _BIRLESIK_REFERANS.search(self.olcu)
+            if birlesik:
+                return birlesik.group(1).upper(), birlesik.group(2).upper()
+        hucreler = "".join(_HUCRE_REFERANSI.findall(self.olcu)).upper()
+        if hucreler:
+            return tuple(dict.fromkeys(hucreler))
+        return tuple(dict.fromkeys("".join(_SERBEST_REFERANS.findall(self.olcu)).upper().translate(_OZELLIK_HARFLERINI_SIL)))
+
+    def ozellikler(self) -> Tuple[str, ...]:
+        """(M), (L), (P), (U), (F) özellikleri metin sırasıyla"""
+        return tuple(oz.upper() for oz in _OZELLIK.findall(self.olcu))
+
+
+def _koseli_parcalari(tip_kismi: str, deger_kismi: str) -> Tuple[str, str, Optional[float]]:
+    deger_kismi = deger_kismi.strip()
+    sayi = _SAYI.search(deger_kismi)
+    return tip_kismi.strip().upper(), deger_kismi, float(sayi.group(1)) if sayi else None
+
+
+def cerceve_ayristir(olcu: str) -> Cerceve:
+    """
+    Ölçüyü bir kez GD&T çerçevesi olarak ayrıştırır; aynı ölçüyü deneyen
+    tüm GD&T tipleri bu sonucu paylaşır
+
+    Tek satırda tek '[ ... ]' çerçevesi varsa (dışında '|' yok) hücreler
+    ayraçlardan bölünür; birden fazla çerçeve veya çerçeve dışında '|' varsa
+    köşeli desenlere düşülür.
+    """
+    koseli = koseli_ikili = None
+    tek_cerceve = _TEK_CERCEVE.fullmatch(olcu)
+    if tek_cerceve:
+        hucreler = tek_cerceve.group(1).split('|')
+        # _KOSELI: ilk iki hücre boş olamaz, üçüncü hücre varsa devamı boş olamaz
+        if len(hucreler) >= 2 and hucreler[0] and hucreler[1]:
+            parca = _koseli_parcalari(hucreler[0], hucreler[1])
+            if len(hucreler) == 2:
+                koseli = koseli_ikili = parca
+            elif len(hucreler) > 3 or hucreler[2]:
+                koseli = parca
+    else:
+        eslesen = _KOSELI.search(olcu)
+        if eslesen:
+            koseli = _koseli_parcalari(eslesen.group(1), eslesen.group(2))
+        eslesen = _KOSELI_IKILI.search(olcu)
+        if eslesen:
+            koseli_ikili = _koseli_parcalari(eslesen.group(1), eslesen.group(2))
+
+    return Cerceve(olcu, koseli, koseli_ikili)
+
 
 class GeometrikTolerans(OlcuFormati):
-    def __init__(self):
-        self.tolerans_degeri = None
-        self.referanslar = []
-        self.sembol = None
-        self.tip = None
-        self.ozellikler = []
-        self.alt_tip = None
-        
-    def _ozellik_ayikla(self, metin: str) -> List[str]:
-        """(M), (L), (P), (U), (F) gibi özellikleri ayıklar"""
-        ozellikler = re.findall(r'\(([MLPUF])\)', metin, re.IGNORECASE)
-        return [oz.upper() for oz in ozellikler]
-    
-    def _referans_ayikla(self, metin: str) -> List[str]:
-        """A, B, C gibi referansları ayıklar"""
-        # Önce A-B gibi birleşik referansları kontrol et
-        birlestik = re.findall(r'([A-Z])-([A-Z])', metin, re.IGNORECASE)
-        if birlestik:
-            return [birlestik[0][0].upper(), birlestik[0][1].upper()]
-        
-        # Normal referansları yakala (özellik parantezlerini hariç tut)
-        referanslar = []
-        # | A | B | C formatını yakala
-        ref_matches = re.findall(r'\|\s*([A-Z])(?:\s*\([MLPUF]\))?\s*(?=\||$)', metin, re.IGNORECASE)
-        if ref_matches:
-            referanslar.extend([ref.upper() for ref in ref_matches])
-        else:
-            # Diğer formatları yakala
-            ref_matches = re.findall(r'\b([A-Z])(?:\s*\([MLPUF]\))?\b', metin, re.IGNORECASE)
-            referanslar.extend([ref.upper() for ref in ref_matches if ref.upper() not in ['M', 'L', 'P', 'U', 'F']])
-        
-        return list(set(referanslar))  # Tekrarları kaldır
-    
-    def _tolerans_ayikla(self, metin: str) -> Optional[float]:
-        """Tolerans değerini ayıklar (∅ ile veya olmadan)"""
-        match = re.search(r'(?:∅\s*)?(\d+\.?\d*)', metin, re.IGNORECASE)
-        return float(match.group(1)) if match else None
-    
-    def _sembol_kontrol(self, metin: str) -> Optional[str]:
-        """∅ sembolünü kontrol eder"""
-        return "∅" if "∅" in metin else None
+    """
+    Köşeli parantezli veya düz metin GD&T toleransları için ortak eşleştirme
 
-class FormToleransi(GeometrikTolerans):
-    def __init__(self):
-        super().__init__()
-        self.tip = "Form"
-        
-    def eslestir(self, olcu: str) -> bool:
-        # Form toleransları anahtar kelimeleri - büyük harfle normalize et
-        form_keywords = {
-            'STRAIGHTNESS': 'Straightness',
-            'FLATNESS': 'Flatness', 
-            'CIRCULARITY': 'Circularity',
-            'CYLINDRICITY': 'Cylindricity'
-        }
-        
-        olcu_upper = olcu.upper()
-        
+    Alt sınıflar tip, GDT_TABLOSU'ndaki anahtar kelimeleri, çerçeve biçimini
+    ve sonuca eklenecek alanları (sembol / referanslar / ozellikler) tanımlar;
+    metin cerceve_ayristir ile bir kez ayrıştırılır.
+    """
+    tip: str = None
+    anahtarlar: Tuple[Tuple[str, str], ...] = ()
+    # True ise yalnızca [ tip | değer ] çerçevesi (referans hücresi olmadan)
+    yalniz_ikili: bool = False
+    ek_alanlar: Tuple[str, ...] = ()
+
+    @property
+    def tetikleyiciler(self) -> Tuple[str, ...]:
+        # Her iki yolda da anahtar kelime büyük harfli ölçüde aranır
+        return tuple(keyword for keyword, _ in self.anahtarlar)
+
+    def eslestir(self, olcu: str) -> Optional[OlcuSonucu]:
+        return self.cerceveden_eslestir(cerceve_ayristir(olcu))
+
+    def cerceveden_eslestir(self, cerceve: Cerceve) -> Optional[OlcuSonucu]:
+        """Aynı ölçüyü deneyen GD&T tipleri tek ayrıştırmayı paylaşır"""
         # Köşeli parantez formatını kontrol et
-        koseli_match = re.search(r'\[\s*([^|]+)\s*\|\s*([^|]+)\s*\]', olcu, re.IGNORECASE)
-        if koseli_match:
-            tolerans_kismi = koseli_match.group(1).strip().upper()
-            deger_kismi = koseli_match.group(2).strip()
-            
-            for keyword, tip in form_keywords.items():
-                if keyword in tolerans_kismi:
-                    self.tolerans_degeri = self._tolerans_ayikla(deger_kismi)
-                    if self.tolerans_degeri:
-                        self.sembol = self._sembol_kontrol(deger_kismi)
-                        self.ozellikler = self._ozellik_ayikla(olcu)
-                        self.alt_tip = tip
-                        return True
-        
-        # Normal format kontrol
-        for keyword, tip in form_keywords.items():
+        koseli = cerceve.koseli_ikili if self.yalniz_ikili else cerceve.koseli
+        if koseli is not None:
+            tolerans_kismi, deger_kismi, tolerans = koseli
+            if tolerans:
+                for keyword, alt_tip in self.anahtarlar:
+                    if keyword in tolerans_kismi:
+                        return self._sonuc(cerceve, deger_kismi, tolerans, alt_tip)
+
+        # Normal format kontrol (tolerans metindeki ilk sayı)
+        olcu_upper = cerceve.olcu.upper()
+        for keyword, alt_tip in self.anahtarlar:
             if keyword in olcu_upper:
-                self.tolerans_degeri = self._tolerans_ayikla(olcu)
-                if self.tolerans_degeri:
-                    self.sembol = self._sembol_kontrol(olcu)
-                    self.ozellikler = self._ozellik_ayikla(olcu)
-                    self.alt_tip = tip
-                    return True
-        
-        return False
-    
-    def degerler(self) -> Dict[str, Any]:
-        return {
-            "tolerans": self.tolerans_degeri,
-            "tip": self.tip,
-            "alt_tip": self.alt_tip,
-            "sembol": self.sembol,
-            "ozellikler": self.ozellikler,
-            "format": "geometrik"
-        }
+                sayi = _SAYI.search(cerceve.olcu)
+                tolerans = float(sayi.group(1)) if sayi else None
+                return self._sonuc(cerceve, cerceve.olcu, tolerans, alt_tip) if tolerans else None
+
+        return None
+
+    def _sonuc(self, cerceve: Cerceve, deger_kismi: str, tolerans: float, alt_tip: str) -> OlcuSonucu:
+        """Sembol değer kısmından, referans ve özellikler tüm metinden ayıklanır"""
+        alanlar = [("tolerans", tolerans), ("tip", self.tip), ("alt_tip", alt_tip)]
+        for ad in self.ek_alanlar:
+            if ad == "sembol":
+                alanlar.append((ad, "∅" if "∅" in deger_kismi else None))
+            elif ad == "referanslar":
+                alanlar.append((ad, cerceve.referanslar()))
+            elif ad == "ozellikler":
+                alanlar.append((ad, cerceve.ozellikler()))
+        alanlar.append(("format", "geometrik"))
+        return OlcuSonucu(tuple(alanlar))
+
+class FormToleransi(GeometrikTolerans):
+    tip = "Form"
+    anahtarlar = _gdt_anahtarlari("Form")
+    yalniz_ikili = True
+    ek_alanlar = ("sembol", "ozellikler")
 
 class OryantasyonToleransi(GeometrikTolerans):
-    def __init__(self):
-        super().__init__()
-        self.tip = "Oryantasyon"
-        
-    def eslestir(self, olcu: str) -> bool:
-        # Oryantasyon toleransları - büyük harfle normalize et
-        oryantasyon_keywords = {
-            'PERPENDICULARITY': 'Perpendicularity',
-            'ANGULARITY': 'Angularity',
-            'PARALLELISM': 'Parallelism',
-            'ANG': 'Angularity'  # Kısaltma
-        }
-        
-        olcu_upper = olcu.upper()
-        
-        # Köşeli parantez formatını kontrol et
-        koseli_match = re.search(r'\[\s*([^|]+)\s*\|\s*([^|]+)\s*(?:\|\s*(.+))?\s*\]', olcu, re.IGNORECASE)
-        if koseli_match:
-            tolerans_kismi = koseli_match.group(1).strip().upper()
-            deger_kismi = koseli_match.group(2).strip()
-            referans_kismi = koseli_match.group(3) if koseli_match.group(3) else ""
-            
-            for keyword, tip in oryantasyon_keywords.items():
-                if keyword in tolerans_kismi:
-                    self.tolerans_degeri = self._tolerans_ayikla(deger_kismi)
-                    if self.tolerans_degeri:
-                        self.sembol = self._sembol_kontrol(deger_kismi)
-                        self.ozellikler = self._ozellik_ayikla(olcu)
-                        self.referanslar = self._referans_ayikla(olcu)
-                        self.alt_tip = tip
-                        return True
-        
-        # Normal format kontrol
-        for keyword, tip in oryantasyon_keywords.items():
-            if keyword in olcu_upper:
-                self.tolerans_degeri = self._tolerans_ayikla(olcu)
-                if self.tolerans_degeri:
-                    self.sembol = self._sembol_kontrol(olcu)
-                    self.ozellikler = self._ozellik_ayikla(olcu)
-                    self.referanslar = self._referans_ayikla(olcu)
-                    self.alt_tip = tip
-                    return True
-        
-        return False
-    
-    def degerler(self) -> Dict[str, Any]:
-        return {
-            "tolerans": self.tolerans_degeri,
-            "tip": self.tip,
-            "alt_tip": self.alt_tip,
-            "sembol": self.sembol,
-            "referanslar": self.referanslar,
-            "ozellikler": self.ozellikler,
-            "format": "geometrik"
-        }
+    tip = "Oryantasyon"
+    anahtarlar = _gdt_anahtarlari("Oryantasyon")
+    ek_alanlar = ("sembol", "referanslar", "ozellikler")
 
 class LokasyonToleransi(GeometrikTolerans):
-    def __init__(self):
-        super().__init__()
-        self.tip = "Lokasyon"
-        
-    def eslestir(self, olcu: str) -> bool:
-        lokasyon_keywords = {
-            'POSITION': 'Position',
-            'TRUE POSITION': 'True Position',
-            'TP': 'True Position',
-            'CONCENTRICITY': 'Concentricity',
-            'SYMMETRY': 'Symmetry'
-        }
-        
-        olcu_upper = olcu.upper()
-        
-        # Köşeli parantez formatını kontrol et
-        koseli_match = re.search(r'\[\s*([^|]+)\s*\|\s*([^|]+)\s*(?:\|\s*(.+))?\s*\]', olcu, re.IGNORECASE)
-        if koseli_match:
-            tolerans_kismi = koseli_match.group(1).strip().upper()
-            deger_kismi = koseli_match.group(2).strip()
-            
-            for keyword, tip in lokasyon_keywords.items():
-                if keyword in tolerans_kismi:
-                    self.tolerans_degeri = self._tolerans_ayikla(deger_kismi)
-                    if self.tolerans_degeri:
-                        self.sembol = self._sembol_kontrol(deger_kismi)
-                        self.ozellikler = self._ozellik_ayikla(olcu)
-                        self.referanslar = self._referans_ayikla(olcu)
-                        self.alt_tip = tip
-                        return True
-        
-        # Normal format kontrol
-        for keyword, tip in lokasyon_keywords.items():
-            if keyword in olcu_upper:
-                self.tolerans_degeri = self._tolerans_ayikla(olcu)
-                if self.tolerans_degeri:
-                    self.sembol = self._sembol_kontrol(olcu)
-                    self.ozellikler = self._ozellik_ayikla(olcu)
-                    self.referanslar = self._referans_ayikla(olcu)
-                    self.alt_tip = tip
-                    return True
-        
-        return False
-    
-    def degerler(self) -> Dict[str, Any]:
-        return {
-            "tolerans": self.tolerans_degeri,
-            "tip": self.tip,
-            "alt_tip": self.alt_tip,
-            "sembol": self.sembol,
-            "referanslar": self.referanslar,
-            "ozellikler": self.ozellikler,
-            "format": "geometrik"
-        }
+    tip = "Lokasyon"
+    anahtarlar = _gdt_anahtarlari("Lokasyon")
+    ek_alanlar = ("sembol", "referanslar", "ozellikler")
 
 class ProfilToleransi(GeometrikTolerans):
-    def __init__(self):
-        super().__init__()
-        self.tip = "Profil"
-        self.unilateral_deger = None
-        
-    def eslestir(self, olcu: str) -> bool:
-        profil_keywords = {
-            'PROFILE OF A LINE': 'Profile of a Line',
-            'PROFILE OF A SURFACE': 'Profile of a Surface',
-            'LP': 'Profile of a Line',
-            'SP': 'Profile of a Surface'
-        }
-        
-        olcu_upper = olcu.upper()
-        
-        # Unilateral toleransları kontrol et
-        unilateral_match = re.search(r'(\d+\.?\d*)\(U\)(\d+\.?\d*)', olcu, re.IGNORECASE)
+    tip = "Profil"
+    anahtarlar = _gdt_anahtarlari("Profil")
+    ek_alanlar = ("referanslar", "ozellikler")
+
+    @property
+    def tetikleyiciler(self) -> Tuple[str, ...]:
+        return super().tetikleyiciler + ("(U)",)
+
+    def cerceveden_eslestir(self, cerceve: Cerceve) -> Optional[OlcuSonucu]:
+        # Unilateral toleransları kontrol et ((U) özelliği yoksa eşleşemez)
+        olcu = cerceve.olcu
+        unilateral_match = _UNILATERAL.search(olcu) if "(U)" in olcu or "(u)" in olcu else None
         if unilateral_match:
-            self.tolerans_degeri = float(unilateral_match.group(1))
-            self.unilateral_deger = float(unilateral_match.group(2))
-            self.ozellikler = ['U']
-            self.referanslar = self._referans_ayikla(olcu)
-            self.alt_tip = 'Profile of a Line'
-            return True
-        
-        # Köşeli parantez formatını kontrol et
-        koseli_match = re.search(r'\[\s*([^|]+)\s*\|\s*([^|]+)\s*(?:\|\s*(.+))?\s*\]', olcu, re.IGNORECASE)
-        if koseli_match:
-            tolerans_kismi = koseli_match.group(1).strip().upper()
-            deger_kismi = koseli_match.group(2).strip()
-            
-            for keyword, tip in profil_keywords.items():
-                if keyword in tolerans_kismi:
-                    self.tolerans_degeri = self._tolerans_ayikla(deger_kismi)
-                    if self.tolerans_degeri:
-                        self.ozellikler = self._ozellik_ayikla(olcu)
-                        self.referanslar = self._referans_ayikla(olcu)
-                        self.alt_tip = tip
-                        return True
-        
-        # Normal format kontrol
-        for keyword, tip in profil_keywords.items():
-            if keyword in olcu_upper:
-                self.tolerans_degeri = self._tolerans_ayikla(olcu)
-                if self.tolerans_degeri:
-                    self.ozellikler = self._ozellik_ayikla(olcu)
-                    self.referanslar = self._referans_ayikla(olcu)
-                    self.alt_tip = tip
-                    return True
-        
-        return False
-    
-    def degerler(self) -> Dict[str, Any]:
-        result = {
-            "tolerans": self.tolerans_degeri,
-            "tip": self.tip,
-            "alt_tip": self.alt_tip,
-            "referanslar": self.referanslar,
-            "ozellikler": self.ozellikler,
-            "format": "geometrik"
-        }
-        if self.unilateral_deger:
-            result["unilateral_deger"] = self.unilateral_deger
-        return result
+            alanlar = (
+                ("tolerans", float(unilateral_match.group(1))),
+                ("tip", self.tip),
+                ("alt_tip", 'Profile of a Line'),
+                ("referanslar", cerceve.referanslar()),
+                ("ozellikler", ('U',)),
+                ("format", "geometrik"),
+            )
+            unilateral_deger = float(unilateral_match.group(2))
+            if unilateral_deger:
+                alanlar += (("unilateral_deger", unilateral_deger),)
+            return OlcuSonucu(alanlar)
+
+        return super().cerceveden_eslestir(cerceve)
 
 class RunoutToleransi(GeometrikTolerans):
-    def __init__(self):
-        super().__init__()
-        self.tip = "Runout"
-        
-    def eslestir(self, olcu: str) -> bool:
-        runout_keywords = {
-            'CIRCULAR RUNOUT': 'Circular Runout',
-            'TOTAL RUNOUT': 'Total Runout',
-            'RUNOUT': 'Runout'
-        }
-        
-        olcu_upper = olcu.upper()
-        
-        # Köşeli parantez formatını kontrol et
-        koseli_match = re.search(r'\[\s*([^|]+)\s*\|\s*([^|]+)\s*(?:\|\s*(.+))?\s*\]', olcu, re.IGNORECASE)
-        if koseli_match:
-            tolerans_kismi = koseli_match.group(1).strip().upper()
-            deger_kismi = koseli_match.group(2).strip()
-            
-            for keyword, tip in runout_keywords.items():
-                if keyword in tolerans_kismi:
-                    self.tolerans_degeri = self._tolerans_ayikla(deger_kismi)
-                    if self.tolerans_degeri:
-                        self.referanslar = self._referans_ayikla(olcu)
-                        self.alt_tip = tip
-                        return True
-        
-        # Normal format kontrol
-        for keyword, tip in runout_keywords.items():
-            if keyword in olcu_upper:
-                self.tolerans_degeri = self._tolerans_ayikla(olcu)
-                if self.tolerans_degeri:
-                    self.referanslar = self._referans_ayikla(olcu)
-                    self.alt_tip = tip
-                    return True
-        
-        return False
-    
-    def degerler(self) -> Dict[str, Any]:
-        return {
-            "tolerans": self.tolerans_degeri,
-            "tip": self.tip,
-            "alt_tip": self.alt_tip,
-            "referanslar": self.referanslar,
-            "format": "geometrik"
-        }
+    tip = "Runout"
+    anahtarlar = _gdt_anahtarlari("Runout")
+    ek_alanlar = ("referanslar",)
 
 class SembolTolerans(OlcuFormati):
     """Sembol tabanlı toleranslar için"""
-    def __init__(self):
-        self.sembol_map = {
-            '⏜': 'Straightness',
-            '⟂': 'Perpendicularity', 
-            '⌖': 'Position',
-            '∠': 'Angularity',
-            '⏩': 'Runout'
-        }
-        self.tolerans_degeri = None
-        self.tip = None
-        
-    def eslestir(self, olcu: str) -> bool:
+    sembol_map = {
+        '⏜': 'Straightness',
+        '⟂': 'Perpendicularity',
+        '⌖': 'Position',
+        '∠': 'Angularity',
+        '⏩': 'Runout'
+    }
+    tetikleyiciler = tuple(sembol_map)
+
+    def eslestir(self, olcu: str) -> Optional[OlcuSonucu]:
         for sembol, tip in self.sembol_map.items():
             if sembol in olcu:
-                match = re.search(r'(\d+\.?\d*)', olcu, re.IGNORECASE)
+                match = _SAYI.search(olcu)
                 if match:
-                    self.tolerans_degeri = float(match.group(1))
-                    self.tip = tip
-                    return True
-        return False
-    
-    def degerler(self) -> Dict[str, Any]:
-        return {
-            "tolerans": self.tolerans_degeri,
-            "tip": self.tip,
-            "format": "sembol"
-        }
+                    return OlcuSonucu((
+                        ("tolerans", float(match.group(1))),
+                        ("tip", tip),
+                        ("format", "sembol"),
+                    ))
+        return None
+
+def _trie_deseni(ifadeler) -> str:
+    """
+    İfadeleri ortak önekleri birleştirilmiş bir regex'e çevirir (ör. ANG(?:ULARITY)?)
+
+    Her pozisyonda tek karakter dallanması yapılır; deneme maliyeti ifade
+    sayısıyla büyümez. Açgözlü opsiyonel dallar en uzun ifadeyi tercih eder.
+    """
+    trie = {}
+    for ifade in ifadeler:
+        dugum = trie
+        for karakter in ifade:
+            dugum = dugum.setdefault(karakter, {})
+        dugum[""] = {}
+
+    def desen(dugum) -> str:
+        dallar = [re.escape(karakter) + desen(alt) for karakter, alt in sorted(dugum.items()) if karakter]
+        if not dallar:
+            return ""
+        govde = dallar[0] if len(dallar) == 1 else "(?:" + "|".join(dallar) + ")"
+        return f"(?:{govde})?" if "" in dugum else govde
+
+    return desen(trie)
+
+
+def _siniflandirici_kur(format_tipleri) -> Tuple[re.Pattern, Dict[str, int], int]:
+    """
+    Tüm tetikleyicilerden tek bir alternasyon deseni kurar
+
+    Desen büyük harfli ölçü üzerinde bir kez taranır; aynı pozisyonda en uzun
+    ifade eşleşir ve kendisinin bir önekini tetikleyici olarak kullanan tüm
+    formatların bit maskesine eşlenir ('+/-' hem ± hem artı-eksi formatını
+    aday yapar). Örtüşen ifadeler
+    (ör. 'TPERPENDICULARITY') kaçmasın diye desen ileri bakış ile her
+    pozisyonda denenir; önündeki ilk karakter kümesi, ifade başlatamayan
+    pozisyonları ileri bakışa girmeden eler.
+    """
+    ifadeler = {}
+    her_zaman = 0
+    for sira, format_tipi in enumerate(format_tipleri):
+        if not format_tipi.tetikleyiciler:
+            her_zaman |= 1 << sira
+        for ifade in format_tipi.tetikleyiciler:
+            ifadeler[ifade.upper()] = 0
+
+    for ifade in ifadeler:
+        for sira, format_tipi in enumerate(format_tipleri):
+            if any(ifade.startswith(t.upper()) for t in format_tipi.tetikleyiciler):
+                ifadeler[ifade] |= 1 << sira
+
+    desen = f"(?=({_trie_deseni(ifadeler)}))"
+    if ifadeler:
+        ilk_karakterler = "".join(re.escape(k) for k in sorted({ifade[0] for ifade in ifadeler}))
+        desen = f"(?=[{ilk_karakterler}]){desen}"
+    return re.compile(desen, re.IGNORECASE), ifadeler, her_zaman
+
 
 class OlcuYakalayici:
-    def __init__(self):
-        self.format_tipleri = [
+    """
+    Ölçü metnini formatlara öncelik sırasıyla sorar, ilk eşleşenin sonucunu döner
+
+    Ölçü önce tek geçişli sınıflandırıcıdan geçer; sadece tetikleyicisi ölçüde
+    bulunan formatlar denenir (sonuç tüm formatları sırayla denemekle aynıdır).
+    Formatlar durum tutmadığından tek örnek thread'ler arasında paylaşılabilir.
+    onbellek verilirse isle() sonuçları bu LRU önbellekten gelir; varsayılan
+    olarak önbellek yoktur, süreç genelindeki PAYLASILAN_ONBELLEK açıkça verilir.
+    """
+
+    def __init__(self, onbellek: Optional[OlcuOnbellegi] = None):
+        self.onbellek = onbellek
+        self.format_tipleri = (
             FormToleransi(),
             OryantasyonToleransi(),
             LokasyonToleransi(),
@@ -473,14 +551,67 @@ class OlcuYakalayici:
             ArtiEksiOlcu(),
             MaxOlcu(),
             MinOlcu(),
-        ]
-    
-    def isle(self, olcu: str) -> Optional[Dict[str, Any]]:
-        for format_tipi in self.format_tipleri:
-            if format_tipi.eslestir(olcu):
-                return format_tipi.degerler()
+        )
+        self._siniflandirici, self._ifade_maskeleri, self._her_zaman = _siniflandirici_kur(self.format_tipleri)
+
+    def _ifade_maskesi(self, ifade: str) -> int:
+        maske = self._ifade_maskeleri.get(ifade)
+        if maske is None:
+            # IGNORECASE ile eşleşen farklı yazım (ör. 'İ'); nadir yol
+            maske = 0
+            for aday, aday_maskesi in self._ifade_maskeleri.items():
+                if re.fullmatch(re.escape(aday), ifade, re.IGNORECASE):
+                    maske |= aday_maskesi
+        return maske
+
+    def adaylar(self, olcu: str) -> List[OlcuFormati]:
+        """Ölçü için denenecek formatlar (öncelik sırasıyla)"""
+        maske = self._her_zaman
+        for eslesen in self._siniflandirici.finditer(olcu.upper()):
+            maske |= self._ifade_maskesi(eslesen.group(1))
+
+        adaylar = []
+        while maske:
+            bit = maske & -maske
+            adaylar.append(self.format_tipleri[bit.bit_length() - 1])
+            maske ^= bit
+        return adaylar
+
+    def eslestir(self, olcu: str) -> Optional[OlcuSonucu]:
+        """İlk eşleşen formatın değişmez sonucu, eşleşme yoksa None"""
+        cerceve = None
+        for format_tipi in self.adaylar(olcu):
+            if isinstance(format_tipi, GeometrikTolerans):
+                # GD&T adayları çerçeveyi bir kez ayrıştırır
+                if cerceve is None:
+                    cerceve = cerceve_ayristir(olcu)
+                sonuc = format_tipi.cerceveden_eslestir(cerceve)
+            else:
+                sonuc = format_tipi.eslestir(olcu)
+            if sonuc is not None:
+                return sonuc
         return None
 
+    def isle(self, olcu: str) -> Optional[Dict[str, Any]]:
+        if self.onbellek is not None:
+            sonuc = self.onbellek.getir(olcu, self.eslestir)
+        else:
+            sonuc = self.eslestir(olcu)
+        return sonuc.degerler() if sonuc is not None else None
+
+    def isle_many(self, olculer):
+        """
+        Ölçü dizisini işler; her metin için isle() ile aynı sonucu döner
+
+        Metin olmayan elemanlar (None, NaN) None olur; Series verilirse index'i
+        korunur. pandas yalnızca burada yüklenir.
+        """
+        import pandas as pd
+
+        index = olculer.index if isinstance(olculer, pd.Series) else None
+        return pd.Series([self.isle(olcu) if isinstance(olcu, str) else None for olcu in olculer],
+                         index=index, dtype=object)
+
 # Test fonksiyonu
 if __name__ == "__main__":
     # Test verileri - büyük harfli versiyonlar da eklendi
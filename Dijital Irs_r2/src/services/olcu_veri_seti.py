@@ -1,9 +1,31 @@
+"""
+Ölçü Veri Seti - Parser testleri ve benchmark için gerçekçi ölçü metinleri üretir
+services/olcu_veri_seti.py
+"""
+import math
 import random
+import string
+from typing import List, Optional, Tuple
+
 import numpy as np
 
-def generate_olcu_dataset(n=3000):
-    """3000 örneklik gerçekçi ölçü verisi üretir"""
-    
+# Şablonların 3000 örneklik dağılımı; farklı n için oranlar korunur
+REFERANS_ORNEK_SAYISI = 3000
+
+
+def _alan_sayisi(template: str) -> int:
+    """Şablondaki yer tutucu sayısı ('{}' ve '{:.2f}' gibi biçimli alanlar)"""
+    return sum(1 for _, alan, _, _ in string.Formatter().parse(template) if alan is not None)
+
+
+def generate_olcu_dataset(n=3000, seed: Optional[int] = None):
+    """3000 örneklik gerçekçi ölçü verisi üretir (seed verilirse tekrarlanabilir)"""
+    return [sample for _, sample in generate_labeled_olcu_dataset(n, seed)]
+
+
+def generate_labeled_olcu_dataset(n=3000, seed: Optional[int] = None) -> List[Tuple[str, str]]:
+    """(kategori, ölçü) çiftleri; kategori şablon grubunun adıdır (ör. 'form', 'thread')"""
+    rnd = random.Random(seed)
     dataset = []
     
     # 1. Geometrik Toleranslar (Form)
@@ -170,139 +192,81 @@ def generate_olcu_dataset(n=3000):
         "≈{:.1f} ± {:.2f}"
     ]
     
-    # Değer aralıkları
-    small_values = np.arange(0.01, 0.5, 0.01)
-    medium_values = np.arange(0.5, 10, 0.1)
-    large_values = np.arange(10, 500, 1)
-    angles = np.arange(0, 360, 5)
+    # Değer aralıkları (liste: 1M örnekte np.float64 biçimlendirmesi yavaş)
+    small_values = np.arange(0.01, 0.5, 0.01).tolist()
+    medium_values = np.arange(0.5, 10, 0.1).tolist()
+    large_values = np.arange(10, 500, 1).tolist()
+    angles = np.arange(0, 360, 5).tolist()
     thread_sizes = [3, 4, 5, 6, 8, 10, 12, 16, 20, 24, 30, 36, 42, 48]
     thread_pitches = [0.5, 0.7, 0.75, 1.0, 1.25, 1.5, 1.75, 2.0, 2.5, 3.0]
     references = ['A', 'B', 'C', 'D', 'E', 'F', 'G', 'H']
     
     # Template'leri ve ağırlıklarını birleştir
     all_templates = [
-        (form_templates, 400),          # 400 örnek
-        (orientation_templates, 350),    # 350 örnek  
-        (location_templates, 300),       # 300 örnek
-        (profile_templates, 200),        # 200 örnek
-        (runout_templates, 150),         # 150 örnek
-        (dimensional_templates, 400),    # 400 örnek
-        (plus_minus_templates, 350),     # 350 örnek
-        (max_min_templates, 200),        # 200 örnek
-        (degree_templates, 200),         # 200 örnek (YENİ)
-        (thread_templates, 250),         # 250 örnek (YENİ)
-        (symbol_templates, 100),         # 100 örnek (YENİ)
-        (complex_templates, 100)         # 100 örnek (YENİ)
+        ('form', form_templates, 400),                  # 400 örnek
+        ('orientation', orientation_templates, 350),    # 350 örnek
+        ('location', location_templates, 300),          # 300 örnek
+        ('profile', profile_templates, 200),            # 200 örnek
+        ('runout', runout_templates, 150),              # 150 örnek
+        ('dimensional', dimensional_templates, 400),    # 400 örnek
+        ('plus_minus', plus_minus_templates, 350),      # 350 örnek
+        ('max_min', max_min_templates, 200),            # 200 örnek
+        ('degree', degree_templates, 200),              # 200 örnek (YENİ)
+        ('thread', thread_templates, 250),              # 250 örnek (YENİ)
+        ('symbol', symbol_templates, 100),              # 100 örnek (YENİ)
+        ('complex', complex_templates, 100)             # 100 örnek (YENİ)
     ]
-    
-    for templates, count in all_templates:
-        for _ in range(count):
-            template = random.choice(templates)
-            
-            # Template'e göre değer üretimi
-            if 'degree' in str(templates) or '°' in template:
+    gdt_categories = ('form', 'orientation', 'location', 'profile', 'runout')
+
+    for category, templates, count in all_templates:
+        for _ in range(math.ceil(count * n / REFERANS_ORNEK_SAYISI)):
+            template = rnd.choice(templates)
+
+            # Template'e göre değerler (yer tutucu sırasıyla); şablon kaç alan
+            # istiyorsa o kadarı kullanılır
+            if category == 'degree' or '°' in template:
                 # Derece değerleri
-                angle = random.choice(angles)
-                tol = random.choice(small_values)
-                try:
-                    if template.count('{}') == 2:
-                        sample = template.format(angle, tol)
-                    elif template.count('{}') == 4:
-                        sample = template.format(angle, tol, tol)
-                    else:
-                        sample = template.format(angle)
-                except:
-                    sample = template.format(angle, tol) if '{}' in template else template
-                    
-            elif 'thread' in str(templates) or 'M' in template or 'G' in template:
+                tol = rnd.choice(small_values)
+                values = [rnd.choice(angles), tol, tol, tol]
+
+            elif category == 'thread':
                 # Diş değerleri
-                size = random.choice(thread_sizes)
-                pitch = random.choice(thread_pitches)
-                tol = random.choice(small_values)
-                try:
-                    if template.count('{}') == 3:
-                        sample = template.format(size, pitch, tol)
-                    elif template.count('{}') == 4:
-                        sample = template.format(size, pitch, tol, tol)
-                    else:
-                        sample = template.format(size, pitch)
-                except:
-                    sample = template.format(size, pitch, tol) if '{}' in template else template
-                    
-            elif any(word in template for word in ['Position', 'POSITION', 'Perpendicularity', 'PERPENDICULARITY', 'Parallelism', 'Angularity']):
-                # Referans gerektiren toleranslar
-                tol = random.choice(small_values)
-                ref1 = random.choice(references)
-                ref2 = random.choice([r for r in references if r != ref1])
-                ref3 = random.choice([r for r in references if r not in [ref1, ref2]])
-                
-                try:
-                    param_count = template.count('{}')
-                    if param_count == 2:
-                        sample = template.format(tol, ref1)
-                    elif param_count == 3:
-                        sample = template.format(tol, ref1, ref2)
-                    elif param_count == 4:
-                        sample = template.format(tol, ref1, ref2, ref3)
-                    else:
-                        sample = template.format(tol)
-                except:
-                    sample = template.format(tol, ref1)
-                    
-            elif 'Profile' in template and '(U)' in template:
+                tol = rnd.choice(small_values)
+                values = [rnd.choice(thread_sizes), rnd.choice(thread_pitches), tol, tol]
+
+            elif category == 'profile' and '(U)' in template:
                 # Unilateral profil toleransları
-                main_tol = random.choice(medium_values)
-                u_tol = random.choice(small_values)
-                ref = random.choice(references)
-                try:
-                    sample = template.format(main_tol, u_tol, ref)
-                except:
-                    sample = template.format(main_tol, u_tol)
-                    
+                values = [rnd.choice(medium_values), rnd.choice(small_values), rnd.choice(references)]
+
+            elif category in gdt_categories:
+                # Referans gerektiren toleranslar
+                ref1, ref2, ref3 = rnd.sample(references, 3)
+                values = [rnd.choice(small_values), ref1, ref2, ref3]
+
             else:
                 # Diğer tüm durumlar
-                if random.random() < 0.3:
-                    value1 = random.choice(small_values)
-                elif random.random() < 0.6:
-                    value1 = random.choice(medium_values)
+                if rnd.random() < 0.3:
+                    value1 = rnd.choice(small_values)
+                elif rnd.random() < 0.6:
+                    value1 = rnd.choice(medium_values)
                 else:
-                    value1 = random.choice(large_values)
-                
-                value2 = random.choice(small_values)
-                value3 = random.choice(small_values)
-                ref = random.choice(references)
-                
-                try:
-                    param_count = template.count('{}')
-                    if param_count == 0:
-                        sample = template
-                    elif param_count == 1:
-                        sample = template.format(value1)
-                    elif param_count == 2:
-                        if any(x in template for x in ['|', 'Runout', 'RUNOUT']):
-                            sample = template.format(value1, ref)
-                        else:
-                            sample = template.format(value1, value2)
-                    elif param_count == 3:
-                        sample = template.format(value1, value2, value3)
-                    else:
-                        sample = template.format(value1, value2, value3, ref)
-                except:
-                    sample = template.format(value1) if '{}' in template else template
-            
-            dataset.append(sample)
-    
+                    value1 = rnd.choice(large_values)
+                values = [value1] + [rnd.choice(small_values) for _ in range(3)]
+
+            sample = template.format(*values[:_alan_sayisi(template)])
+            dataset.append((category, sample))
+
     # Listeyi karıştır
-    random.shuffle(dataset)
-    
-    # Tam 3000 örnek olduğundan emin ol
+    rnd.shuffle(dataset)
+
+    # Tam n örnek olduğundan emin ol
     if len(dataset) > n:
         dataset = dataset[:n]
     elif len(dataset) < n:
         # Eksik varsa rastgele örnekleri tekrarla
         while len(dataset) < n:
-            dataset.append(random.choice(dataset))
-    
+            dataset.append(rnd.choice(dataset))
+
     return dataset
 
 # 3000 örneklik dataset oluştur
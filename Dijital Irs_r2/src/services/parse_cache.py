@@ -0,0 +1,193 @@
+"""
+Doküman Parse Önbelleği - Word dosyasının SHA-256 özetine göre çıkarılan
+satırları ve parse edilmiş ölçüleri proje klasöründe saklar
+services/parse_cache.py
+"""
+import os
+import json
+import hashlib
+import datetime
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+
+from .data_processor import TeknikResimKarakteri, karakter_from_dict, karakter_to_dict
+from .olcu_parser import PARSER_VERSION
+from .table_index import TableIndex
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+CACHE_FILE_NAME = "parse_cache.json"
+
+# Önbellek dosya formatı değiştiğinde artırılır
+SCHEMA_VERSION = 1
+
+# Aynı projede tutulacak en fazla doküman sayısı
+MAX_ENTRIES = 5
+
+
+def file_sha256(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Dosya içeriğinin SHA-256 özetini döner"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class DocumentParseCache:
+    """
+    Word → liste → DataFrame → TeknikResimKarakteri → OlcuYakalayici zincirinin
+    sonucunu saklar
+
+    - Anahtar: docx baytlarının SHA-256 özeti (dosya değişirse kayıt kullanılmaz)
+    - Şema veya parser sürümü değişirse dosyadaki tüm kayıtlar geçersiz sayılır
+    - Dosya project_info.json ile aynı klasörde tutulur
+    """
+
+    def __init__(self, cache_folder: str):
+        self.cache_file = os.path.join(cache_folder, CACHE_FILE_NAME)
+        self._data: Optional[Dict[str, Any]] = None
+        # (yol, boyut, mtime) -> özet; aynı oturumda dosyanın tekrar hash'lenmesini önler
+        self._digests: Dict[Tuple[str, int, float], str] = {}
+
+    def _empty(self) -> Dict[str, Any]:
+        return {
+            'schema_version': SCHEMA_VERSION,
+            'parser_version': PARSER_VERSION,
+            'entries': {}
+        }
+
+    def _read(self) -> Dict[str, Any]:
+        """Önbellek dosyasını okur, sürümü uymayan dosyayı boş kabul eder"""
+        if self._data is not None:
+            return self._data
+
+        data = self._empty()
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    stored = json.load(f)
+
+                if (stored.get('schema_version') == SCHEMA_VERSION and
+                        stored.get('parser_version') == PARSER_VERSION):
+                    data = stored
+                else:
+                    log.warning("⚠ Parse önbelleği eski sürüm, yeniden oluşturulacak")
+            except Exception as e:
+                log.warning("⚠ Parse önbelleği okunamadı: %s", e)
+
+        self._data = data
+        return data
+
+    def _write(self) -> bool:
+        """Önbelleği geçici dosya üzerinden atomik olarak yazar"""
+        try:
+            temp_file = f"{self.cache_file}.tmp"
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(self._data, f, ensure_ascii=False)
+            os.replace(temp_file, self.cache_file)
+            return True
+        except Exception as e:
+            log.warning("⚠ Parse önbelleği kaydedilemedi: %s", e)
+            return False
+
+    def digest(self, file_path: str) -> str:
+        """Dosyanın özetini döner (aynı oturumda değişmemişse tekrar hesaplamaz)"""
+        stat = os.stat(file_path)
+        key = (os.path.abspath(file_path), stat.st_size, stat.st_mtime)
+        if key not in self._digests:
+            self._digests[key] = file_sha256(file_path)
+        return self._digests[key]
+
+    def get(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """Dosyaya ait önbellek kaydını döner, yoksa None"""
+        try:
+            return self._read()['entries'].get(self.digest(file_path))
+        except Exception as e:
+            log.warning("⚠ Parse önbelleği sorgulanamadı: %s", e)
+            return None
+
+    def load_karakterler(self, file_path: str) -> Optional[List[TeknikResimKarakteri]]:
+        """Önbellekteki karakterleri model objelerine çevirir, kayıt yoksa None"""
+        entry = self.get(file_path)
+        if not entry:
+            return None
+
+        try:
+            karakterler = [karakter_from_dict(data) for data in entry['karakterler']]
+            log.info("⚡ Parse önbelleğinden yüklendi: %s karakter", len(karakterler))
+            return karakterler
+        except Exception as e:
+            log.warning("⚠ Parse önbelleği kaydı bozuk, yok sayılıyor: %s", e)
+            return None
+
+    def load_table_index(self, file_path: str) -> Optional[TableIndex]:
+        """Dokümanın tablo indeksini döner, kayıt veya indeks yoksa None"""
+        entry = self.get(file_path)
+        if not entry or not entry.get('table_index'):
+            return None
+
+        try:
+            return TableIndex.from_dict(entry['table_index'])
+        except Exception as e:
+            log.warning("⚠ Tablo indeksi okunamadı, yok sayılıyor: %s", e)
+            return None
+
+    def store(self, file_path: str, rows: List, karakterler: List[TeknikResimKarakteri],
+              table_index: Optional[TableIndex] = None) -> bool:
+        """
+        Çıkarılan satırları ve parse edilmiş karakterleri kaydeder
+
+        Args:
+            file_path: Word dosyası yolu
+            rows: extract_tables çıktısı (header dahil)
+            karakterler: process_dataframe çıktısı
+            table_index: Okuma sırasında oluşan muayene tablosu indeksi
+        """
+        try:
+            data = self._read()
+            entries = data['entries']
+            entries[self.digest(file_path)] = {
+                'file_name': os.path.basename(file_path),
+                'created': datetime.datetime.now().isoformat(),
+                'rows': rows,
+                'karakterler': [karakter_to_dict(k) for k in karakterler],
+                'table_index': table_index.to_dict() if table_index else None
+            }
+
+            # En eski kayıtları at
+            while len(entries) > MAX_ENTRIES:
+                oldest = min(entries, key=lambda key: entries[key].get('created', ''))
+                del entries[oldest]
+
+            return self._write()
+        except Exception as e:
+            log.warning("⚠ Parse önbelleğine yazılamadı: %s", e)
+            return False
+
+    def parsed_dimensions(self) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Projedeki tüm kayıtlardan (ölçü metni, parse sonucu) çiftleri
+
+        Parser önbelleğini ısıtmak için kullanılır; aynı parça numarasının yeni
+        bir serisi açılırken bilinen ölçüler tekrar parse edilmez.
+        """
+        try:
+            entries = list(self._read()['entries'].values())
+        except Exception as e:
+            log.warning("⚠ Parse önbelleği okunamadı: %s", e)
+            return
+
+        for entry in entries:
+            for data in entry.get('karakterler', []):
+                yield data.get('dimension'), data.get('parsed_dimension')
+
+    def invalidate(self):
+        """Önbelleği tamamen siler"""
+        self._data = self._empty()
+        try:
+            if os.path.exists(self.cache_file):
+                os.remove(self.cache_file)
+        except Exception as e:
+            log.warning("⚠ Parse önbelleği silinemedi: %s", e)
@@ -0,0 +1,167 @@
+"""
+Parse Edilmiş Ölçü Deposu - Ölçü metinlerinin parse sonuçlarını
+Desktop/Report altındaki tüm projelerin paylaştığı SQLite tablosunda saklar
+services/parsed_dimension_store.py
+"""
+import os
+import json
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .olcu_parser import PARSER_VERSION
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Tüm projelerin ortak kök klasörü (ProjectManager ile aynı yapı)
+DEFAULT_DB_PATH = str(Path.home() / "Desktop" / "Report" / "parsed_dimensions.db")
+
+
+def normalize_dimension(dimension: Any) -> str:
+    """Depo anahtarı - DataProcessorService'in parse etmeden önce yaptığı temizlik"""
+    return str(dimension).strip()
+
+
+class ParsedDimensionStore:
+    """
+    Ölçü metni → parse sonucu tablosu
+
+    - Anahtar: (normalize ölçü metni, PARSER_VERSION); parser değişince eski
+      satırlar okunmaz, prune_old_versions ile silinir
+    - Parse edilemeyen ölçüler de (sonuç NULL) saklanır, tekrar denenmez
+    - Bilinen bir parça numarasının yeni serisi açılırken parser önbelleği
+      buradan ısıtılır
+    """
+
+    def __init__(self, db_path: str = DEFAULT_DB_PATH):
+        self.db_path = db_path
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Bağlantı açar, tablo yoksa oluşturur"""
+        if not self._ready:
+            os.makedirs(os.path.dirname(self.db_path) or ".", exist_ok=True)
+        conn = sqlite3.connect(self.db_path)
+        if not self._ready:
+            with conn:
+                conn.execute('''
+                    CREATE TABLE IF NOT EXISTS parsed_dimensions (
+                        dimension TEXT NOT NULL,
+                        parser_version INTEGER NOT NULL,
+                        result TEXT,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        PRIMARY KEY (dimension, parser_version)
+                    ) WITHOUT ROWID
+                ''')
+                conn.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_parsed_dimensions_updated
+                    ON parsed_dimensions (parser_version, updated_at)
+                ''')
+            self._ready = True
+        return conn
+
+    def get_many(self, dimensions: Iterable[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+        """Depoda bulunan ölçülerin sonuçlarını döner (bulunmayanlar sözlükte yer almaz)"""
+        keys = list(dict.fromkeys(normalize_dimension(d) for d in dimensions))
+        found: Dict[str, Optional[Dict[str, Any]]] = {}
+        try:
+            with closing(self._connect()) as conn:
+                # SQLite parametre sınırına takılmamak için gruplar halinde sorgula
+                for start in range(0, len(keys), 500):
+                    chunk = keys[start:start + 500]
+                    rows = conn.execute(
+                        f'''SELECT dimension, result FROM parsed_dimensions
+                            WHERE parser_version = ? AND dimension IN ({",".join("?" * len(chunk))})''',
+                        (PARSER_VERSION, *chunk)
+                    )
+                    for dimension, result in rows:
+                        found[dimension] = json.loads(result) if result is not None else None
+        except Exception as e:
+            log.warning("⚠ Ölçü deposu sorgulanamadı: %s", e)
+        return found
+
+    def items(self, limit: Optional[int] = None) -> Iterator[Tuple[str, Optional[Dict[str, Any]]]]:
+        """
+        Geçerli parser sürümündeki (ölçü metni, parse sonucu) çiftleri
+
+        limit verilirse en son kullanılan limit kadar kayıt seçilir (parser
+        önbelleğinin kapasitesini aşan eski kayıtlar okunmaz). Kayıtlar eskiden
+        yeniye döner: önbelleğe bu sırayla eklenince en son kullanılanlar LRU'nun
+        çıkarma ucundan en uzakta kalır.
+        """
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    '''SELECT dimension, result FROM (
+                           SELECT dimension, result, updated_at FROM parsed_dimensions
+                           WHERE parser_version = ? ORDER BY updated_at DESC LIMIT ?
+                       ) ORDER BY updated_at ASC''',
+                    (PARSER_VERSION, -1 if limit is None else limit)
+                ).fetchall()
+        except Exception as e:
+            log.warning("⚠ Ölçü deposu okunamadı: %s", e)
+            return
+
+        for dimension, result in rows:
+            yield dimension, json.loads(result) if result is not None else None
+
+    def put_many(self, pairs: Iterable[Tuple[str, Optional[Dict[str, Any]]]]) -> int:
+        """(ölçü metni, parse sonucu) çiftlerini kaydeder, yazılan satır sayısını döner"""
+        rows: List[Tuple[str, int, Optional[str]]] = []
+        seen = set()
+        for dimension, result in pairs:
+            key = normalize_dimension(dimension)
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            rows.append((key, PARSER_VERSION, json.dumps(result, ensure_ascii=False)
+                         if result is not None else None))
+
+        if not rows:
+            return 0
+
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany('''
+                    INSERT INTO parsed_dimensions (dimension, parser_version, result, updated_at)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                    ON CONFLICT (dimension, parser_version)
+                    DO UPDATE SET result = excluded.result, updated_at = CURRENT_TIMESTAMP
+                ''', rows)
+            log.debug("💾 Ölçü deposuna yazıldı: %s ölçü", len(rows))
+            return len(rows)
+        except Exception as e:
+            log.warning("⚠ Ölçü deposuna yazılamadı: %s", e)
+            return 0
+
+    def store_karakterler(self, karakterler: Iterable) -> int:
+        """Karakterlerin ölçü metinlerini ve parse sonuçlarını kaydeder"""
+        return self.put_many((k.dimension, k.parsed_dimension) for k in karakterler)
+
+    def prune_old_versions(self) -> int:
+        """Eski parser sürümlerine ait satırları siler"""
+        try:
+            with closing(self._connect()) as conn, conn:
+                deleted = conn.execute(
+                    'DELETE FROM parsed_dimensions WHERE parser_version <> ?', (PARSER_VERSION,)
+                ).rowcount
+            if deleted:
+                log.info("🧹 Ölçü deposundan eski sürüm silindi: %s satır", deleted)
+            return deleted
+        except Exception as e:
+            log.warning("⚠ Ölçü deposu temizlenemedi: %s", e)
+            return 0
+
+    def count(self) -> int:
+        """Geçerli parser sürümündeki kayıt sayısı"""
+        try:
+            with closing(self._connect()) as conn:
+                return conn.execute(
+                    'SELECT COUNT(*) FROM parsed_dimensions WHERE parser_version = ?', (PARSER_VERSION,)
+                ).fetchone()[0]
+        except Exception as e:
+            log.warning("⚠ Ölçü deposu sayılamadı: %s", e)
+            return 0
@@ -12,6 +12,10 @@ from pathlib import Path
 from typing import Dict, Tuple, Optional, Any
 from tkinter import messagebox
 
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
 
 class ProjectManager:
     """
@@ -71,12 +75,12 @@ class ProjectManager:
             # Proje bilgilerini JSON dosyasına kaydet
             self._save_project_info()
 
-            print(f"✓ Proje klasörü oluşturuldu: {folder_path}")
+            log.info("✓ Proje klasörü oluşturuldu: %s", folder_path)
             return True, str(folder_path), None
 
         except Exception as e:
             error_msg = f"Proje klasörü oluşturma hatası: {str(e)}"
-            print(f"HATA: {error_msg}")
+            log.error("HATA: %s", error_msg)
             return False, None, error_msg
 
     def load_existing_project(self,
@@ -104,14 +108,14 @@ class ProjectManager:
                 # Mevcut proje bilgilerini yükle
                 self._load_project_info()
 
-                print(f"✓ Mevcut proje yüklendi: {folder_path}")
+                log.info("✓ Mevcut proje yüklendi: %s", folder_path)
                 return True, str(folder_path)
             else:
-                print(f"⚠ Proje klasörü bulunamadı: {folder_path}")
+                log.warning("⚠ Proje klasörü bulunamadı: %s", folder_path)
                 return False, None
 
         except Exception as e:
-            print(f"HATA: Proje yükleme hatası: {str(e)}")
+            log.error("HATA: Proje yükleme hatası: %s", str(e))
             return False, None
 
     def copy_word_file_to_project(self, source_file_path: str) -> Tuple[bool, Optional[str], Optional[str]]:
@@ -151,12 +155,12 @@ class ProjectManager:
 
             self._save_project_info()
 
-            print(f"✓ Word dosyası kopyalandı: {target_path}")
+            log.info("✓ Word dosyası kopyalandı: %s", target_path)
             return True, target_path, None
 
         except Exception as e:
             error_msg = f"Dosya kopyalama hatası: {str(e)}"
-            print(f"HATA: {error_msg}")
+            log.error("HATA: %s", error_msg)
             return False, None, error_msg
 
     def get_project_files(self) -> Dict[str, str]:
@@ -196,13 +200,17 @@ class ProjectManager:
                     elif extension == '.json':
                         if file_path.name == 'project_info.json':
                             files['project_info'] = str(file_path)
+                        elif file_path.name == 'parse_cache.json':
+                            files['parse_cache'] = str(file_path)
+                        elif file_path.name == 'repair_log.json':
+                            files['repair_log'] = str(file_path)
                         else:
                             files['json_file'] = str(file_path)
 
             return files
 
         except Exception as e:
-            print(f"HATA: Dosya listeleme hatası: {str(e)}")
+            log.error("HATA: Dosya listeleme hatası: %s", str(e))
             return {}
 
     def open_project_folder(self) -> bool:
@@ -223,11 +231,11 @@ class ProjectManager:
             else:  # Linux
                 subprocess.call(['xdg-open', self.project_folder])
 
-            print(f"✓ Klasör açıldı: {self.project_folder}")
+            log.info("✓ Klasör açıldı: %s", self.project_folder)
             return True
 
         except Exception as e:
-            print(f"HATA: Klasör açma hatası: {str(e)}")
+            log.error("HATA: Klasör açma hatası: %s", str(e))
             return False
 
     def _save_project_info(self):
@@ -242,10 +250,10 @@ class ProjectManager:
                 json.dump(self.project_info, f, indent=2, ensure_ascii=False)
 
             self.project_file = project_file
-            print(f"✓ Proje bilgileri kaydedildi: {project_file}")
+            log.info("✓ Proje bilgileri kaydedildi: %s", project_file)
 
         except Exception as e:
-            print(f"HATA: Proje bilgileri kaydetme hatası: {str(e)}")
+            log.error("HATA: Proje bilgileri kaydetme hatası: %s", str(e))
 
     def _load_project_info(self):
         """Proje bilgilerini JSON dosyasından yükler"""
@@ -260,10 +268,10 @@ class ProjectManager:
                     self.project_info = json.load(f)
 
                 self.project_file = project_file
-                print(f"✓ Proje bilgileri yüklendi: {project_file}")
+                log.info("✓ Proje bilgileri yüklendi: %s", project_file)
 
         except Exception as e:
-            print(f"HATA: Proje bilgileri yükleme hatası: {str(e)}")
+            log.error("HATA: Proje bilgileri yükleme hatası: %s", str(e))
 
     def get_project_info(self) -> Dict[str, Any]:
         """Proje bilgilerini döner"""
@@ -303,11 +311,11 @@ class ProjectManager:
 
             shutil.copy2(file_path, backup_path)
 
-            print(f"✓ Yedek oluşturuldu: {backup_path}")
+            log.info("✓ Yedek oluşturuldu: %s", backup_path)
             return backup_path
 
         except Exception as e:
-            print(f"HATA: Yedek oluşturma hatası: {str(e)}")
+            log.error("HATA: Yedek oluşturma hatası: %s", str(e))
             return None
 
 
@@ -0,0 +1,208 @@
+"""
+Tablo İndeksi - Word tablolarının header parmak izi, kolon haritası ve KN
+satır aralıkları; okuyucu, yazıcı, görüntüleyici ve önbellek tarafından ortak
+kullanılır
+services/table_index.py
+"""
+from dataclasses import dataclass, field, asdict
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .docx_xml import (
+    iter_table_rows, cell_text, ITEM_PREFIX, EXCLUDED_DIMENSION_SUFFIX
+)
+
+# Header'ın aranacağı ilk satır sayısı; bu satırlarda ne header ne KN satırı
+# yoksa tablonun (antet, revizyon tablosu vb.) kalan satırlarında sadece ilk
+# hücre okunur ve KN satırı aranır
+HEADER_SCAN_ROWS = 3
+
+
+def normalize_header(text: str) -> str:
+    """Header metnini karşılaştırma için normalize eder ("ITEM NO\\nKC" -> "ITEM NO KC")"""
+    return " ".join(text.split()).upper()
+
+
+def find_header_columns(headers: List[str]) -> Tuple[Optional[int], Optional[int]]:
+    """Normalize header listesinden (ITEM NO, ACTUAL) kolon indekslerini bulur"""
+    item_no_col = None
+    actual_col = None
+    for col_idx, text in enumerate(headers):
+        if "ACTUAL" in text:
+            actual_col = col_idx
+        if "ITEM" in text and "NO" in text:
+            item_no_col = col_idx
+    return item_no_col, actual_col
+
+
+@dataclass
+class TableInfo:
+    """Tek bir muayene tablosunun parmak izi"""
+    position: int                                   # document.tables içindeki sıra
+    signature: str = ""                             # "ITEM NO KC|DIMENSION|ACTUAL|..."
+    columns: Dict[str, int] = field(default_factory=dict)
+    item_no_col: Optional[int] = None
+    actual_col: Optional[int] = None
+    header_row: Optional[int] = None                # devam tablolarında None
+    kn_ranges: List[List[int]] = field(default_factory=list)  # [başlangıç, bitiş) satır aralıkları
+    row_count: int = 0
+
+    @property
+    def continued(self) -> bool:
+        """Header'sız, önceki tablonun devamı olan tablo mu?"""
+        return self.header_row is None
+
+    def kn_rows(self) -> set:
+        """KN satırlarının indeks kümesi"""
+        return {row for start, end in self.kn_ranges for row in range(start, end)}
+
+    def add_kn_row(self, row_idx: int):
+        if self.kn_ranges and self.kn_ranges[-1][1] == row_idx:
+            self.kn_ranges[-1][1] = row_idx + 1
+        else:
+            self.kn_ranges.append([row_idx, row_idx + 1])
+
+
+@dataclass
+class TableIndex:
+    """Dokümandaki muayene tablolarının indeksi (diğer tablolar yer almaz)"""
+    tables: List[TableInfo] = field(default_factory=list)
+
+    def get(self, position: int) -> Optional[TableInfo]:
+        for info in self.tables:
+            if info.position == position:
+                return info
+        return None
+
+    @property
+    def kn_row_count(self) -> int:
+        return sum(end - start for info in self.tables for start, end in info.kn_ranges)
+
+    def to_dict(self) -> Dict:
+        return {'tables': [asdict(info) for info in self.tables]}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'TableIndex':
+        return cls(tables=[TableInfo(**info) for info in data.get('tables', [])])
+
+
+def _header_info(position: int, row_idx: int, cells: List) -> Optional[TableInfo]:
+    """Satır muayene tablosu header'ı ise TableInfo döner"""
+    texts = {}
+    headers = []
+    for tc in cells:
+        key = id(tc)
+        if key not in texts:
+            texts[key] = normalize_header(cell_text(tc))
+        headers.append(texts[key])
+
+    item_no_col, actual_col = find_header_columns(headers)
+    if item_no_col is None:
+        return None
+
+    columns = {}
+    for col_idx, text in enumerate(headers):
+        if text:
+            columns.setdefault(text, col_idx)
+
+    return TableInfo(
+        position=position,
+        signature="|".join(headers),
+        columns=columns,
+        item_no_col=item_no_col,
+        actual_col=actual_col,
+        header_row=row_idx
+    )
+
+
+def _continued_info(position: int, previous: Optional[TableInfo]) -> TableInfo:
+    """Header'sız devam tablosu - kolonlar önceki muayene tablosundan alınır"""
+    if previous is None:
+        return TableInfo(position=position, item_no_col=0)
+    return TableInfo(
+        position=position,
+        signature=previous.signature,
+        columns=dict(previous.columns),
+        item_no_col=previous.item_no_col,
+        actual_col=previous.actual_col
+    )
+
+
+def scan_tables(tables: Iterable, index: Optional[TableIndex] = None) -> Iterator[Tuple[TableInfo, int, List, str]]:
+    """
+    Gövde tablolarını sınıflandırır ve muayene tablolarındaki KN satırlarını
+    (tablo bilgisi, satır indeksi, kök w:tc listesi, ilk hücre metni) olarak üretir
+
+    Args:
+        tables: w:tbl elemanları (iter_body_tables veya python-docx table._tbl)
+        index: Verilirse muayene tabloları tablo bitiminde buraya eklenir
+    """
+    previous = None
+    for position, tbl in enumerate(tables):
+        info = None
+        # Header'sız, KN satırı ilk satırlardan sonra gelen tablo
+        late = False
+        row_idx = -1
+        for row_idx, (_, cells) in enumerate(iter_table_rows(tbl)):
+            if not cells:
+                continue
+
+            first = cell_text(cells[0])
+            if info is None:
+                if row_idx >= HEADER_SCAN_ROWS:
+                    if not first.startswith(ITEM_PREFIX):
+                        continue
+                    # Okuyucu KN satırlarını alır; kolonları bilinmediğinden
+                    # ACTUAL kolonu yoktur, yazıcı bu tabloya yazmaz
+                    info = TableInfo(position=position, item_no_col=0)
+                    late = True
+                elif first.startswith(ITEM_PREFIX):
+                    info = _continued_info(position, previous)
+                else:
+                    info = _header_info(position, row_idx, cells)
+                    continue
+
+            if first.startswith(ITEM_PREFIX):
+                info.add_kn_row(row_idx)
+                yield info, row_idx, cells, first
+
+        if info is None:
+            continue
+
+        info.row_count = row_idx + 1
+        if not late:
+            previous = info
+        if index is not None:
+            index.tables.append(info)
+
+
+def iter_kn_rows(tables: Iterable, column_count: int, index: Optional[TableIndex] = None) -> Iterator[List[str]]:
+    """
+    "KN" ile başlayan ve ölçüsü "Inch" ile bitmeyen satırları kolon sayısına
+    tamamlanmış/kırpılmış liste olarak üretir
+
+    İlk hücresi "KN" ile başlamayan satırların diğer hücreleri hiç okunmaz.
+    """
+    for _, _, cells, first in scan_tables(tables, index):
+        if len(cells) <= 2:
+            continue
+
+        texts = {id(cells[0]): first}
+        row_data = []
+        for tc in cells[:column_count]:
+            key = id(tc)
+            if key not in texts:
+                texts[key] = cell_text(tc)
+            row_data.append(texts[key])
+
+        if row_data[1].strip().endswith(EXCLUDED_DIMENSION_SUFFIX):
+            continue
+
+        yield row_data + [''] * (column_count - len(row_data))
+
+
+def build_table_index(tables: Iterable) -> TableIndex:
+    """Tabloları tarayıp sadece indeksi oluşturur"""
+    index = TableIndex()
+    for _ in scan_tables(tables, index):
+        pass
+    return index
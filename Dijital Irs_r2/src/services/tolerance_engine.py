@@ -0,0 +1,161 @@
+"""
+Tolerans Motoru - ACTUAL değerlerinin limit kontrolü tek yerde ve tek
+vektörel çağrıda yapılır; Word kaydetme, istatistik paneli, karakter görünümü
+ve karakter deposu aynı kuralı kullanır
+services/tolerance_engine.py
+"""
+import math
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .data_processor import TeknikResimKarakteri
+
+
+def split_actual(actual: Optional[str]) -> List[str]:
+    """'/' ile ayrılmış çoklu değeri parçalar (örn: '25.4/25.6' -> ['25.4', '25.6'])"""
+    if not actual:
+        return []
+    values = [v.strip() for v in str(actual).split('/')]
+    return [v for v in values if v]
+
+
+def parse_value(text: str) -> Optional[float]:
+    """Tek değeri sayıya çevirir (virgül ondalık ayırıcı olabilir), sayısal değilse None"""
+    try:
+        return float(text.replace(',', '.'))
+    except ValueError:
+        return None
+
+
+class ParsedActual(NamedTuple):
+    """ACTUAL metni ve '/' ile ayrılmış parçalarının sayısal değerleri (sayısal değilse None)"""
+    raw: Optional[str]
+    values: Tuple[Optional[float], ...]
+
+
+def parse_actual(actual: Optional[str]) -> ParsedActual:
+    """ACTUAL metnini bir kez parçalayıp sayıya çevirir"""
+    return ParsedActual(actual, tuple(parse_value(text) for text in split_actual(actual)))
+
+
+def actual_values(karakter: TeknikResimKarakteri) -> Tuple[Optional[float], ...]:
+    """
+    Karakterin ACTUAL değerlerinin sayısal karşılığı
+
+    Sonuç karakterin parsed_actual alanında saklanır; ACTUAL metni değişmedikçe
+    tekrar parse edilmez, değiştiyse (dışarıdan atama dahil) yeniden hesaplanır.
+    """
+    cache = karakter.parsed_actual
+    if cache is None or cache[0] != karakter.actual:
+        cache = karakter.parsed_actual = parse_actual(karakter.actual)
+    return cache[1]
+
+
+def write_actual(karakter: TeknikResimKarakteri, actual: Optional[str]) -> Tuple[Optional[float], ...]:
+    """ACTUAL değerini yazar ve sayısal karşılığını aynı anda günceller"""
+    karakter.actual = actual
+    return actual_values(karakter)
+
+
+def _limit(value: Optional[float]) -> float:
+    """Tanımsız limit NaN ile gösterilir"""
+    return math.nan if value is None else value
+
+
+class ToleranceResult(NamedTuple):
+    """
+    Tolerans değerlendirmesi
+
+    Değer dizileri düzleştirilmiştir; i. karakterin değerleri
+    values[offsets[i]:offsets[i + 1]] aralığındadır.
+    """
+    offsets: np.ndarray       # int, karakter sayısı + 1
+    value_ok: np.ndarray      # bool, değer başına: limit içinde veya sayısal değil
+    numeric: np.ndarray       # bool, değer başına: sayıya çevrilebildi mi
+    karakter_ok: np.ndarray   # bool, karakter başına: tüm değerler limit içinde
+    value_counts: np.ndarray  # int, karakter başına değer sayısı
+    has_limits: np.ndarray    # bool, karakter başına: en az bir limit tanımlı
+
+    def values_ok(self, index: int) -> List[bool]:
+        """index. karakterin değer bazında sonuçları"""
+        return self.value_ok[self.offsets[index]:self.offsets[index + 1]].tolist()
+
+
+def evaluate(lower: Sequence[float], upper: Sequence[float], values: Sequence[float],
+             offsets: Sequence[int], numeric: Optional[Sequence[bool]] = None) -> ToleranceResult:
+    """
+    Limit dizileri ve düzleştirilmiş ölçüm dizisi üzerinden tolerans kontrolü
+
+    Args:
+        lower, upper: Karakter başına alt/üst limit; tanımsız limit NaN
+        values: Tüm karakterlerin ölçüm değerleri arka arkaya
+        offsets: Karakter sınırları (uzunluk = karakter sayısı + 1)
+        numeric: Değer sayısal mı; sayısal olmayan değerler limit içinde sayılır
+            (verilmezse tüm değerler sayısal kabul edilir)
+
+    Kural: limiti olmayan karakter ve sayısal olmayan değer tolerans içindedir;
+    sayıya çevrilen NaN ise limit varsa tolerans dışıdır.
+    """
+    lower = np.asarray(lower, dtype=float)
+    upper = np.asarray(upper, dtype=float)
+    values = np.asarray(values, dtype=float)
+    offsets = np.asarray(offsets, dtype=np.intp)
+    numeric = np.ones(len(values), dtype=bool) if numeric is None else np.asarray(numeric, dtype=bool)
+
+    value_counts = np.diff(offsets)
+    owner = np.repeat(np.arange(len(value_counts)), value_counts)
+    value_lower, value_upper = lower[owner], upper[owner]
+
+    # NaN karşılaştırmaları False döner: tanımsız limit açıkça kabul edilir
+    within = ((np.isnan(value_lower) | (values >= value_lower)) &
+              (np.isnan(value_upper) | (values <= value_upper)))
+    value_ok = within | ~numeric
+
+    violations = np.bincount(owner[~value_ok], minlength=len(value_counts))
+    return ToleranceResult(
+        offsets=offsets,
+        value_ok=value_ok,
+        numeric=numeric,
+        karakter_ok=violations == 0,
+        value_counts=value_counts,
+        has_limits=~(np.isnan(lower) & np.isnan(upper)),
+    )
+
+
+def flatten_actuals(parsed: Iterable[Sequence[Optional[float]]]) -> Tuple[List[float], List[bool], List[int]]:
+    """Karakter başına sayısal değerleri (values, numeric, offsets) dizilerine çevirir"""
+    values: List[float] = []
+    numeric: List[bool] = []
+    offsets = [0]
+    for karakter_values in parsed:
+        for value in karakter_values:
+            values.append(math.nan if value is None else value)
+            numeric.append(value is not None)
+        offsets.append(len(values))
+    return values, numeric, offsets
+
+
+def evaluate_karakterler(karakterler: Sequence[TeknikResimKarakteri],
+                         actuals: Optional[Iterable[Optional[str]]] = None) -> ToleranceResult:
+    """
+    Karakterlerin ACTUAL değerlerini tek çağrıda değerlendirir
+
+    Sayısal değerler karakterlerin parsed_actual önbelleğinden okunur; actuals
+    verilirse ACTUAL alanı yerine bu metinler parse edilir.
+    """
+    if actuals is None:
+        parsed = (actual_values(k) for k in karakterler)
+    else:
+        parsed = (parse_actual(actual).values for actual in actuals)
+    values, numeric, offsets = flatten_actuals(parsed)
+    return evaluate([_limit(k.lower_limit) for k in karakterler],
+                    [_limit(k.upper_limit) for k in karakterler],
+                    values, offsets, numeric)
+
+
+def evaluate_values(karakter: TeknikResimKarakteri, values: Sequence[float]) -> List[bool]:
+    """Tek karakter için verilen sayısal değerlerin limit kontrolü"""
+    result = evaluate([_limit(karakter.lower_limit)], [_limit(karakter.upper_limit)],
+                      values, [0, len(values)])
+    return result.value_ok.tolist()
@@ -1,33 +1,137 @@
 """
 Belirtilen word dosyasından tablo okuma işlemlerini yapar
 """
+import itertools
 import pandas as pd
 from docx import Document
-from typing import List
+from typing import Iterator, List, Optional
+
+from .docx_xml import iter_body_tables
+from .docx_repair import open_package
+from .document_session import DocumentSession
+from .table_index import TableIndex, iter_kn_rows
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+HEADERS = ["ITEM NO", "DIMENSION", "ACTUAL", "BADGE", "TOOLING", "REMARKS", "B/P ZONE", "INSP. LEVEL"]
+
 
 class WordReaderService:
-    def __init__(self):
+    def __init__(self, engine: str = "xml"):
         self.current_document = None
+        # Son okunan dokümanın muayene tablosu indeksi (yazıcı/görüntüleyici/önbellek için)
+        self.table_index: Optional[TableIndex] = None
+        # Son açılan pakete bellekte uygulanan .rels onarımları
+        self.repairs: List[str] = []
+        # "xml": document.xml lxml ile akış halinde okunur, "docx": python-docx nesne modeli
+        self.engine = engine
 
     def load_document(self, file_path: str) -> bool:
         """Word Dosyasını Yükler"""
         try:
-            doc = Document(file_path)
+            doc = Document(self._open_source(file_path))
             self.current_document = doc
-            print(f"✓ Word dosyası yüklendi: {file_path}")
+            log.info("✓ Word dosyası yüklendi: %s", file_path)
             return True
         except Exception as e:
-            print(f"HATA: Word dosyası yüklenemedi - {e}")
+            log.error("HATA: Word dosyası yüklenemedi - %s", e)
             return False
 
-    def extract_tables(self, file_path: str) -> List:
+    def extract_tables(self, file_path: str, engine: Optional[str] = None) -> List:
         """
         Word içerisindeki Tabloları Veri Toplar ve Liste Olarak Döndürür
+
+        Varsayılan "xml" motoru python-docx nesne modelini kurmadan okur;
+        paket okunamazsa python-docx motoruna düşülür. İki motorun çıktısı aynıdır.
+        """
+        engine = engine or self.engine
+        if engine == "xml":
+            try:
+                return self._extract_tables_xml(file_path)
+            except Exception as e:
+                log.warning("⚠ XML akış okuma başarısız, python-docx ile deneniyor: %s", e)
+
+        return self._extract_tables_docx(file_path)
+
+    def _open_source(self, file_path: str):
+        """Kırık ilişkileri bellekte onarılmış paket kaynağını döner (path veya BytesIO)"""
+        source, self.repairs = open_package(file_path)
+        return source
+
+    def iter_rows(self, file_path: str, engine: Optional[str] = None,
+                  session: Optional[DocumentSession] = None) -> Iterator[List[str]]:
+        """
+        Veri satırlarını (header hariç) okundukça üretir
+
+        "xml" motorunda her KN satırı tablo okunurken hemen döner; akış ortasında
+        hata olursa python-docx motoruna düşülür ve daha önce üretilen satırlar
+        tekrar edilmez. table_index tablolar bittikçe dolar.
+
+        session verilirse oturumun onarılmış iskelet paketi akış halinde okunur
+        (motor yok sayılır); python-docx dokümanı kurulmaz, yazıcı ilk ihtiyaçta
+        kurar. İndeks oturuma da yazılır ki yazıcı ve görüntüleyici aynı indeksi
+        kullansın.
         """
-        print("Veri işleme başlıyor...")
+        if session is not None:
+            yield from self._iter_session_rows(session)
+            return
+
+        engine = engine or self.engine
+        yielded = 0
+        if engine == "xml":
+            try:
+                self.table_index = TableIndex()
+                tables = iter_body_tables(self._open_source(file_path))
+                for row in iter_kn_rows(tables, len(HEADERS), self.table_index):
+                    yielded += 1
+                    yield row
+                return
+            except Exception as e:
+                log.warning("⚠ XML akış okuma başarısız, python-docx ile deneniyor: %s", e)
+
+        yield from self._extract_tables_docx(file_path)[1 + yielded:]
+
+    def _iter_session_rows(self, session: DocumentSession) -> Iterator[List[str]]:
+        """Oturumun iskelet paketinden KN satırları; akış hata verirse paylaşılan dokümana düşülür"""
+        package = session.package()
+        self.repairs = session.repairs
+        self.table_index = session.table_index = TableIndex()
+        yielded = 0
+        try:
+            for row in iter_kn_rows(iter_body_tables(package), len(HEADERS), self.table_index):
+                yielded += 1
+                yield row
+            return
+        except Exception as e:
+            log.warning("⚠ XML akış okuma başarısız, python-docx ile deneniyor: %s", e)
+
+        self.current_document = session.document
+        self.table_index = session.table_index = TableIndex()
+        rows = iter_kn_rows(session.tables(), len(HEADERS), self.table_index)
+        yield from itertools.islice(rows, yielded, None)
+
+    def _extract_tables_xml(self, file_path: str) -> List:
+        """document.xml'i iterparse ile tarayıp KN satırlarını doğrudan toplar"""
+        log.info("Veri işleme başlıyor (XML akış)...")
+
+        index = TableIndex()
+        extracted_data = [list(HEADERS)]
+        tables = iter_body_tables(self._open_source(file_path))
+        extracted_data.extend(iter_kn_rows(tables, len(HEADERS), index))
+        self.table_index = index
+
+        log.debug("  %s muayene tablosu bulundu", len(index.tables))
+        log.info("✓ Toplam %s karakter çıkarıldı", len(extracted_data) - 1)
+        return extracted_data
+
+    def _extract_tables_docx(self, file_path: str) -> List:
+        """python-docx nesne modeli üzerinden tablo satırlarını toplar"""
+        log.info("Veri işleme başlıyor...")
         
         # Header'ı ilk eleman olarak liste içinde tanımla
-        headers = ["ITEM NO", "DIMENSION", "ACTUAL", "BADGE", "TOOLING", "REMARKS", "B/P ZONE", "INSP. LEVEL"]
+        headers = list(HEADERS)
         extracted_data = [headers]  # İlk eleman header LİSTESİ
         
         try:
@@ -37,42 +141,24 @@ class WordReaderService:
                 return []
             
             tables = self.current_document.tables
-            print(f"  {len(tables)} tablo bulundu")
+            log.debug("  %s tablo bulundu", len(tables))
+            
+            # Antet/revizyon gibi muayene dışı tablolar indeks taramasında atlanır
+            index = TableIndex()
+            for padded_row in iter_kn_rows((table._tbl for table in tables), len(headers), index):
+                extracted_data.append(padded_row)  # LİSTE ekleniyor
+                log.debug("    ✓ Satır eklendi: %s (kolon sayısı: %s)", padded_row[0], len(padded_row))
             
-            for table_idx, table in enumerate(tables):
-                print(f"  Tablo {table_idx + 1} işleniyor...")
-                
-                for row in table.rows:
-                    row_data = []
-                    for cell in row.cells:
-                        # Hücredeki tüm paragrafları birleştir
-                        cell_text = '\n'.join([p.text for p in cell.paragraphs])
-                        row_data.append(cell_text)
-                    
-                    # DEBUG: Satır verilerini kontrol et
-                    print(f"    Debug - row_data uzunluğu: {len(row_data)}")
-                    if len(row_data) > 0:
-                        print(f"    Debug - İlk element: '{row_data[0]}'")
-                    
-                    # Filtreleme mantığı
-                    if (len(row_data) > 2 and 
-                        row_data[0].startswith("KN") and 
-                        not row_data[1].strip().endswith("Inch")):
-                        
-                        # Satırı 8 kolona pad et veya kırp
-                        padded_row = row_data + [''] * (len(headers) - len(row_data))
-                        padded_row = padded_row[:len(headers)]
-                        
-                        extracted_data.append(padded_row)  # LİSTE ekleniyor
-                        print(f"    ✓ Satır eklendi: {row_data[0]} (kolon sayısı: {len(padded_row)})")
+            self.table_index = index
+            log.debug("  %s muayene tablosu işlendi", len(index.tables))
             
-            print(f"✓ Toplam {len(extracted_data) - 1} karakter çıkarıldı")
-            print(f"Header: {extracted_data[0]}")
+            log.info("✓ Toplam %s karakter çıkarıldı", len(extracted_data) - 1)
+            log.debug("Header: %s", extracted_data[0])
             if len(extracted_data) > 1:
-                print(f"İlk veri satırı: {extracted_data[1]} (uzunluk: {len(extracted_data[1])})")
+                log.debug("İlk veri satırı: %s (uzunluk: %s)", extracted_data[1], len(extracted_data[1]))
             
             return extracted_data
             
         except Exception as e:
-            print(f"HATA: Tablo çıkarma işleminde sorun: {e}")
+            log.error("HATA: Tablo çıkarma işleminde sorun: %s", e)
             return []
\ No newline at end of file
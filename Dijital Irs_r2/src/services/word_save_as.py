@@ -12,6 +12,16 @@ from docx.oxml import OxmlElement
 from typing import List, Tuple, Optional
 from tkinter import filedialog, messagebox
 from .data_processor import TeknikResimKarakteri
+from .docx_xml import iter_docx_rows
+from .docx_repair import open_package
+from .document_session import DocumentSession
+from .table_index import TableIndex, build_table_index, find_header_columns, normalize_header
+from .karakter_repository import KarakterRepository
+from .tolerance_engine import evaluate_karakterler, evaluate_values, parse_value, split_actual
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
 
 class WordSaveAsService:
     """
@@ -20,33 +30,57 @@ class WordSaveAsService:
     """
     
     def __init__(self):
-        self.current_document = None
+        self._document = None
         self.original_file_path = None
+        self.table_index: Optional[TableIndex] = None
+        # Doküman bir oturumdan geldiyse kaydetme oturum üzerinden yapılır (medya ham aktarılır)
+        self.session: Optional[DocumentSession] = None
+    
+    @property
+    def current_document(self):
+        """Yazılacak doküman; oturumdan geldiyse ilk erişimde (yazma/kaydetme) parse edilir"""
+        if self._document is None and self.session is not None:
+            self._document = self.session.document
+        return self._document
+        
+    def load_original_document(self, file_path: str, table_index: Optional[TableIndex] = None,
+                               session: Optional[DocumentSession] = None) -> bool:
+        """
+        Orijinal Word dosyasını yükler
         
-    def load_original_document(self, file_path: str) -> bool:
-        """Orijinal Word dosyasını yükler"""
+        Args:
+            file_path: Word dosyası yolu
+            table_index: Okuma sırasında oluşturulan tablo indeksi (yoksa ilk yazmada oluşturulur)
+            session: Verilirse oturumun paylaşılan dokümanı kullanılır, dosya tekrar parse edilmez;
+                doküman ağacı ilk yazmaya kadar kurulmaz
+        """
         try:
-            self.current_document = Document(file_path)
+            self.session = session
+            self._document = None
+            if session is not None:
+                table_index = table_index or session.table_index
+            else:
+                source, _ = open_package(file_path)
+                self._document = Document(source)
             self.original_file_path = file_path
-            print(f"✓ Orijinal Word dosyası yüklendi: {file_path}")
+            self.table_index = table_index
+            log.info("✓ Orijinal Word dosyası yüklendi: %s", file_path)
             return True
         except Exception as e:
-            print(f"HATA: Word dosyası yüklenemedi - {e}")
+            log.error("HATA: Word dosyası yüklenemedi - %s", e)
             return False
     
-    def find_table_columns(self, table) -> tuple:
+    def find_table_columns(self, table, header_cells: list = None) -> tuple:
         """Tabloda ITEM NO ve ACTUAL kolonlarının indekslerini bulur"""
         actual_col_index = None
         item_no_col_index = None
         
-        if len(table.rows) > 0:
-            header_row = table.rows[0]
-            for col_idx, cell in enumerate(header_row.cells):
-                cell_text = cell.text.strip().upper()
-                if "ACTUAL" in cell_text:
-                    actual_col_index = col_idx
-                if "ITEM" in cell_text and "NO" in cell_text:
-                    item_no_col_index = col_idx
+        if header_cells is None:
+            header_cells = next(iter_docx_rows(table), [])
+        
+        if header_cells:
+            headers = [normalize_header(cell.text) for cell in header_cells]
+            item_no_col_index, actual_col_index = find_header_columns(headers)
         
         return item_no_col_index, actual_col_index
     
@@ -54,49 +88,33 @@ class WordSaveAsService:
         """
         Birden fazla değeri parse eder (örn: '25.4/25.6' -> ['25.4', '25.6'])
         """
-        if not actual_value:
-            return []
-        
-        # "/" ile ayrılmış değerleri ayır
-        values = [v.strip() for v in actual_value.split('/')]
-        return [v for v in values if v]  # Boş stringleri filtrele
+        return split_actual(actual_value)
     
     def check_tolerance(self, value_str: str, karakter: TeknikResimKarakteri) -> Tuple[bool, str]:
         """
-        Tek bir değerin tolerans durumunu kontrol eder
+        Tek bir değerin tolerans durumunu kontrol eder (kural tolerance_engine'de)
         
         Returns:
             Tuple[bool, str]: (tolerans_içinde_mi, durum_mesajı)
         """
-        try:
-            # Sayısal değere çevir
-            value = float(value_str.replace(',', '.'))
-            
-            # Tolerans bilgileri var mı?
-            has_lower = hasattr(karakter, 'lower_limit') and karakter.lower_limit is not None
-            has_upper = hasattr(karakter, 'upper_limit') and karakter.upper_limit is not None
-            
-            if not has_lower and not has_upper:
-                return True, "Tolerans tanımlanmamış"
-            
-            # Tolerans kontrolü
-            if has_lower and has_upper:
-                in_tolerance = karakter.lower_limit <= value <= karakter.upper_limit
-                status = f"Limit: {karakter.lower_limit} ↔ {karakter.upper_limit}"
-            elif has_upper:
-                in_tolerance = value <= karakter.upper_limit
-                status = f"Max: {karakter.upper_limit}"
-            elif has_lower:
-                in_tolerance = value >= karakter.lower_limit
-                status = f"Min: {karakter.lower_limit}"
-            else:
-                return True, "Limit yok"
-            
-            return in_tolerance, status
-            
-        except ValueError:
+        value = parse_value(value_str)
+        if value is None:
             # Sayısal olmayan değer
             return True, "Sayısal olmayan değer"
+        
+        has_lower = karakter.lower_limit is not None
+        has_upper = karakter.upper_limit is not None
+        if not has_lower and not has_upper:
+            return True, "Tolerans tanımlanmamış"
+        
+        if has_lower and has_upper:
+            status = f"Limit: {karakter.lower_limit} ↔ {karakter.upper_limit}"
+        elif has_upper:
+            status = f"Max: {karakter.upper_limit}"
+        else:
+            status = f"Min: {karakter.lower_limit}"
+        
+        return evaluate_values(karakter, [value])[0], status
     
     def check_multiple_values_tolerance(self, actual_value: str, karakter: TeknikResimKarakteri) -> Tuple[List[bool], str]:
         """
@@ -110,21 +128,17 @@ class WordSaveAsService:
         if not values:
             return [], "Değer yok"
         
-        tolerance_results = []
-        status_messages = []
-        
-        for i, value in enumerate(values):
-            in_tolerance, status = self.check_tolerance(value, karakter)
-            tolerance_results.append(in_tolerance)
-            
-            value_status = "✅" if in_tolerance else "❌"
-            status_messages.append(f"Değer {i+1} ({value}): {value_status}")
-        
-        # Genel durum mesajı
-        any_out_of_tolerance = not all(tolerance_results)
-        general_status = " | ".join(status_messages)
-        
-        return tolerance_results, general_status
+        # Karakterin kendi ACTUAL'ı ise önbellekteki sayısal değerler kullanılır
+        actuals = None if actual_value == karakter.actual else [actual_value]
+        tolerance_results = evaluate_karakterler([karakter], actuals).values_ok(0)
+        return tolerance_results, self._tolerance_status(values, tolerance_results)
+    
+    def _tolerance_status(self, values: List[str], tolerance_results: List[bool]) -> str:
+        """Değer bazında durum mesajı"""
+        return " | ".join(
+            f"Değer {i+1} ({value}): {'✅' if in_tolerance else '❌'}"
+            for i, (value, in_tolerance) in enumerate(zip(values, tolerance_results))
+        )
     
     def apply_yellow_highlight(self, cell, text: str, highlight_parts: List[bool] = None):
         """
@@ -144,7 +158,7 @@ class WordSaveAsService:
                 # Tüm metni sarı highlight yap
                 run = paragraph.add_run(text)
                 run.font.highlight_color = WD_COLOR_INDEX.YELLOW
-                print(f"      🟡 Tüm metin sarı highlight yapıldı: {text}")
+                log.debug("      🟡 Tüm metin sarı highlight yapıldı: %s", text)
                             
             else:
                 # Birden fazla değer için kısmi highlighting
@@ -161,16 +175,16 @@ class WordSaveAsService:
                     if should_highlight:
                         # Sarı highlight
                         run.font.highlight_color = WD_COLOR_INDEX.YELLOW
-                        print(f"      🟡 Değer {i+1} sarı highlight yapıldı: {value}")
+                        log.debug("      🟡 Değer %s sarı highlight yapıldı: %s", i+1, value)
                     else:
                         # Normal format
-                        print(f"      ✅ Değer {i+1} normal: {value}")
+                        log.debug("      ✅ Değer %s normal: %s", i+1, value)
                         
         except Exception as e:
-            print(f"      ⚠ Sarı highlight hatası: {e}")
+            log.warning("      ⚠ Sarı highlight hatası: %s", e)
             # Fallback: Sadece metni yaz
             cell.text = text
-            print(f"      🟡 [FALLBACK] Sarı highlight olması gereken metin yazıldı: {text}")
+            log.debug("      🟡 [FALLBACK] Sarı highlight olması gereken metin yazıldı: %s", text)
     
     def apply_red_bold_format(self, cell, text: str, highlight_parts: List[bool] = None):
         """
@@ -191,7 +205,7 @@ class WordSaveAsService:
                 run = paragraph.add_run(text)
                 run.bold = True
                 run.font.color.rgb = RGBColor(255, 0, 0)  # Kırmızı
-                print(f"      🔴 Tüm metin kırmızı bold yapıldı: {text}")
+                log.debug("      🔴 Tüm metin kırmızı bold yapıldı: %s", text)
                             
             else:
                 # Birden fazla değer için kısmi formatlama
@@ -209,16 +223,16 @@ class WordSaveAsService:
                         # Kırmızı bold format
                         run.bold = True
                         run.font.color.rgb = RGBColor(255, 0, 0)  # Kırmızı
-                        print(f"      🔴 Değer {i+1} kırmızı bold yapıldı: {value}")
+                        log.debug("      🔴 Değer %s kırmızı bold yapıldı: %s", i+1, value)
                     else:
                         # Normal format
-                        print(f"      ✅ Değer {i+1} normal: {value}")
+                        log.debug("      ✅ Değer %s normal: %s", i+1, value)
                         
         except Exception as e:
-            print(f"      ⚠ Kırmızı bold format hatası: {e}")
+            log.warning("      ⚠ Kırmızı bold format hatası: %s", e)
             # Fallback: Sadece metni yaz
             cell.text = text
-            print(f"      🔴 [FALLBACK] Kırmızı bold olması gereken metin yazıldı: {text}")
+            log.debug("      🔴 [FALLBACK] Kırmızı bold olması gereken metin yazıldı: %s", text)
     
     def apply_yellow_highlight_fallback(self, cell, text: str):
         """
@@ -242,11 +256,11 @@ class WordSaveAsService:
             shading_elm.set(qn('w:fill'), 'FFFF00')  # Sarı
             
             tc_pr.append(shading_elm)
-            print(f"      🟡 Hücre arka planı sarı yapıldı: {text}")
+            log.debug("      🟡 Hücre arka planı sarı yapıldı: %s", text)
             return True
             
         except Exception as e:
-            print(f"      ⚠ Sarı arka plan hatası: {e}")
+            log.warning("      ⚠ Sarı arka plan hatası: %s", e)
             return False
     
     def format_tolerance_violation(self, cell, text: str, tolerance_results: List[bool] = None):
@@ -259,7 +273,7 @@ class WordSaveAsService:
             tolerance_results: Her değer için tolerans durumu listesi
         """
         try:
-            print(f"      🔍 Tolerans dışı format uygulanıyor: {text}")
+            log.debug("      🔍 Tolerans dışı format uygulanıyor: %s", text)
             
             # Önce sarı highlight dene (Stack Overflow yöntemi)
             if tolerance_results and len(tolerance_results) > 1:
@@ -273,7 +287,7 @@ class WordSaveAsService:
                 return True
                 
         except Exception as e:
-            print(f"      ⚠ Sarı highlight başarısız, kırmızı bold deneniyor: {e}")
+            log.warning("      ⚠ Sarı highlight başarısız, kırmızı bold deneniyor: %s", e)
             
             # Fallback 1: Kırmızı bold format
             try:
@@ -282,75 +296,94 @@ class WordSaveAsService:
                     self.apply_red_bold_format(cell, text, out_of_tolerance_mask)
                 else:
                     self.apply_red_bold_format(cell, text, None)
-                print(f"      🔴 Kırmızı bold başarılı")
+                log.debug("      🔴 Kırmızı bold başarılı")
                 return True
             except Exception as e2:
-                print(f"      ⚠ Kırmızı bold da başarısız, sarı arka plan deneniyor: {e2}")
+                log.warning("      ⚠ Kırmızı bold da başarısız, sarı arka plan deneniyor: %s", e2)
                 
                 # Fallback 2: Sarı arka plan
                 success = self.apply_yellow_highlight_fallback(cell, text)
                 if success:
-                    print(f"      🟡 Sarı arka plan başarılı")
+                    log.debug("      🟡 Sarı arka plan başarılı")
                     return True
                 else:
                     # Son çare: Sadece metni yaz
                     cell.text = text
-                    print(f"      ⚠ [SON ÇARE] Sadece metin yazıldı: {text}")
+                    log.warning("      ⚠ [SON ÇARE] Sadece metin yazıldı: %s", text)
                     return False
 
     def update_actual_values(self, karakterler: List[TeknikResimKarakteri]) -> bool:
         """Word tablosundaki ACTUAL kolonunu günceller (tolerans kontrolü ile)"""
         if not self.current_document:
-            print("HATA: Önce Word dosyası yüklenmelidir")
+            log.error("HATA: Önce Word dosyası yüklenmelidir")
             return False
         
         try:
-            print("ACTUAL değerleri Word tablosuna yazılıyor (tolerans kontrolü ile)...")
+            log.info("ACTUAL değerleri Word tablosuna yazılıyor (tolerans kontrolü ile)...")
+            
+            # Sadece indeksteki muayene tabloları ve KN satırları ziyaret edilir
+            if self.table_index is None:
+                self.table_index = build_table_index(table._tbl for table in self.current_document.tables)
+            tables = self.current_document.tables
             
             # Karakterleri item_no ile hızlı erişim için dict'e çevir
-            karakter_dict = {k.item_no: k for k in karakterler}
+            karakterler = list(karakterler)
+            karakter_dict = {k.item_no: i for i, k in enumerate(karakterler)}
+            # Tüm karakterlerin tolerans durumu tek vektörel çağrıda
+            tolerance = evaluate_karakterler(karakterler)
             updated_count = 0
             tolerance_violations = 0
             
-            for table_idx, table in enumerate(self.current_document.tables):
-                print(f"  Tablo {table_idx + 1} kontrol ediliyor...")
+            for info in self.table_index.tables:
+                table_idx = info.position
+                if table_idx >= len(tables):
+                    log.warning("    ⚠ Tablo indeksi dokümanla uyuşmuyor (tablo %s)", table_idx + 1)
+                    break
+                table = tables[table_idx]
+                log.debug("  Tablo %s kontrol ediliyor...", table_idx + 1)
                 
-                # Kolon indekslerini bul
-                item_no_col_index, actual_col_index = self.find_table_columns(table)
+                # Kolon indeksleri indeksten gelir
+                item_no_col_index, actual_col_index = info.item_no_col, info.actual_col
                 
                 if actual_col_index is None:
-                    print(f"    Tablo {table_idx + 1}'de ACTUAL kolonu bulunamadı")
+                    log.debug("    Tablo %s'de ACTUAL kolonu bulunamadı", table_idx + 1)
                     continue
                 
                 if item_no_col_index is None:
-                    print(f"    Tablo {table_idx + 1}'de ITEM NO kolonu bulunamadı")
+                    log.debug("    Tablo %s'de ITEM NO kolonu bulunamadı", table_idx + 1)
                     continue
                 
-                print(f"    ITEM NO kolonu: {item_no_col_index}, ACTUAL kolonu: {actual_col_index}")
+                log.debug("    ITEM NO kolonu: %s, ACTUAL kolonu: %s", item_no_col_index, actual_col_index)
                 
-                # Veri satırlarını güncelle (header'ı atla)
-                for row_idx, row in enumerate(table.rows[1:], start=1):
+                # Veri satırlarını güncelle (sadece KN satırları)
+                kn_rows = info.kn_rows()
+                for row_idx, row_cells in enumerate(iter_docx_rows(table)):
+                    if row_idx not in kn_rows:
+                        continue
                     try:
                         # Güvenlik kontrolü - yeterli hücre var mı?
-                        if len(row.cells) <= max(item_no_col_index, actual_col_index):
-                            print(f"    ⚠ Satır {row_idx}: Yeterli hücre yok ({len(row.cells)} hücre)")
+                        if len(row_cells) <= max(item_no_col_index, actual_col_index):
+                            log.warning("    ⚠ Satır %s: Yeterli hücre yok (%s hücre)", row_idx, len(row_cells))
                             continue
                         
                         # ITEM NO'yu al
-                        item_no_cell = row.cells[item_no_col_index]
+                        item_no_cell = row_cells[item_no_col_index]
                         item_no = item_no_cell.text.strip()
                         
                         # Bu ITEM NO'ya sahip karakter var mı ve actual değeri var mı?
                         if item_no in karakter_dict:
-                            karakter = karakter_dict[item_no]
+                            karakter_position = karakter_dict[item_no]
+                            karakter = karakterler[karakter_position]
                             
                             if karakter.actual:
                                 # ACTUAL hücresini güncelle
-                                actual_cell = row.cells[actual_col_index]
+                                actual_cell = row_cells[actual_col_index]
                                 actual_value = str(karakter.actual)
                                 
                                 # Tolerans kontrolü yap
-                                tolerance_results, tolerance_status = self.check_multiple_values_tolerance(actual_value, karakter)
+                                tolerance_results = tolerance.values_ok(karakter_position)
+                                tolerance_status = self._tolerance_status(
+                                    self.parse_multiple_values(actual_value), tolerance_results)
                                 
                                 if tolerance_results:
                                     # En az bir değer var
@@ -362,37 +395,37 @@ class WordSaveAsService:
                                         
                                         tolerance_violations += 1
                                         format_type = "sarı highlight veya kırmızı bold"
-                                        print(f"    🟡 {item_no}: {actual_value} (Tolerans dışı - {format_type})")
-                                        print(f"      📊 {tolerance_status}")
+                                        log.debug("    🟡 %s: %s (Tolerans dışı - %s)", item_no, actual_value, format_type)
+                                        log.debug("      📊 %s", tolerance_status)
                                     else:
                                         # Tüm değerler tolerans içinde - normal yaz
                                         actual_cell.text = actual_value
-                                        print(f"    ✅ {item_no}: {actual_value} (Tolerans içinde)")
+                                        log.debug("    ✅ %s: %s (Tolerans içinde)", item_no, actual_value)
                                 else:
                                     # Tolerans kontrolü yapılamadı - normal yaz
                                     actual_cell.text = actual_value
-                                    print(f"    ○ {item_no}: {actual_value} (Tolerans kontrol edilemedi)")
+                                    log.debug("    ○ %s: %s (Tolerans kontrol edilemedi)", item_no, actual_value)
                                 
                                 updated_count += 1
                             else:
-                                print(f"    ○ {item_no}: Ölçüm değeri yok")
+                                log.debug("    ○ %s: Ölçüm değeri yok", item_no)
                         else:
                             # ITEM NO bulunamadı - sadece debug için yazdır
                             if item_no and item_no.upper().startswith('KN'):
-                                print(f"    ? {item_no}: Karakterler listesinde bulunamadı")
+                                log.debug("    ? %s: Karakterler listesinde bulunamadı", item_no)
                                 
                     except Exception as e:
-                        print(f"    ✗ Satır {row_idx} güncellenirken hata: {e}")
+                        log.error("    ✗ Satır %s güncellenirken hata: %s", row_idx, e)
                         continue
             
-            print(f"✓ Toplam {updated_count} ACTUAL değeri güncellendi")
+            log.info("✓ Toplam %s ACTUAL değeri güncellendi", updated_count)
             if tolerance_violations > 0:
-                print(f"🟡 {tolerance_violations} tolerans dışı değer sarı highlight ile işaretlendi")
+                log.info("🟡 %s tolerans dışı değer sarı highlight ile işaretlendi", tolerance_violations)
             
             return updated_count > 0
             
         except Exception as e:
-            print(f"HATA: ACTUAL değerleri güncellenirken hata: {e}")
+            log.error("HATA: ACTUAL değerleri güncellenirken hata: %s", e)
             return False
     
     def get_save_path(self, suggested_name: str = None) -> str:
@@ -414,7 +447,7 @@ class WordSaveAsService:
                 ]
             )
         except Exception as e:
-            print(f"initialfile hatası, fallback kullanılıyor: {e}")
+            log.warning("initialfile hatası, fallback kullanılıyor: %s", e)
             # Fallback - eski tkinter sürümleri için
             save_path = filedialog.asksaveasfilename(
                 title=f"Word Dosyasını Kaydet (Önerilen: {suggested_name})",
@@ -433,12 +466,15 @@ class WordSaveAsService:
             if not self.current_document:
                 raise Exception("Kaydedilecek doküman yok")
             
-            self.current_document.save(save_path)
-            print(f"✓ Word dosyası kaydedildi: {save_path}")
+            if self.session is not None and self.session.document is self.current_document:
+                self.session.save(save_path)
+            else:
+                self.current_document.save(save_path)
+            log.info("✓ Word dosyası kaydedildi: %s", save_path)
             return True
             
         except Exception as e:
-            print(f"HATA: Word dosyası kaydedilemedi: {e}")
+            log.error("HATA: Word dosyası kaydedilemedi: %s", e)
             return False
     
     def save_with_actual_values(self, karakterler: List[TeknikResimKarakteri], save_path: str = None) -> str:
@@ -456,13 +492,13 @@ class WordSaveAsService:
             Exception: Kaydetme işlemi başarısız olursa
         """
         try:
-            print("Word dosyası ölçüm değerleriyle kaydediliyor (tolerans kontrolü ile)...")
+            log.info("Word dosyası ölçüm değerleriyle kaydediliyor (tolerans kontrolü ile)...")
             
             # 1. ACTUAL değerlerini güncelle (tolerans kontrolü ile)
             update_success = self.update_actual_values(karakterler)
             
             if not update_success:
-                print("⚠ Hiçbir ACTUAL değeri güncellenmedi, yine de devam ediliyor...")
+                log.warning("⚠ Hiçbir ACTUAL değeri güncellenmedi, yine de devam ediliyor...")
             
             # 2. Kaydetme yolunu belirle
             if not save_path:
@@ -475,47 +511,24 @@ class WordSaveAsService:
             if not self.save_document(save_path):
                 raise Exception("Dosya kaydetme işlemi başarısız")
             
-            print(f"✓ Ölçüm değerleri Word dosyasına başarıyla aktarıldı: {save_path}")
-            print("🟡 Tolerans dışı değerler sarı highlight ile işaretlendi")
+            log.info("✓ Ölçüm değerleri Word dosyasına başarıyla aktarıldı: %s", save_path)
+            log.info("🟡 Tolerans dışı değerler sarı highlight ile işaretlendi")
             return save_path
             
         except Exception as e:
             error_msg = f"Word kaydetme işlemi başarısız: {str(e)}"
-            print(f"HATA: {error_msg}")
+            log.error("HATA: %s", error_msg)
             raise Exception(error_msg)
     
     def get_statistics(self, karakterler: List[TeknikResimKarakteri]) -> dict:
-        """Ölçüm istatistiklerini döner (tolerans bilgileri dahil)"""
-        total = len(karakterler)
-        measured = len([k for k in karakterler if k.actual])
-        unmeasured = total - measured
-        
-        # Tolerans istatistikleri
-        tolerance_violations = 0
-        tolerance_compliant = 0
-        no_tolerance_defined = 0
-        
-        for karakter in karakterler:
-            if karakter.actual:
-                tolerance_results, _ = self.check_multiple_values_tolerance(karakter.actual, karakter)
-                
-                if tolerance_results:
-                    if not all(tolerance_results):
-                        tolerance_violations += 1
-                    else:
-                        tolerance_compliant += 1
-                else:
-                    no_tolerance_defined += 1
+        """
+        Ölçüm istatistiklerini döner (tolerans bilgileri dahil)
         
-        return {
-            'total': total,
-            'measured': measured,
-            'unmeasured': unmeasured,
-            'completion_percentage': (measured / total * 100) if total > 0 else 0,
-            'tolerance_violations': tolerance_violations,
-            'tolerance_compliant': tolerance_compliant,
-            'no_tolerance_defined': no_tolerance_defined
-        }
+        KarakterRepository verilirse sayaçları okunur; düz liste bir kez indekslenir.
+        """
+        if not isinstance(karakterler, KarakterRepository):
+            karakterler = KarakterRepository(karakterler)
+        return karakterler.get_statistics()
 
 # Test fonksiyonu
 def test_word_save_as():
@@ -535,11 +548,11 @@ def test_word_save_as():
         
         # 1. Word dosyasını oku
         word_service = WordReaderService()
-        df = DataProcessorService.from_word_tables(word_service, test_file)
+        rows = word_service.extract_tables(test_file)
         
         # 2. Karakterleri işle
         data_service = DataProcessorService()
-        karakterler = data_service.process_dataframe(df)
+        karakterler = data_service.process_rows(rows[1:])
         
         # 3. Test için çeşitli actual değerler ekle
         test_values = [
@@ -0,0 +1,54 @@
+# tests/helpers.py
+"""Testlerin paylaştığı örnek Word dokümanı oluşturucuları"""
+import zipfile
+from docx import Document
+from services.word_reader import HEADERS
+
+
+def build_document(path):
+    """Birleşik hücre, iç tablo ve satır sonu içeren örnek IRS dokümanı"""
+    doc = Document()
+    doc.add_paragraph("Title block")
+    table = doc.add_table(rows=6, cols=8)
+    for idx, header in enumerate(HEADERS):
+        table.rows[0].cells[idx].text = header
+
+    rows = [
+        ("KN001", "25.55±0.1"),
+        ("KN002", "MAX 6.3"),
+        ("NOTE", "not an item"),
+        ("KN003", "1.0 Inch"),
+        ("KN004", "[ Position | ∅0.2 | A | B ]"),
+    ]
+    for row_idx, (item_no, dimension) in enumerate(rows, start=1):
+        cells = table.rows[row_idx].cells
+        cells[0].text = item_no
+        cells[1].text = dimension
+        cells[4].text = "CALIPER"
+        cells[7].text = "100%"
+
+    run = table.cell(1, 5).paragraphs[0].add_run("first")
+    run.add_break()
+    run.add_text("second\tthird")
+    table.cell(1, 4).merge(table.cell(2, 4))
+    table.cell(4, 5).merge(table.cell(4, 6))
+    table.cell(5, 5).add_table(rows=1, cols=2).cell(0, 0).text = "KN_INNER"
+
+    doc.save(path)
+
+
+BROKEN_RELS = (
+    '<Relationship Id="rIdNull" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/header" Target="../NULL"/>'
+    '<Relationship Id="rIdHeader" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/header" Target="header9.xml"/>'
+)
+
+
+def break_package(path):
+    """SharePoint'in bozduğu gibi NULL ve eksik header ilişkileri ekler"""
+    with zipfile.ZipFile(path) as zin:
+        items = [(item, zin.read(item)) for item in zin.infolist()]
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zout:
+        for item, data in items:
+            if item.filename == "word/_rels/document.xml.rels":
+                data = data.replace(b"</Relationships>", BROKEN_RELS.encode() + b"</Relationships>")
+            zout.writestr(item, data)
@@ -0,0 +1,33 @@
+# tests/test_async_processor.py
+import os
+from services.async_processor import AsyncDocumentProcessor, _process_document
+from tests.helpers import build_document
+
+
+class TestAsyncDocumentProcessor:
+    def test_batch_isolates_failing_documents(self, tmp_path):
+        good = str(tmp_path / "irs_1.docx")
+        other = str(tmp_path / "irs_2.docx")
+        broken = str(tmp_path / "bozuk.docx")
+        build_document(good)
+        build_document(other)
+        with open(broken, "wb") as f:
+            f.write(b"docx degil")
+
+        with AsyncDocumentProcessor(max_workers=2) as processor:
+            results = {os.path.basename(r.file_path): r for r in processor.process_batch([good, broken, other])}
+
+        assert set(results) == {"irs_1.docx", "irs_2.docx", "bozuk.docx"}
+        assert not results["bozuk.docx"].ok
+        assert results["irs_1.docx"].ok and results["irs_2.docx"].ok
+        assert [k.item_no for k in results["irs_1.docx"].karakterler] == ["KN001", "KN002", "KN004"]
+
+    def test_worker_matches_sequential_pipeline(self, tmp_path):
+        path = str(tmp_path / "irs.docx")
+        build_document(path)
+
+        result = _process_document(path)
+
+        assert result.ok
+        assert result.row_count == 3
+        assert result.karakterler[0].parsed_dimension is not None
@@ -0,0 +1,149 @@
+# tests/test_data_processor.py
+from dataclasses import asdict
+import numpy as np
+import pandas as pd
+import pytest
+import traceback
+from services.data_processor import DataProcessorService, DimensionDedupParser, TeknikResimKarakteri
+from services.olcu_parser import OlcuYakalayici
+from services.word_reader import HEADERS
+
+
+def _iterrows_reference(df):
+    """Eski satır satır dönüşüm"""
+    service = DataProcessorService()
+    parser = OlcuYakalayici()
+    karakterler = (service._build_karakter(row, index, parser) for index, row in df.iterrows())
+    return [k for k in karakterler if k is not None]
+
+
+class TestProcessDataframe:
+    def test_matches_iterrows_on_extracted_rows(self):
+        rows = [list(HEADERS),
+                [" KN001 ", "25.55±0.1", " 25.56 ", "B1", "CALIPER", "", "A1", "100%"],
+                ["", "MAX 6.3", "", "", "", "", "", ""],
+                ["KN003", " ", "", "", "", "", "", ""],
+                ["KN004", "Ø250 +0.1/-0.1", "None", "", "CMM", "not", "", ""],
+                ["KN005", "[ Position | ∅0.2 | A | B ]"]]
+        df = DataProcessorService.from_extracted_rows(rows)
+
+        karakterler = DataProcessorService().process_dataframe(df)
+
+        assert karakterler == _iterrows_reference(df)
+        assert [k.item_no for k in karakterler] == ["KN001", "KN004", "KN005"]
+        assert karakterler[0].actual == "25.56"
+        assert karakterler[1].actual is None
+
+    def test_matches_iterrows_on_mixed_values(self):
+        df = pd.DataFrame({
+            "ITEM NO": ["KN1", np.nan, "nan", 7, "KN5"],
+            "DIMENSION": ["MAX 6.3", "MIN 1", "25±0.1", 25.5, "None"],
+            "ACTUAL": [np.nan, " 5 ", "", 6.0, "1"],
+            "TOOLING": [np.nan, "x", 3, "y", "z"],
+        }, index=[10, 11, 12, 13, 14])
+
+        assert DataProcessorService().process_dataframe(df) == _iterrows_reference(df)
+
+    def test_all_numeric_frame_is_upcast_like_iterrows(self):
+        df = pd.DataFrame({"ITEM NO": [1, 2], "DIMENSION": [3.5, 4.0]})
+
+        karakterler = DataProcessorService().process_dataframe(df)
+
+        assert karakterler == _iterrows_reference(df)
+        assert karakterler[0].item_no == "1.0"
+
+
+class TestProcessRows:
+    def test_matches_dataframe_path(self):
+        rows = [[" KN001 ", "25.55±0.1", " 25.56 ", "B1", "CALIPER", "", "A1", "100%"],
+                ["", "MAX 6.3", "", "", "", "", "", ""],
+                ["KN003", "nan", "", "", "", "", "", ""],
+                ["KN004", "Ø250 +0.1/-0.1", "None", "", "CMM", "not", "", ""],
+                ["KN005", "[ Position | ∅0.2 | A | B ]"],
+                ("KN006", "MIN 1", None, "", "", "", "", "", "extra")]
+        df = DataProcessorService.from_extracted_rows([list(HEADERS)] + [list(row) for row in rows])
+
+        karakterler = DataProcessorService().process_rows(rows)
+
+        assert karakterler == DataProcessorService().process_dataframe(df)
+        assert [k.item_no for k in karakterler] == ["KN001", "KN004", "KN005", "KN006"]
+
+    def test_does_not_build_dataframe(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("DataFrame oluşturuldu")
+
+        monkeypatch.setattr(pd, "DataFrame", fail)
+
+        karakterler = DataProcessorService().process_rows([["KN1", "MAX 6.3", "", "", "", "", "", ""]])
+
+        assert karakterler[0].upper_limit == 6.3
+
+
+class TestDimensionDedup:
+    def test_each_dimension_is_parsed_once(self, monkeypatch):
+        calls = []
+        original = OlcuYakalayici.isle
+
+        def counting_isle(self, olcu):
+            calls.append(olcu)
+            return original(self, olcu)
+
+        monkeypatch.setattr(OlcuYakalayici, "isle", counting_isle)
+        position = "[ Position | ∅0.2 | A | B | C ]"
+        rows = [[f"KN{i}", position if i % 4 else "25.55±0.1", "", "", "", "", "", ""] for i in range(40)]
+
+        service = DataProcessorService()
+        karakterler = service.process_rows(rows)
+
+        assert sorted(calls) == ["25.55±0.1", "[ Position | ∅0.2 | A | B | C ]"]
+        assert karakterler[1].parsed_dimension is karakterler[2].parsed_dimension
+        assert karakterler[1].dimension is karakterler[2].dimension
+        assert service.dedup_stats == {"satir": 40, "farkli_olcu": 2, "tekrar_orani": 0.95}
+
+    def test_parser_errors_are_reported_per_row(self):
+        class FailingParser:
+            def isle(self, olcu):
+                raise ValueError(olcu)
+
+        parser = DimensionDedupParser(FailingParser())
+
+        errors = []
+        for _ in range(3):
+            with pytest.raises(ValueError) as raised:
+                parser.isle("MAX 6.3")
+            errors.append(raised.value)
+        assert parser.stats()["farkli_olcu"] == 1
+        # Her tekrarda yeni hata objesi: traceback zinciri birikmez
+        assert errors[1] is not errors[2] and errors[2].args == ("MAX 6.3",)
+        assert len(traceback.extract_tb(errors[2].__traceback__)) == len(traceback.extract_tb(errors[1].__traceback__))
+
+
+class TestTeknikResimKarakteri:
+    def test_slotted_model_keeps_dataclass_api(self):
+        karakter = TeknikResimKarakteri(item_no="KN1", dimension="MAX 6.3", tooling="CALIPER")
+        karakter.actual = "5.1"
+
+        assert not hasattr(karakter, "__dict__")
+        assert TeknikResimKarakteri(**asdict(karakter)) == karakter
+        with pytest.raises(AttributeError):
+            karakter.unknown_field = 1
+
+    def test_repeated_text_fields_are_shared(self):
+        first = TeknikResimKarakteri("KN1", "MAX 6.3", "".join(["CALI", "PER"]), bp_zone="".join(["A", "1"]))
+        second = TeknikResimKarakteri("KN2", "MIN 1", "".join(["CAL", "IPER"]), bp_zone="".join(["A", "1"]))
+
+        assert first.tooling is second.tooling
+        assert first.bp_zone is second.bp_zone
+
+    def test_tolerance_type_is_shared_after_parsing(self):
+        class FreshFormatParser:
+            def isle(self, olcu):
+                return {"format": "".join(["geo", "metrik"])}
+
+        service = DataProcessorService()
+        first, second = (TeknikResimKarakteri(f"KN{i}", "MAX 6.3", "CALIPER") for i in range(2))
+        for karakter in (first, second):
+            service._parse_dimension(karakter, FreshFormatParser())
+
+        assert first.tolerance_type == "geometrik"
+        assert first.tolerance_type is second.tolerance_type
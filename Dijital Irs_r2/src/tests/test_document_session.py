@@ -0,0 +1,77 @@
+# tests/test_document_session.py
+import pytest
+import services.document_session as document_session
+from services.document_session import DocumentSession
+from services.data_processor import TeknikResimKarakteri
+from services.word_reader import WordReaderService
+from services.word_save_as import WordSaveAsService
+from tests.helpers import build_document
+
+
+class TestDocumentSession:
+    def test_reader_and_writer_share_one_parse(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "irs.docx")
+        build_document(path)
+
+        parses = []
+        original = document_session.Document
+
+        def counting_document(source):
+            parses.append(source)
+            return original(source)
+
+        monkeypatch.setattr(document_session, "Document", counting_document)
+
+        session = DocumentSession(path)
+        reader = WordReaderService()
+        rows = list(reader.iter_rows(path, session=session))
+
+        # Okuma iskelet paketi akış halinde tarar, doküman ağacı yazıcıya kadar kurulmaz
+        assert not session.is_parsed and parses == []
+        writer = WordSaveAsService()
+        assert writer.load_original_document(path, session=session)
+        assert parses == []
+
+        assert writer.current_document is not None
+        assert len(parses) == 1
+        assert writer.current_document is session.document
+        assert writer.table_index is session.table_index is reader.table_index
+        assert rows == WordReaderService().extract_tables(path, engine="xml")[1:]
+
+    def test_writer_updates_shared_document(self, tmp_path):
+        path = str(tmp_path / "irs.docx")
+        build_document(path)
+
+        session = DocumentSession(path)
+        list(WordReaderService().iter_rows(path, session=session))
+
+        writer = WordSaveAsService()
+        writer.load_original_document(path, session=session)
+        karakter = TeknikResimKarakteri(item_no="KN002", dimension="MAX 6.3", tooling="CALIPER", actual="5.1")
+        assert writer.update_actual_values([karakter])
+
+        saved = str(tmp_path / "saved.docx")
+        assert writer.save_document(saved)
+        rows = WordReaderService().extract_tables(saved)
+        assert [row[2] for row in rows if row[0] == "KN002"] == ["5.1"]
+
+    def test_html_is_converted_once(self, tmp_path, monkeypatch):
+        mammoth = pytest.importorskip("mammoth")
+        path = str(tmp_path / "irs.docx")
+        build_document(path)
+
+        calls = []
+        original = mammoth.convert_to_html
+
+        def counting_convert(stream, **kwargs):
+            calls.append(stream)
+            return original(stream, **kwargs)
+
+        monkeypatch.setattr(mammoth, "convert_to_html", counting_convert)
+
+        session = DocumentSession(path)
+        html = session.html()
+
+        assert "KN001" in html
+        assert session.html() is html
+        assert len(calls) == 1
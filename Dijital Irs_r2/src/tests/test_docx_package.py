@@ -0,0 +1,108 @@
+# tests/test_docx_package.py
+import io
+import os
+import struct
+import zipfile
+import zlib
+import pytest
+from docx import Document
+from services.docx_package import LazyPackage
+from services.document_session import DocumentSession
+from services.word_reader import WordReaderService
+from tests.helpers import break_package, build_document
+
+
+def _png(width=64, height=64):
+    """Sıkıştırılamayan içerikli geçerli bir PNG"""
+    raw = b"".join(b"\x00" + os.urandom(width * 3) for _ in range(height))
+
+    def chunk(kind, data):
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", zlib.crc32(kind + data))
+
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", header) +
+            chunk(b"IDAT", zlib.compress(raw)) + chunk(b"IEND", b""))
+
+
+def _build_scanned_document(path):
+    """Çizim taraması gömülü örnek IRS dokümanı"""
+    build_document(path)
+    doc = Document(path)
+    doc.add_picture(io.BytesIO(_png()))
+    doc.save(path)
+
+
+class TestLazyPackage:
+    def test_skeleton_skips_media(self, tmp_path):
+        path = str(tmp_path / "scan.docx")
+        _build_scanned_document(path)
+
+        package = LazyPackage(path)
+        skeleton = zipfile.ZipFile(io.BytesIO(package.skeleton()))
+        package.close()
+
+        media = [name for name in skeleton.namelist() if name.startswith("word/media/")]
+        assert media and list(package.skipped) == media
+        assert all(skeleton.read(name) == b"" for name in media)
+        assert Document(io.BytesIO(skeleton.fp.getvalue())).tables
+
+    def test_save_passes_media_through_raw(self, tmp_path):
+        path = str(tmp_path / "scan.docx")
+        saved = str(tmp_path / "saved.docx")
+        _build_scanned_document(path)
+
+        session = DocumentSession(path)
+        session.document.tables[0].cell(1, 2).text = "25.56"
+        session.save(saved)
+        session.release()
+
+        with zipfile.ZipFile(path) as original, zipfile.ZipFile(saved) as result:
+            assert result.testzip() is None
+            for name in original.namelist():
+                if name.startswith("word/media/"):
+                    assert result.getinfo(name).CRC == original.getinfo(name).CRC
+                    assert result.getinfo(name).compress_size == original.getinfo(name).compress_size
+                    assert result.read(name) == original.read(name)
+
+        rows = WordReaderService().extract_tables(saved)
+        assert rows[1][:3] == ["KN001", "25.55±0.1", "25.56"]
+
+    def test_save_over_original(self, tmp_path):
+        path = str(tmp_path / "scan.docx")
+        _build_scanned_document(path)
+
+        session = DocumentSession(path)
+        session.document.tables[0].cell(1, 2).text = "25.56"
+        session.save(path)
+
+        assert WordReaderService().extract_tables(path)[1][2] == "25.56"
+        assert not [name for name in os.listdir(tmp_path) if name != "scan.docx"]
+
+    def test_save_over_original_twice(self, tmp_path):
+        path = str(tmp_path / "scan.docx")
+        _build_scanned_document(path)
+        with zipfile.ZipFile(path) as original:
+            media = {name: original.read(name) for name in original.namelist()
+                     if name.startswith("word/media/")}
+
+        session = DocumentSession(path)
+        session.document.tables[0].cell(1, 2).text = "25.56"
+        session.save(path)
+        session.document.tables[0].cell(1, 2).text = "25.57"
+        session.save(path)
+        session.release()
+
+        with zipfile.ZipFile(path) as result:
+            assert result.testzip() is None
+            assert {name: result.read(name) for name in media} == media
+        assert WordReaderService().extract_tables(path)[1][2] == "25.57"
+
+    def test_broken_rels_are_repaired_in_skeleton(self, tmp_path):
+        path = str(tmp_path / "sharepoint.docx")
+        build_document(path)
+        break_package(path)
+
+        session = DocumentSession(path)
+
+        assert len(session.document.tables) == 1
+        assert len(session.repairs) == 2
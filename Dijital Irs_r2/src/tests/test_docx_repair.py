@@ -0,0 +1,95 @@
+# tests/test_docx_repair.py
+import io
+import json
+import os
+import pytest
+from docx import Document
+import services.docx_package as docx_package
+import services.docx_repair as docx_repair
+from services.document_session import DocumentSession
+from services.docx_repair import RepairLog, open_package, applied_repairs
+from services.word_reader import WordReaderService
+from tests.helpers import break_package, build_document
+
+class TestDocxRepair:
+    def test_broken_package_is_repaired_in_memory(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "sharepoint.docx")
+        build_document(path)
+        break_package(path)
+        with pytest.raises(Exception):
+            Document(path)
+
+        monkeypatch.setattr("tempfile.mkstemp", lambda *a, **k: pytest.fail("temp dosya kullanıldı"))
+        source, repairs = open_package(path)
+
+        assert isinstance(source, io.BytesIO)
+        assert len(repairs) == 2 and all("word/_rels/document.xml.rels" in r for r in repairs)
+        assert applied_repairs(path) == repairs
+        Document(source)
+
+    @pytest.mark.parametrize("engine", ["xml", "docx"])
+    def test_reader_reads_repaired_package(self, tmp_path, engine):
+        path = str(tmp_path / "sharepoint.docx")
+        build_document(path)
+        break_package(path)
+        reader = WordReaderService(engine=engine)
+
+        rows = reader.extract_tables(path)
+
+        assert [row[0] for row in rows[1:]] == ["KN001", "KN002", "KN004"]
+        assert len(reader.repairs) == 2
+
+    def test_clean_package_opens_from_path(self, tmp_path):
+        path = str(tmp_path / "irs.docx")
+        build_document(path)
+
+        assert open_package(path) == (path, [])
+        assert open_package(path) == (path, [])
+
+    def test_repair_log_survives_restart(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "sharepoint.docx")
+        build_document(path)
+        break_package(path)
+        repair_log = RepairLog(str(tmp_path))
+        monkeypatch.setattr(docx_repair, "REPAIR_LOG", repair_log)
+        _, repairs = open_package(path)
+        assert os.path.exists(repair_log.log_file)
+
+        # Uygulama yeniden açıldı: kayıt dosyadan okunur, .rels tekrar taranmaz
+        restarted = RepairLog(str(tmp_path))
+        for module in (docx_repair, docx_package):
+            monkeypatch.setattr(module, "REPAIR_LOG", restarted)
+        monkeypatch.setattr(docx_repair, "clean_rels", lambda *a: pytest.fail("dosya tekrar tarandı"))
+        monkeypatch.setattr(docx_package, "clean_rels", lambda *a: pytest.fail("dosya tekrar tarandı"))
+
+        source, reopened = open_package(path)
+        assert reopened == repairs and applied_repairs(path) == repairs
+        Document(source)
+
+        session = DocumentSession(path)
+        assert session.document.tables[0].rows[1].cells[0].text == "KN001"
+        assert session.repairs == repairs
+
+        # Dosya değişince kayıt kullanılmaz
+        os.utime(path, ns=(0, 0))
+        assert restarted.get(path) is None
+
+    def test_switching_project_folder_drops_previous_entries(self, tmp_path, monkeypatch):
+        first, second = tmp_path / "first", tmp_path / "second"
+        first.mkdir()
+        second.mkdir()
+        broken, clean = str(first / "sharepoint.docx"), str(second / "irs.docx")
+        build_document(broken)
+        break_package(broken)
+        build_document(clean)
+
+        repair_log = RepairLog(str(first))
+        monkeypatch.setattr(docx_repair, "REPAIR_LOG", repair_log)
+        open_package(broken)
+        repair_log.use_folder(str(second))
+        open_package(clean)
+
+        with open(repair_log.log_file, encoding="utf-8") as f:
+            stored = json.load(f)["entries"]
+        assert list(stored) == [docx_repair._file_key(clean)]
+        assert repair_log.get(broken) is None
@@ -0,0 +1,72 @@
+# tests/test_karakter_repository.py
+import pytest
+from services.data_processor import TeknikResimKarakteri
+from services.karakter_repository import KarakterRepository, is_out_of_tolerance
+
+
+def _karakter(item_no, dimension="25.55±0.1", actual=None, lower=25.45, upper=25.65):
+    return TeknikResimKarakteri(item_no=item_no, dimension=dimension, tooling="CALIPER",
+                                actual=actual, lower_limit=lower, upper_limit=upper)
+
+
+@pytest.fixture
+def repository():
+    return KarakterRepository([
+        _karakter("KN001", actual="25.50"),
+        _karakter("KN002", dimension="MAX 6.3", lower=None, upper=6.3),
+        _karakter("KN003", actual="25.40/25.60"),
+    ])
+
+
+class TestKarakterRepository:
+    def test_lookup_by_item_no_identifier_and_position(self, repository):
+        karakter = repository.get_by_item_no("KN002")
+
+        assert karakter is repository[1]
+        assert repository.get_by_identifier("MAX 6.3_KN002") is karakter
+        assert repository.position_of(karakter) == 1
+        assert repository.get_by_position(5) is None
+        assert repository.get_by_item_no("KN999") is None
+
+    def test_secondary_sets_follow_updates(self, repository):
+        assert [k.item_no for k in repository.get_measured()] == ["KN001", "KN003"]
+        assert [k.item_no for k in repository.get_tolerance_violations()] == ["KN003"]
+
+        karakter = repository.get_by_item_no("KN002")
+        assert repository.set_actual(karakter, "6.5")
+        assert repository.get_unmeasured_count() == 0
+        assert [k.item_no for k in repository.get_tolerance_violations()] == ["KN002", "KN003"]
+
+        repository[2].actual = None
+        repository.refresh(repository[2])
+        assert [k.item_no for k in repository.get_unmeasured()] == ["KN003"]
+        assert repository.get_tolerance_violation_count() == 1
+
+    def test_statistics_counters_follow_single_updates(self, repository, monkeypatch):
+        assert repository.get_statistics() | {"completion_percentage": 0} == {
+            "total": 3, "measured": 2, "unmeasured": 1, "completion_percentage": 0,
+            "tolerance_violations": 1, "tolerance_compliant": 1, "no_tolerance_defined": 0,
+            "tolerance_typed": 0, "parsed_dimensions": 0}
+
+        # Sayaçlar yalnızca değişen karakter üzerinden güncellenir
+        monkeypatch.setattr(KarakterRepository, "__iter__", lambda self: pytest.fail("tam tarama"))
+        repository.set_actual(repository[1], "6.0")
+        repository.set_actual(repository[2], "25.50/25.60")
+        repository.set_actual(repository[0], "/")
+        stats = repository.get_statistics()
+
+        assert (stats["measured"], stats["tolerance_compliant"], stats["tolerance_violations"]) == (3, 2, 0)
+        assert stats["no_tolerance_defined"] == 1
+
+    def test_duplicate_item_no_returns_first_row(self):
+        first, second = _karakter("KN001"), _karakter("KN001", dimension="∅8")
+        repository = KarakterRepository()
+        repository.extend([first, second])
+
+        assert repository.get_by_item_no("KN001") is first
+        assert repository.get_by_identifier("∅8_KN001") is second
+        assert repository.set_actual(_karakter("KN001"), "1") is False
+
+    def test_non_numeric_actual_is_within_tolerance(self):
+        assert not is_out_of_tolerance(_karakter("KN001", actual="OK"))
+        assert is_out_of_tolerance(_karakter("KN001", actual="25,70"))
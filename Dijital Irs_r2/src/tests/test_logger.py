@@ -0,0 +1,62 @@
+# tests/test_logger.py
+import json
+import pytest
+from utils.logger import get_logger, configure_logging
+
+
+@pytest.fixture(autouse=True)
+def _reset_logging():
+    yield
+    configure_logging(level="INFO")
+
+
+class TestStructuredLogger:
+    def test_disabled_debug_does_not_format(self, capsys):
+        configure_logging(level="INFO")
+        log = get_logger("tests.logger")
+
+        class Exploding:
+            def __str__(self):
+                raise AssertionError("kapalı seviyede biçimlendirme yapıldı")
+
+        log.debug("Satır: %s", Exploding())
+        assert log.debug_enabled is False
+        assert capsys.readouterr().out == ""
+
+    def test_level_flags_follow_reconfiguration(self, capsys):
+        configure_logging(level="INFO")
+        log = get_logger("tests.logger")
+        assert log.debug_enabled is False
+
+        configure_logging(level="DEBUG")
+        log.debug("Satır: %s", "KN1")
+        assert log.debug_enabled is True
+        assert capsys.readouterr().out == "Satır: KN1\n"
+
+        configure_logging(level="WARNING")
+        assert log.info_enabled is False
+
+    def test_console_output_matches_print(self, capsys):
+        configure_logging(level="DEBUG")
+        log = get_logger("tests.logger")
+
+        log.info("✓ %s karakter başarıyla işlendi", 3)
+        log.debug("Satır eklendi: %s", "KN1", kolon=8)
+
+        out = capsys.readouterr().out.splitlines()
+        assert out == ["✓ 3 karakter başarıyla işlendi", "Satır eklendi: KN1  kolon=8"]
+
+    def test_json_lines_sink(self, tmp_path):
+        json_path = tmp_path / "log.jsonl"
+        configure_logging(level="INFO", json_path=str(json_path), console=False)
+        log = get_logger("tests.logger")
+
+        log.warning("⚠ Kaydetme hatası: %s", "disk dolu", item_no="KN5")
+        log.log_operation("Word export", {"karakter": 12})
+        configure_logging(level="INFO")
+
+        records = [json.loads(line) for line in json_path.read_text(encoding="utf-8").splitlines()]
+        assert records[0]["level"] == "WARNING"
+        assert records[0]["message"] == "⚠ Kaydetme hatası: disk dolu"
+        assert records[0]["fields"] == {"item_no": "KN5"}
+        assert records[1]["fields"] == {"karakter": 12}
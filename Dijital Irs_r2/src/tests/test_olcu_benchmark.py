@@ -0,0 +1,36 @@
+# tests/test_olcu_benchmark.py
+from collections import Counter
+from services.olcu_benchmark import (KATEGORI_BEKLENTILERI, baseline_kaydet, baseline_yukle, calistir,
+                                     regresyon_kontrol, rapor)
+from services.olcu_veri_seti import generate_labeled_olcu_dataset
+
+
+class TestOlcuVeriSeti:
+    def test_every_placeholder_is_filled(self):
+        veri = generate_labeled_olcu_dataset(6000, seed=1)
+
+        assert len(veri) == 6000
+        assert not [olcu for _, olcu in veri if "{" in olcu]
+        assert Counter(kategori for kategori, _ in veri)["form"] == 800
+        assert set(kategori for kategori, _ in veri) == set(KATEGORI_BEKLENTILERI)
+        assert generate_labeled_olcu_dataset(300, seed=2) == generate_labeled_olcu_dataset(300, seed=2)
+
+
+class TestOlcuBenchmark:
+    def test_report_and_regression_gate(self, tmp_path):
+        sonuc = calistir(600, seed=0)
+
+        assert sum(k.adet for k in sonuc.kategoriler.values()) == 600
+        assert sonuc.kategoriler["form"].etiketler == {"Form": 80}
+        assert sonuc.beklenmeyenler("dimensional") == {}
+        assert sonuc.p50_us <= sonuc.p99_us
+        assert "Karışıklık raporu" in rapor(sonuc)
+
+        yol = str(tmp_path / "baseline.json")
+        assert baseline_kaydet(sonuc, yol)
+        baseline = baseline_yukle(yol)
+        assert regresyon_kontrol(sonuc, baseline)[0]
+
+        baseline["throughput"] = sonuc.throughput * 2
+        assert not regresyon_kontrol(sonuc, baseline, esik_yuzde=20)[0]
+        assert regresyon_kontrol(sonuc, baseline, esik_yuzde=60)[0]
@@ -0,0 +1,170 @@
+# tests/test_olcu_parser.py
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import pytest
+import services.olcu_parser as olcu_parser
+from services.data_processor import DataProcessorService
+from services.olcu_parser import PAYLASILAN_ONBELLEK, OlcuOnbellegi, OlcuYakalayici, cerceve_ayristir
+
+ORNEKLER = [
+    "[ Straightness (M) | ∅0.01 (M) ]",
+    "[ FLATNESS | 0.05 ]",
+    "[ Perpendicularity (M) | ∅0.03 (M) | A (M) ]",
+    "[ Position | ∅0.02 | A | B | C ]",
+    "[ PROFILE OF A LINE | 1(U)0.6 | A ]",
+    "[ Profile of a Surface | 0.2 | B ]",
+    "[ Total Runout | 0.02 | A-B ]",
+    "⟂ 0.01",
+    "25.55±0.1",
+    "Ø250 +0.1/-0.1",
+    "MAX 6.3",
+    "R2.5 MIN",
+    "M8x1.25-6H",
+]
+
+
+class TestOlcuYakalayici:
+    def test_isle_output(self):
+        yakalayici = OlcuYakalayici()
+
+        assert yakalayici.isle("25.55±0.1") == {
+            "nominal": 25.55, "alt_limit": 25.55 - 0.1, "ust_limit": 25.55 + 0.1, "format": "toleranslı"}
+        assert yakalayici.isle("Ø250 +0.1/-0.2") == {
+            "nominal": 250.0, "alt_limit": 250.0 - 0.2, "ust_limit": 250.0 + 0.1, "format": "artı-eksi"}
+        assert yakalayici.isle("[ Perpendicularity (M) | ∅0.03 (M) | A (M) ]") == {
+            "tolerans": 0.03, "tip": "Oryantasyon", "alt_tip": "Perpendicularity", "sembol": "∅",
+            "referanslar": ["A"], "ozellikler": ["M", "M", "M"], "format": "geometrik"}
+        assert yakalayici.isle("M8x1.25-6H") is None
+
+    def test_results_do_not_leak_between_calls(self):
+        yakalayici = OlcuYakalayici()
+
+        unilateral = yakalayici.isle("[ PROFILE OF A LINE | 1(U)0.6 | A ]")
+        profil = yakalayici.isle("[ Profile of a Surface | 0.2 | B ]")
+
+        assert unilateral["unilateral_deger"] == 0.6
+        assert "unilateral_deger" not in profil
+        profil["referanslar"].append("X")
+        assert "X" not in yakalayici.isle("[ Profile of a Surface | 0.2 | B ]")["referanslar"]
+
+    def test_result_objects_are_immutable(self):
+        sonuc = OlcuYakalayici().eslestir("MAX 6.3")
+
+        assert sonuc.format == "maksimum"
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            sonuc.alanlar = ()
+
+    def test_one_instance_serves_a_thread_pool(self):
+        yakalayici = OlcuYakalayici()
+        olculer = ORNEKLER * 200
+        expected = [OlcuYakalayici().isle(olcu) for olcu in olculer]
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(yakalayici.isle, olculer))
+
+        assert results == expected
+
+    def test_classifier_routes_to_matching_formats_only(self):
+        yakalayici = OlcuYakalayici()
+
+        assert [type(f).__name__ for f in yakalayici.adaylar("25.55±0.1")] == ["EsitToleransliOlcu"]
+        assert [type(f).__name__ for f in yakalayici.adaylar("Ø250 +/-0.1")] == ["EsitToleransliOlcu", "ArtiEksiOlcu"]
+        assert yakalayici.adaylar("M8x1.25-6H") == []
+        # Örtüşen anahtar kelimeler ve İ ile yazılmış MİN de yakalanır
+        assert yakalayici.isle("TPERPENDICULARITY 0.1")["alt_tip"] == "Perpendicularity"
+        assert yakalayici.isle("MİN 5")["alt_limit"] == 5.0
+
+    def test_dispatch_matches_trying_every_format(self):
+        yakalayici = OlcuYakalayici()
+
+        def sirayla(olcu):
+            for format_tipi in yakalayici.format_tipleri:
+                sonuc = format_tipi.eslestir(olcu)
+                if sonuc is not None:
+                    return sonuc.degerler()
+            return None
+
+        for olcu in ORNEKLER + ["R5 MAX +0.1/-0.2", "[ ANG | 0.1 | TP ]", "CIRCULAR RUNOUT ⟂ 0.1 MIN"]:
+            assert yakalayici.isle(olcu) == sirayla(olcu)
+
+    def test_isle_many_matches_isle(self):
+        yakalayici = OlcuYakalayici(None)
+        olculer = ORNEKLER + ["R5 MAX +0.1/-0.2", "Ø12 +/-0.05", "MİN 5", "25±0.1\n⟂ 0.01", "", "M8"]
+        seri = pd.Series(olculer * 3, index=[7, 7, 3] * len(olculer))
+
+        sonuclar = yakalayici.isle_many(seri)
+
+        assert sonuclar.index.equals(seri.index)
+        assert sonuclar.tolist() == [yakalayici.isle(olcu) for olcu in seri]
+
+    def test_isle_many_maps_non_strings_to_none(self):
+        yakalayici = OlcuYakalayici(None)
+
+        sonuclar = yakalayici.isle_many(pd.Series(["MAX 6.3", None, float("nan"), 5]))
+
+        assert sonuclar.tolist() == [yakalayici.isle("MAX 6.3"), None, None, None]
+
+    def test_frame_is_parsed_once_for_all_gdt_candidates(self, monkeypatch):
+        cerceve = cerceve_ayristir("[ Total Runout (M) | ∅0.02 (M) | A-B ]")
+        assert cerceve.koseli == ("TOTAL RUNOUT (M)", "∅0.02 (M)", 0.02)
+        assert cerceve.koseli_ikili is None
+        assert cerceve.referanslar() == ("A", "B")
+        assert cerceve.ozellikler() == ("M", "M")
+        # Referanslar metin sırasını korur
+        assert cerceve_ayristir("[ Position | ∅0.2 | C | A | B | A ]").referanslar() == ("C", "A", "B")
+        # Birden fazla çerçeve: köşeli desenlere düşülür
+        assert cerceve_ayristir("[ FLATNESS | 0.1 ] [ X | 1 ]").koseli_ikili == ("FLATNESS", "0.1", 0.1)
+
+        cagrilar = []
+        monkeypatch.setattr(olcu_parser, "cerceve_ayristir",
+                            lambda olcu: cagrilar.append(olcu) or cerceve_ayristir(olcu))
+        yakalayici = OlcuYakalayici(None)
+        assert [type(f).__name__ for f in yakalayici.adaylar("[ Straightness TP | 0 ]")] == [
+            "FormToleransi", "LokasyonToleransi"]
+        assert yakalayici.isle("[ Straightness TP | 0 ]") is None
+        assert cagrilar == ["[ Straightness TP | 0 ]"]
+
+
+class TestOlcuOnbellegi:
+    def test_counts_hits_misses_and_evictions(self):
+        onbellek = OlcuOnbellegi(maxsize=2)
+        yakalayici = OlcuYakalayici(onbellek)
+
+        for olcu in ["MAX 6.3", "MIN 1", "MAX 6.3", "25±0.1", "MIN 1"]:
+            yakalayici.isle(olcu)
+
+        stats = onbellek.istatistik()
+        assert (stats["isabet"], stats["iska"], stats["cikarilan"], stats["boyut"]) == (1, 4, 2, 2)
+        assert yakalayici.isle("M8x1.25-6H") is None
+        assert yakalayici.isle("M8x1.25-6H") is None
+        assert onbellek.istatistik()["isabet"] == 2
+
+    def test_cache_is_opt_in(self):
+        paylasilan_boyut = len(PAYLASILAN_ONBELLEK)
+        assert OlcuYakalayici().onbellek is None
+        assert DataProcessorService().olcu_parser.onbellek is None
+
+        onbellek = OlcuOnbellegi()
+        service = DataProcessorService(onbellek=onbellek)
+        service.process_rows([["KN1", "MAX 6.3", "", "", "", "", "", ""]])
+
+        assert len(onbellek) == 1
+        assert len(PAYLASILAN_ONBELLEK) == paylasilan_boyut
+
+    def test_cached_results_are_copied(self):
+        yakalayici = OlcuYakalayici(OlcuOnbellegi())
+        beklenen = OlcuYakalayici(None).isle("[ Position | ∅0.02 | A | B | C ]")
+
+        ilk = yakalayici.isle("[ Position | ∅0.02 | A | B | C ]")
+        ilk["referanslar"].clear()
+
+        assert yakalayici.isle("[ Position | ∅0.02 | A | B | C ]") == beklenen
+
+    def test_warm_up_from_stored_results(self):
+        onbellek = OlcuOnbellegi()
+        sonuc = OlcuYakalayici(None).isle("[ Total Runout | 0.02 | A-B ]")
+
+        assert onbellek.isit([("[ Total Runout | 0.02 | A-B ]", sonuc), ("M8", None)]) == 2
+        assert OlcuYakalayici(onbellek).isle("[ Total Runout | 0.02 | A-B ]") == sonuc
+        assert onbellek.istatistik()["iska"] == 0
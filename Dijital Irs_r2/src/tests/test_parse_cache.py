@@ -0,0 +1,66 @@
+# tests/test_parse_cache.py
+import json
+from services.data_processor import DataProcessorService
+from services.olcu_parser import OlcuOnbellegi, OlcuYakalayici
+from services.parse_cache import DocumentParseCache, CACHE_FILE_NAME
+from services.word_reader import WordReaderService
+
+
+ROWS = [
+    ["ITEM NO", "DIMENSION", "ACTUAL", "BADGE", "TOOLING", "REMARKS", "B/P ZONE", "INSP. LEVEL"],
+    ["KN001", "25.55±0.1", "", "", "CALIPER", "", "A1", "100%"],
+    ["KN002", "[ Position | ∅0.2 | A | B ]", "", "", "CMM", "", "B2", "100%"],
+]
+
+
+class TestDocumentParseCache:
+    def setup_method(self):
+        self.processor = DataProcessorService()
+
+    def _karakterler(self):
+        return self.processor.process_dataframe(DataProcessorService.from_extracted_rows(ROWS))
+
+    def test_round_trip_restores_parsed_karakterler(self, tmp_path):
+        docx_path = tmp_path / "irs.docx"
+        docx_path.write_bytes(b"docx-bytes")
+        karakterler = self._karakterler()
+
+        DocumentParseCache(str(tmp_path)).store(str(docx_path), ROWS, karakterler)
+        restored = DocumentParseCache(str(tmp_path)).load_karakterler(str(docx_path))
+
+        assert restored == karakterler
+        assert restored[1].parsed_dimension["referanslar"] == karakterler[1].parsed_dimension["referanslar"]
+
+    def test_changed_document_is_a_miss(self, tmp_path):
+        docx_path = tmp_path / "irs.docx"
+        docx_path.write_bytes(b"docx-bytes")
+        DocumentParseCache(str(tmp_path)).store(str(docx_path), ROWS, self._karakterler())
+
+        docx_path.write_bytes(b"docx-bytes-v2")
+
+        assert DocumentParseCache(str(tmp_path)).load_karakterler(str(docx_path)) is None
+
+    def test_parser_version_change_invalidates(self, tmp_path):
+        docx_path = tmp_path / "irs.docx"
+        docx_path.write_bytes(b"docx-bytes")
+        DocumentParseCache(str(tmp_path)).store(str(docx_path), ROWS, self._karakterler())
+
+        cache_file = tmp_path / CACHE_FILE_NAME
+        data = json.loads(cache_file.read_text(encoding="utf-8"))
+        data["parser_version"] = -1
+        cache_file.write_text(json.dumps(data), encoding="utf-8")
+
+        assert DocumentParseCache(str(tmp_path)).load_karakterler(str(docx_path)) is None
+
+    def test_parsed_dimensions_warm_parser_cache(self, tmp_path):
+        docx_path = tmp_path / "irs.docx"
+        docx_path.write_bytes(b"docx-bytes")
+        karakterler = self._karakterler()
+        DocumentParseCache(str(tmp_path)).store(str(docx_path), ROWS, karakterler)
+
+        onbellek = OlcuOnbellegi()
+        assert onbellek.isit(DocumentParseCache(str(tmp_path)).parsed_dimensions()) == 2
+
+        yakalayici = OlcuYakalayici(onbellek)
+        assert yakalayici.isle(ROWS[2][1]) == karakterler[1].parsed_dimension
+        assert onbellek.istatistik()["isabet"] == 1
@@ -0,0 +1,94 @@
+# tests/test_parsed_dimension_store.py
+import sqlite3
+from contextlib import closing
+import services.parsed_dimension_store as parsed_dimension_store
+from services.auto_save_recovery import AutoSaveRecoveryService
+from services.data_processor import DataProcessorService
+from services.olcu_parser import OlcuOnbellegi, OlcuYakalayici
+from services.parsed_dimension_store import ParsedDimensionStore
+from services.tolerance_engine import actual_values, write_actual
+
+
+ROWS = [
+    ["ITEM NO", "DIMENSION", "ACTUAL", "BADGE", "TOOLING", "REMARKS", "B/P ZONE", "INSP. LEVEL"],
+    ["KN001", "25.55±0.1", "", "", "CALIPER", "", "A1", "100%"],
+    ["KN002", "[ Position | ∅0.2 | A | B ]", "", "", "CMM", "", "B2", "100%"],
+    ["KN003", "M8x1.25-6H", "", "", "GAUGE", "", "C3", "100%"],
+]
+
+
+def _karakterler():
+    processor = DataProcessorService()
+    return processor.process_dataframe(DataProcessorService.from_extracted_rows(ROWS))
+
+
+class TestParsedDimensionStore:
+    def test_round_trip_is_shared_between_projects(self, tmp_path):
+        db_path = str(tmp_path / "Report" / "parsed_dimensions.db")
+        karakterler = _karakterler()
+
+        assert ParsedDimensionStore(db_path).store_karakterler(karakterler) == 3
+        store = ParsedDimensionStore(db_path)
+        found = store.get_many(["  25.55±0.1 ", "M8x1.25-6H", "MAX 6.3"])
+
+        assert found == {"25.55±0.1": karakterler[0].parsed_dimension, "M8x1.25-6H": None}
+        assert dict(store.items()) == {k.dimension: k.parsed_dimension for k in karakterler}
+        assert len(list(store.items(limit=1))) == 1
+
+    def test_other_parser_versions_are_ignored_and_pruned(self, tmp_path, monkeypatch):
+        store = ParsedDimensionStore(str(tmp_path / "parsed_dimensions.db"))
+        store.put_many([("MAX 6.3", {"format": "maksimum"})])
+
+        monkeypatch.setattr(parsed_dimension_store, "PARSER_VERSION", 999)
+        assert store.get_many(["MAX 6.3"]) == {}
+        assert store.count() == 0
+        assert store.prune_old_versions() == 1
+
+    def test_store_warms_parser_cache(self, tmp_path):
+        store = ParsedDimensionStore(str(tmp_path / "parsed_dimensions.db"))
+        karakterler = _karakterler()
+        store.store_karakterler(karakterler)
+
+        onbellek = OlcuOnbellegi()
+        assert onbellek.isit(store.items(onbellek.maxsize)) == 3
+        yakalayici = OlcuYakalayici(onbellek)
+
+        assert [yakalayici.isle(k.dimension) for k in karakterler] == [k.parsed_dimension for k in karakterler]
+        assert onbellek.istatistik()["iska"] == 0
+
+    def test_warm_keeps_most_recent_dimensions(self, tmp_path):
+        store = ParsedDimensionStore(str(tmp_path / "parsed_dimensions.db"))
+        store.put_many([("OLD MAX 1", None), ("MAX 6.3", None), ("25.4±0.1", None)])
+        with closing(sqlite3.connect(store.db_path)) as conn, conn:
+            for age, dimension in enumerate(["25.4±0.1", "MAX 6.3", "OLD MAX 1"]):
+                conn.execute("UPDATE parsed_dimensions SET updated_at = datetime('now', ?) WHERE dimension = ?",
+                             (f"-{age} days", dimension))
+
+        assert [d for d, _ in store.items(limit=2)] == ["MAX 6.3", "25.4±0.1"]
+
+        onbellek = OlcuOnbellegi(maxsize=2)
+        onbellek.isit(store.items())
+        assert list(onbellek._kayitlar) == ["MAX 6.3", "25.4±0.1"]
+
+        # Projenin kendi kayıtları en son eklenir, zaten varsa sona taşınır
+        assert onbellek.isit([("MAX 6.3", None)]) == 0
+        onbellek.isit([("M8x1.25-6H", None)])
+        assert list(onbellek._kayitlar) == ["MAX 6.3", "M8x1.25-6H"]
+
+
+class TestAutoSaveRecovery:
+    def test_backup_keeps_parse_results(self, tmp_path):
+        service = AutoSaveRecoveryService(str(tmp_path))
+        karakterler = _karakterler()
+        write_actual(karakterler[0], "25.6 / 25.7")
+
+        service.update_data(karakterler)
+        service.manual_save()
+        service.stop_auto_save()
+
+        # Türetilmiş parsed_actual yedeğe yazılmaz, kurtarmada yeniden hesaplanır
+        assert all("parsed_actual" not in data for data in service.current_data["karakterler"])
+        recovered = service.recover_data()
+        assert recovered == karakterler
+        assert recovered[0].parsed_actual is None
+        assert actual_values(recovered[0]) == (25.6, 25.7)
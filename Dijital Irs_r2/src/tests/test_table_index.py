@@ -0,0 +1,66 @@
+# tests/test_table_index.py
+from docx import Document
+from services.docx_xml import iter_body_tables
+from services.table_index import TableIndex, build_table_index
+from services.word_reader import WordReaderService, HEADERS
+from services.word_save_as import WordSaveAsService
+from services.data_processor import DataProcessorService
+
+
+def _build_document(path):
+    """Antet tablosu + header'lı muayene tablosu + header'sız devam tablosu"""
+    doc = Document()
+
+    title = doc.add_table(rows=4, cols=3)
+    title.cell(0, 0).text = "PART NO"
+    title.cell(3, 0).text = "KN999"
+
+    table = doc.add_table(rows=5, cols=8)
+    for idx, header in enumerate(HEADERS):
+        table.rows[0].cells[idx].text = header
+    for row_idx, item_no in [(1, "KN001"), (2, "KN002"), (4, "KN003")]:
+        table.cell(row_idx, 0).text = item_no
+        table.cell(row_idx, 1).text = "25.55±0.1"
+    table.cell(3, 0).text = "NOTE"
+
+    continued = doc.add_table(rows=1, cols=8)
+    continued.cell(0, 0).text = "KN004"
+    continued.cell(0, 1).text = "MAX 6.3"
+
+    doc.save(path)
+
+
+class TestTableIndex:
+    def test_index_classifies_tables(self, tmp_path):
+        path = str(tmp_path / "irs.docx")
+        _build_document(path)
+
+        index = build_table_index(iter_body_tables(path))
+
+        assert [info.position for info in index.tables] == [0, 1, 2]
+        title, inspection, continued = index.tables
+        # Antet tablosunun alt satırındaki KN satırı da bulunur, ACTUAL kolonu yoktur
+        assert title.kn_ranges == [[3, 4]] and title.actual_col is None
+        assert inspection.kn_ranges == [[1, 3], [4, 5]]
+        assert (inspection.item_no_col, inspection.actual_col) == (0, 2)
+        assert continued.continued and continued.actual_col == 2
+        assert index.kn_row_count == 5
+        assert TableIndex.from_dict(index.to_dict()) == index
+
+    def test_writer_reuses_reader_index(self, tmp_path):
+        path = str(tmp_path / "irs.docx")
+        _build_document(path)
+        reader = WordReaderService()
+        rows = reader.extract_tables(path)
+        karakterler = DataProcessorService().process_dataframe(DataProcessorService.from_extracted_rows(rows))
+        for karakter in karakterler:
+            karakter.actual = "1"
+
+        writer = WordSaveAsService()
+        writer.load_original_document(path, reader.table_index)
+        assert writer.update_actual_values(karakterler)
+
+        tables = writer.current_document.tables
+        assert [row[0] for row in rows[1:]] == ["KN999", "KN001", "KN002", "KN003", "KN004"]
+        assert tables[1].cell(1, 2).text == "1" and tables[2].cell(0, 2).text == "1"
+        assert tables[0].cell(3, 2).text == ""
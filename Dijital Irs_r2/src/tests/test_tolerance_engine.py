@@ -0,0 +1,73 @@
+# tests/test_tolerance_engine.py
+import math
+import services.tolerance_engine as tolerance_engine
+from services.data_processor import TeknikResimKarakteri
+from services.karakter_repository import KarakterRepository, is_out_of_tolerance
+from services.tolerance_engine import actual_values, evaluate, evaluate_karakterler, flatten_actuals, parse_actual
+from services.word_save_as import WordSaveAsService
+
+
+def _karakter(actual, lower=25.45, upper=25.65):
+    return TeknikResimKarakteri(item_no="KN001", dimension="25.55±0.1", tooling="CALIPER",
+                                actual=actual, lower_limit=lower, upper_limit=upper)
+
+
+class TestToleranceEngine:
+    def test_flat_values_with_offsets(self):
+        result = evaluate(lower=[1.0, math.nan, 0.0], upper=[2.0, 5.0, math.nan],
+                          values=[1.5, 2.5, 6.0, 4.0, -1.0], offsets=[0, 2, 4, 5],
+                          numeric=[True, True, True, False, True])
+
+        assert result.value_ok.tolist() == [True, False, False, True, False]
+        assert result.karakter_ok.tolist() == [False, False, False]
+        assert result.values_ok(1) == [False, True]
+        assert result.value_counts.tolist() == [2, 2, 1]
+
+    def test_multi_value_and_non_numeric_actuals(self):
+        assert parse_actual("25.4/ 25,6 /").values == (25.4, 25.6)
+        assert flatten_actuals([(25.4, 25.6), (), (None,)])[1:] == ([True, True, False], [0, 2, 2, 3])
+
+        karakterler = [_karakter("25.50"), _karakter("25.40/25.60"), _karakter("OK"),
+                       _karakter(None), _karakter("99", lower=None, upper=None), _karakter("nan")]
+        result = evaluate_karakterler(karakterler)
+
+        assert result.karakter_ok.tolist() == [True, False, True, True, True, False]
+        assert result.values_ok(1) == [False, True]
+        assert result.has_limits.tolist() == [True] * 4 + [False, True]
+
+    def test_all_consumers_agree(self):
+        service = WordSaveAsService()
+        karakterler = [_karakter(actual) for actual in ["25.50", "25,70", "25.40/25.60", "OK", "/", None]]
+        result = evaluate_karakterler(karakterler)
+
+        for position, karakter in enumerate(karakterler):
+            assert is_out_of_tolerance(karakter) is not bool(result.karakter_ok[position])
+            if karakter.actual:
+                assert service.check_multiple_values_tolerance(karakter.actual, karakter)[0] == result.values_ok(position)
+
+        assert service.get_statistics(karakterler) | {"completion_percentage": 0} == {
+            "total": 6, "measured": 5, "unmeasured": 1, "completion_percentage": 0,
+            "tolerance_violations": 2, "tolerance_compliant": 2, "no_tolerance_defined": 1,
+            "tolerance_typed": 0, "parsed_dimensions": 0}
+
+
+class TestParsedActualCache:
+    def test_actual_is_parsed_once_and_invalidated_on_change(self, monkeypatch):
+        karakter = _karakter(None)
+        repository = KarakterRepository([karakter])
+        repository.set_actual(karakter, "25.40/25,60")
+        assert karakter.parsed_actual == ("25.40/25,60", (25.4, 25.6))
+
+        parsed = []
+        monkeypatch.setattr(tolerance_engine, "parse_actual",
+                            lambda actual: parsed.append(actual) or parse_actual(actual))
+        WordSaveAsService().get_statistics(repository)
+        evaluate_karakterler([karakter])
+        assert parsed == []
+
+        # Dışarıdan atanan değer bir sonraki okumada yeniden parse edilir
+        karakter.actual = "OK"
+        assert actual_values(karakter) == (None,)
+        assert actual_values(karakter) == (None,)
+        assert parsed == ["OK"]
+        assert karakter == _karakter("OK")
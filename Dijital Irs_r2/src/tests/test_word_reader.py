@@ -0,0 +1,63 @@
+# tests/test_word_reader.py
+import pytest
+from docx import Document
+from services.data_processor import DataProcessorService
+from services.docx_xml import iter_docx_rows
+from services.word_reader import WordReaderService, HEADERS
+from tests.helpers import build_document
+
+
+class TestWordReaderService:
+    def setup_method(self):
+        self.reader = WordReaderService()
+
+    def test_xml_engine_matches_docx_engine(self, tmp_path):
+        path = str(tmp_path / "irs.docx")
+        build_document(path)
+
+        xml_rows = self.reader.extract_tables(path, engine="xml")
+        docx_rows = self.reader.extract_tables(path, engine="docx")
+
+        assert xml_rows == docx_rows
+        assert [row[0] for row in xml_rows[1:]] == ["KN001", "KN002", "KN004"]
+        assert all(len(row) == len(HEADERS) for row in xml_rows)
+
+    def test_xml_engine_falls_back_to_docx(self, tmp_path, monkeypatch):
+        path = str(tmp_path / "irs.docx")
+        build_document(path)
+
+        def broken(*args, **kwargs):
+            raise ValueError("bozuk paket")
+
+        monkeypatch.setattr("services.word_reader.iter_body_tables", broken)
+        rows = self.reader.extract_tables(path)
+
+        assert [row[0] for row in rows[1:]] == ["KN001", "KN002", "KN004"]
+
+    def test_iter_docx_rows_matches_row_cells(self, tmp_path):
+        path = str(tmp_path / "irs.docx")
+        build_document(path)
+        table = Document(path).tables[0]
+
+        expected = [[cell._tc for cell in row.cells] for row in table.rows]
+        actual = [[cell._tc for cell in row_cells] for row_cells in iter_docx_rows(table)]
+
+        assert actual == expected
+
+    def test_streaming_matches_batch_pipeline(self, tmp_path):
+        path = str(tmp_path / "irs.docx")
+        build_document(path)
+
+        rows = self.reader.extract_tables(path)
+        expected = DataProcessorService().process_dataframe(DataProcessorService.from_extracted_rows(rows))
+
+        stream = DataProcessorService().iter_karakterler(self.reader.iter_rows(path))
+        first = next(stream)
+
+        assert first == expected[0]
+        assert [first] + list(stream) == expected
+        assert [info.position for info in self.reader.table_index.tables] == [0]
+
+    @pytest.mark.parametrize("engine", ["xml", "docx"])
+    def test_missing_file_returns_empty_list(self, tmp_path, engine):
+        assert self.reader.extract_tables(str(tmp_path / "yok.docx"), engine=engine) == []
@@ -4,11 +4,16 @@ Word dokümanı görüntüleyici component'i - WebView ile HTML rendering
 """
 import customtkinter as ctk
 import os
+import sys
 import tempfile
 import webbrowser
 from pathlib import Path
 from tkinter import messagebox
 
+# Servis importları için path ekleme
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+from services.docx_xml import iter_docx_rows
+
 # Word to HTML conversion için
 try:
     from docx import Document
@@ -35,6 +40,8 @@ class DocumentViewer(ctk.CTkFrame):
         
         self.current_html_file = None
         self.current_html_content = None
+        self.table_index = None
+        self.session = None
         self.current_zoom = 1.0
         
         self.setup_ui()
@@ -155,8 +162,17 @@ class DocumentViewer(ctk.CTkFrame):
         """
         self.webview.load_html(initial_html)
     
-    def load_document(self, file_path: str):
-        """Word dokümanını yükler ve görüntüler"""
+    def load_document(self, file_path: str, table_index=None, session=None):
+        """
+        Word dokümanını yükler ve görüntüler
+        
+        Args:
+            file_path: Word dosyası yolu
+            table_index: Okuyucunun oluşturduğu TableIndex (text modunda sadece muayene tabloları gösterilir)
+            session: DocumentSession - HTML ve doküman ağacı oturumdan alınır, dosya tekrar parse edilmez
+        """
+        self.table_index = table_index
+        self.session = session
         if not MAMMOTH_AVAILABLE:
             self._show_error("Mammoth kütüphanesi bulunamadı!")
             return
@@ -206,6 +222,9 @@ class DocumentViewer(ctk.CTkFrame):
     
     def _convert_word_to_html(self, file_path: str) -> str:
         """Word dosyasını HTML'e dönüştürür"""
+        if self.session is not None:
+            return self.session.html()
+        
         try:
             with open(file_path, "rb") as docx_file:
                 result = mammoth.convert_to_html(docx_file)
@@ -302,7 +321,7 @@ class DocumentViewer(ctk.CTkFrame):
             
         try:
             # Basit text extraction deneme
-            doc = Document(file_path)
+            doc = self.session.document if self.session is not None else Document(file_path)
             
             # Text content topla
             text_content = ""
@@ -310,13 +329,19 @@ class DocumentViewer(ctk.CTkFrame):
                 if para.text.strip():
                     text_content += f"<p>{para.text}</p>"
             
-            # Tabloları HTML olarak ekle
+            # Tabloları HTML olarak ekle (indeks varsa antet/revizyon tabloları atlanır)
+            tables = doc.tables
+            if self.table_index is not None:
+                positions = [info.position for info in self.table_index.tables if info.position < len(tables)]
+            else:
+                positions = range(len(tables))
+            
             table_html = ""
-            for i, table in enumerate(doc.tables):
+            for i in positions:
                 table_html += f"<h3>Tablo {i+1}</h3><table>"
-                for row in table.rows:
+                for row_cells in iter_docx_rows(tables[i]):
                     table_html += "<tr>"
-                    for cell in row.cells:
+                    for cell in row_cells:
                         table_html += f"<td>{cell.text}</td>"
                     table_html += "</tr>"
                 table_html += "</table>"
@@ -11,6 +11,7 @@ import os
 # Servis importları için path ekleme
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from services.data_processor import TeknikResimKarakteri
+from services.tolerance_engine import actual_values, evaluate_values, write_actual
 
 
 class SingleKarakterView(ctk.CTkFrame):
@@ -303,8 +304,8 @@ class SingleKarakterView(ctk.CTkFrame):
             # Virgülü noktaya çevir
             new_value = new_value.replace(',', '.')
 
-            # Ölçümü kaydet
-            self.current_karakter.actual = new_value
+            # Ölçümü kaydet (sayısal karşılığı bir kez parse edilip karakterde saklanır)
+            write_actual(self.current_karakter, new_value)
 
             # Tolerance kontrolü ve status mesajı
             status_message = self._get_save_status_message(new_value)
@@ -325,20 +326,20 @@ class SingleKarakterView(ctk.CTkFrame):
 
     def _get_save_status_message(self, new_value: str) -> str:
         """Kaydetme işlemi için status mesajını oluşturur"""
-        try:
-            actual_float = float(new_value)
-            tolerance_status = self.check_tolerance(actual_float)
-            if tolerance_status:
-                return f"✓ Kaydedildi! {tolerance_status}"
-            else:
-                return "✓ Ölçüm kaydedildi!"
-        except ValueError:
+        values = actual_values(self.current_karakter)
+        if len(values) != 1 or values[0] is None:
             return "✓ Kaydedildi (metin değer)"
 
+        tolerance_status = self.check_tolerance(values[0])
+        if tolerance_status:
+            return f"✓ Kaydedildi! {tolerance_status}"
+        else:
+            return "✓ Ölçüm kaydedildi!"
+
     def clear_measurement(self):
         """Ölçümü temizler"""
         if self.current_karakter:
-            self.current_karakter.actual = None
+            write_actual(self.current_karakter, None)
             self.actual_entry.delete(0, tk.END)
             self.current_value_label.configure(
                 text="Henüz ölçüm yapılmadı",
@@ -356,36 +357,19 @@ class SingleKarakterView(ctk.CTkFrame):
         if not karakter:
             return ""
 
-        # Parsed dimension bilgileri var mı kontrol et
-        if not (hasattr(karakter, 'lower_limit') or hasattr(karakter, 'upper_limit')):
-            return ""
-
-        has_lower = hasattr(karakter, 'lower_limit') and karakter.lower_limit is not None
-        has_upper = hasattr(karakter, 'upper_limit') and karakter.upper_limit is not None
+        has_lower = karakter.lower_limit is not None
+        has_upper = karakter.upper_limit is not None
 
         if not has_lower and not has_upper:
             return ""
 
-        try:
-            if has_lower and has_upper:
-                if karakter.lower_limit <= actual_value <= karakter.upper_limit:
-                    return "✅ Tolerance İçinde"
-                else:
-                    return "❌ Tolerance Dışı"
-            elif has_upper:
-                if actual_value <= karakter.upper_limit:
-                    return "✅ Max Limit İçinde"
-                else:
-                    return "❌ Max Limit Aşıldı"
-            elif has_lower:
-                if actual_value >= karakter.lower_limit:
-                    return "✅ Min Limit İçinde"
-                else:
-                    return "❌ Min Limit Altında"
-        except:
-            pass
-
-        return ""
+        # Kural Word kaydetme ve istatistiklerle aynı (tolerance_engine)
+        in_tolerance = evaluate_values(karakter, [actual_value])[0]
+        if has_lower and has_upper:
+            return "✅ Tolerance İçinde" if in_tolerance else "❌ Tolerance Dışı"
+        elif has_upper:
+            return "✅ Max Limit İçinde" if in_tolerance else "❌ Max Limit Aşıldı"
+        return "✅ Min Limit İçinde" if in_tolerance else "❌ Min Limit Altında"
 
     def set_callback(self, callback: Callable[[TeknikResimKarakteri], None]):
         """Update callback'ini değiştirir"""
@@ -10,6 +10,7 @@ import os
 # Servis importları için path ekleme
 sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 from services.data_processor import TeknikResimKarakteri
+from services.karakter_repository import KarakterRepository
 
 
 class StatsPanel(ctk.CTkFrame):
@@ -86,53 +87,18 @@ class StatsPanel(ctk.CTkFrame):
         self._enable_buttons()
     
     def _calculate_stats(self, karakterler: List[TeknikResimKarakteri], current_index: int) -> dict:
-        """İstatistikleri hesaplar"""
-        total = len(karakterler)
-        measured = len([k for k in karakterler if k.actual])
-        unmeasured = total - measured
-        
-        # Tolerance istatistikleri
-        tolerance_violations = 0
-        tolerance_compliant = 0
-        
-        for karakter in karakterler:
-            if karakter.actual and hasattr(karakter, 'lower_limit') or hasattr(karakter, 'upper_limit'):
-                # Basit tolerance kontrolü
-                try:
-                    actual_float = float(str(karakter.actual).replace(',', '.'))
-                    if self._is_within_tolerance(karakter, actual_float):
-                        tolerance_compliant += 1
-                    else:
-                        tolerance_violations += 1
-                except:
-                    pass  # Sayısal olmayan değerler için pas geç
-        
-        return {
-            'total': total,
-            'measured': measured,
-            'unmeasured': unmeasured,
-            'current_index': current_index,
-            'completion_percentage': (measured / total * 100) if total > 0 else 0,
-            'tolerance_violations': tolerance_violations,
-            'tolerance_compliant': tolerance_compliant
-        }
-    
-    def _is_within_tolerance(self, karakter: TeknikResimKarakteri, actual_value: float) -> bool:
-        """Tolerance kontrolü yapar"""
-        has_lower = hasattr(karakter, 'lower_limit') and karakter.lower_limit is not None
-        has_upper = hasattr(karakter, 'upper_limit') and karakter.upper_limit is not None
-        
-        if not has_lower and not has_upper:
-            return True  # Tolerance tanımlanmamış
-        
-        if has_lower and has_upper:
-            return karakter.lower_limit <= actual_value <= karakter.upper_limit
-        elif has_upper:
-            return actual_value <= karakter.upper_limit
-        elif has_lower:
-            return actual_value >= karakter.lower_limit
-        
-        return True
+        """
+        İstatistikleri döner
+        
+        Depo sayaçları ölçüm girildikçe güncellendiğinden navigasyonda karakterler
+        tekrar dolaşılmaz; düz liste verilirse bir kez indekslenir.
+        """
+        if not isinstance(karakterler, KarakterRepository):
+            karakterler = KarakterRepository(karakterler)
+        
+        stats = karakterler.get_statistics()
+        stats['current_index'] = current_index
+        return stats
     
     def _format_stats_text(self, stats: dict) -> str:
         """İstatistik metnini formatlar"""
@@ -4,6 +4,8 @@ Enhanced Ana pencere - Project Manager ve Lot Detail Manager entegreli
 Tab-based UI ile modern yapı
 """
 import customtkinter as ctk
+import itertools
+import multiprocessing
 import os
 import sys
 from tkinter import filedialog, messagebox
@@ -30,23 +32,42 @@ except ImportError:
 
 # Servis importları
 try:
-    from services.word_reader import WordReaderService
+    from services.word_reader import WordReaderService, HEADERS
     from services.data_processor import DataProcessorService, TeknikResimKarakteri
     from services.word_save_as import WordSaveAsService
     from services.project_manager import ProjectManager
     from services.lot_detail_manager import LotDetailManager
     from services.auto_save_recovery import AutoSaveRecoveryService
+    from services.parse_cache import DocumentParseCache
+    from services.parsed_dimension_store import ParsedDimensionStore
+    from services.document_session import DocumentSession
+    from services.docx_repair import REPAIR_LOG
+    from services.karakter_repository import KarakterRepository
+    from services.olcu_parser import PAYLASILAN_ONBELLEK
 except ImportError:
     services_path = os.path.join(project_root, 'services')
     if os.path.exists(services_path):
         sys.path.insert(0, project_root)
 
-    from services.word_reader import WordReaderService
+    from services.word_reader import WordReaderService, HEADERS
     from services.data_processor import DataProcessorService, TeknikResimKarakteri
     from services.word_save_as import WordSaveAsService
     from services.project_manager import ProjectManager
     from services.lot_detail_manager import LotDetailManager
     from services.auto_save_recovery import AutoSaveRecoveryService
+    from services.parse_cache import DocumentParseCache
+    from services.parsed_dimension_store import ParsedDimensionStore
+    from services.document_session import DocumentSession
+    from services.docx_repair import REPAIR_LOG
+    from services.karakter_repository import KarakterRepository
+    from services.olcu_parser import PAYLASILAN_ONBELLEK
+
+from utils.logger import get_logger
+
+log = get_logger(__name__)
+
+# Akış halinde yüklemede arayüz güncellemeleri arasında eklenecek karakter sayısı
+STREAM_BATCH_SIZE = 50
 
 
 class ProjectInfoTab(ctk.CTkFrame):
@@ -285,7 +306,7 @@ class ProjectInfoTab(ctk.CTkFrame):
                 self.file_path_label.configure(text=f"✓ Seçilen: {file_name}")
                 self.proceed_btn.configure(state="normal")
 
-                print(f"Word dosyası kopyalandı: {target_path}")
+                log.info("Word dosyası kopyalandı: %s", target_path)
             else:
                 messagebox.showerror("Hata", f"Dosya kopyalama hatası: {error}")
 
@@ -305,13 +326,24 @@ class ProjectInfoTab(ctk.CTkFrame):
 class MeasurementTab(ctk.CTkFrame):
     """Ölçüm sekmesi - navigate edilebilir karakter görünümü + lot detayları"""
 
-    def __init__(self, parent, project_manager: ProjectManager, lot_manager: LotDetailManager):
+    def __init__(self, parent, project_manager: ProjectManager, lot_manager: LotDetailManager,
+                 on_loading_finished_callback=None):
         super().__init__(parent)
 
         self.project_manager = project_manager
         self.lot_manager = lot_manager
-        self.karakterler: List[TeknikResimKarakteri] = []
+        # Tüm karakterler yüklendiğinde dosya yolu ile çağrılır
+        self.on_loading_finished_callback = on_loading_finished_callback
+        # Doküman sırasıyla, item_no / tanımlayıcı indeksli karakterler
+        self.karakterler = KarakterRepository()
+        self.table_index = None
+        # Okuyucu, yazıcı ve görüntüleyicinin paylaştığı doküman oturumu
+        self.session = None
         self.current_index = 0
+        # Akış halinde yükleme sürerken bekleyen after() işi
+        self._loading_job = None
+        # Tüm projelerin paylaştığı parse sonuçları (Desktop/Report)
+        self.dimension_store = ParsedDimensionStore()
 
         self.setup_ui()
 
@@ -424,47 +456,139 @@ class MeasurementTab(ctk.CTkFrame):
         )
         self.stats_panel.grid(row=2, column=0, columnspan=2, sticky="ew", padx=10, pady=10)
 
-    def load_data(self, file_path: str):
-        """Dosyadan veri yükle"""
+    def load_data(self, file_path: str, session: DocumentSession = None):
+        """
+        Dosyadan veri yükle
+
+        Önbellekte yoksa Word akış halinde okunur: ilk karakter gelir gelmez
+        gösterilir, kalanlar arayüz donmadan gruplar halinde eklenir.
+        Doküman session üzerinden bir kez parse edilir, görüntüleyici de aynı oturumu kullanır.
+        """
         try:
-            # Word servisi
-            word_service = WordReaderService()
+            self.session = session or DocumentSession(file_path)
 
-            # DataFrame oluştur
-            df = DataProcessorService.from_word_tables(word_service, file_path)
+            # Önceki dosyanın yüklemesi sürüyorsa durdur
+            if self._loading_job is not None:
+                self.after_cancel(self._loading_job)
+                self._loading_job = None
+
+            # Aynı doküman daha önce işlendiyse parse önbelleğinden al
+            project_folder = self.project_manager.get_project_folder()
+            parse_cache = DocumentParseCache(project_folder) if project_folder else None
+            if project_folder:
+                # Onarım kaydı parse önbelleğinin yanında saklanır, taranan dosya tekrar taranmaz
+                REPAIR_LOG.use_folder(project_folder)
+            cached = parse_cache.load_karakterler(file_path) if parse_cache else None
+
+            if cached is not None:
+                self.karakterler = KarakterRepository(cached)
+                self.table_index = parse_cache.load_table_index(file_path)
+                self.session.table_index = self.table_index
+
+                if not self.karakterler:
+                    messagebox.showwarning("Uyarı", "Geçerli karakter bulunamadı!")
+                    return
 
-            if df.empty:
-                messagebox.showwarning("Uyarı", "Geçerli veri bulunamadı!")
+                self.show_first_karakter()
+                self.finish_loading(file_path)
                 return
 
-            # Model objelerine dönüştür
-            data_service = DataProcessorService()
-            self.karakterler = data_service.process_dataframe(df)
+            # Daha önce herhangi bir projede parse edilmiş ölçüler parser önbelleğine alınır,
+            # projenin kendi ölçüleri en son eklenir ki önbellekten ilk onlar düşmesin
+            PAYLASILAN_ONBELLEK.isit(self.dimension_store.items(PAYLASILAN_ONBELLEK.maxsize))
+            if parse_cache:
+                PAYLASILAN_ONBELLEK.isit(parse_cache.parsed_dimensions())
+
+            # Word servisi - satırlar okundukça karakterlere dönüşür
+            word_service = WordReaderService()
+            # Isıtılan paylaşılan önbellek parser'a açıkça verilir
+            data_service = DataProcessorService(onbellek=PAYLASILAN_ONBELLEK)
+            extracted_rows = [list(HEADERS)]
+
+            def rows():
+                for row in word_service.iter_rows(file_path, session=self.session):
+                    extracted_rows.append(row)
+                    yield row
 
-            if not self.karakterler:
-                messagebox.showwarning("Uyarı", "Geçerli karakter bulunamadı!")
+            stream = data_service.iter_karakterler(rows())
+            first = next(stream, None)
+
+            if first is None:
+                if len(extracted_rows) == 1:
+                    messagebox.showwarning("Uyarı", "Geçerli veri bulunamadı!")
+                else:
+                    messagebox.showwarning("Uyarı", "Geçerli karakter bulunamadı!")
                 return
 
-            # Lot manager'a callback ayarla
-            self.lot_manager.set_update_callback(self.update_actual_value)
+            # İlk karakteri hemen göster, ölçüme başlanabilir
+            self.karakterler = KarakterRepository([first])
+            self.table_index = word_service.table_index
+            self.show_first_karakter()
 
-            # İlk karakteri göster
-            self.current_index = 0
-            self.show_current_karakter()
+            self._loading_job = self.after(
+                1, lambda: self.load_next_batch(stream, file_path, extracted_rows, parse_cache)
+            )
+
+        except Exception as e:
+            messagebox.showerror("Hata", f"Veri yükleme hatası: {str(e)}")
+
+    def load_next_batch(self, stream, file_path: str, extracted_rows: List, parse_cache):
+        """Akıştan bir grup karakter ekler, akış bitince yüklemeyi tamamlar"""
+        try:
+            batch = list(itertools.islice(stream, STREAM_BATCH_SIZE))
+            self.karakterler.extend(batch)
             self.update_navigation()
-            self.update_stats()
 
-            # Dokümanı yükle
-            self.document_viewer.load_document(file_path)
+            if len(batch) == STREAM_BATCH_SIZE:
+                self._loading_job = self.after(
+                    1, lambda: self.load_next_batch(stream, file_path, extracted_rows, parse_cache)
+                )
+                return
 
-            # Lot detay butonunu aktif et
-            self.lot_detail_btn.configure(state="normal")
+            self._loading_job = None
+            if parse_cache:
+                parse_cache.store(file_path, extracted_rows, self.karakterler, self.table_index)
 
-            print(f"✓ {len(self.karakterler)} karakter yüklendi")
+            self.finish_loading(file_path)
 
         except Exception as e:
+            self._loading_job = None
             messagebox.showerror("Hata", f"Veri yükleme hatası: {str(e)}")
 
+    @property
+    def is_loading(self) -> bool:
+        """Karakterler hâlâ akış halinde ekleniyor mu"""
+        return self._loading_job is not None
+
+    def show_first_karakter(self):
+        """İlk karakteri göster"""
+        self.current_index = 0
+        self.show_current_karakter()
+        self.update_navigation()
+        self.update_stats()
+
+    def finish_loading(self, file_path: str):
+        """Tüm karakterler yüklendikten sonraki adımlar"""
+        # Parse sonuçlarını diğer projelerle paylaş
+        self.dimension_store.store_karakterler(self.karakterler)
+
+        # Lot manager'a callback ayarla
+        self.lot_manager.set_update_callback(self.update_actual_value)
+
+        self.update_stats()
+
+        # Dokümanı yükle
+        self.document_viewer.load_document(file_path, self.table_index, self.session)
+
+        # Lot detay butonunu aktif et
+        self.lot_detail_btn.configure(state="normal")
+
+        log.info("✓ %s karakter yüklendi", len(self.karakterler))
+
+        # Yazıcı ve rapor özetleri tam liste ve tablo indeksiyle çalışır
+        if self.on_loading_finished_callback:
+            self.on_loading_finished_callback(file_path)
+
     def show_current_karakter(self):
         """Mevcut karakteri göster"""
         if 0 <= self.current_index < len(self.karakterler):
@@ -491,30 +615,25 @@ class MeasurementTab(ctk.CTkFrame):
 
     def on_karakter_updated(self, karakter: TeknikResimKarakteri):
         """Karakter güncellendiğinde çağrılır"""
+        self.karakterler.refresh(karakter)
         self.update_stats()
-        print(f"Karakter güncellendi: {karakter.item_no} = {karakter.actual}")
+        log.debug("Karakter güncellendi: %s = %s", karakter.item_no, karakter.actual)
 
     def update_actual_value(self, identifier: str, actual_value: str):
         """Lot detayından gelen ACTUAL değer güncellemesi"""
-        # identifier formatı: "dimension_item_no"
-        parts = identifier.split('_', 1)
-        if len(parts) == 2:
-            dimension, item_no = parts
+        # identifier formatı: "dimension_item_no" (depoda doğrudan indeksli)
+        karakter = self.karakterler.get_by_identifier(identifier)
+        if karakter is None:
+            return
 
-            # İlgili karakteri bul ve güncelle
-            for karakter in self.karakterler:
-                if karakter.dimension == dimension and karakter.item_no == item_no:
-                    karakter.actual = actual_value
+        self.karakterler.set_actual(karakter, actual_value)
 
-                    # Eğer bu karakter şu an gösteriliyorsa, görünümü güncelle
-                    current_karakter = self.karakterler[self.current_index]
-                    if (current_karakter.dimension == dimension and
-                            current_karakter.item_no == item_no):
-                        self.show_current_karakter()
+        # Eğer bu karakter şu an gösteriliyorsa, görünümü güncelle
+        if self.karakterler.position_of(karakter) == self.current_index:
+            self.show_current_karakter()
 
-                    self.update_stats()
-                    print(f"Lot detayından ACTUAL güncellendi: {identifier} = {actual_value}")
-                    break
+        self.update_stats()
+        log.debug("Lot detayından ACTUAL güncellendi: %s = %s", identifier, actual_value)
 
     def save_current_measurement(self):
         """Mevcut ölçümü kaydet"""
@@ -579,6 +698,10 @@ class MeasurementTab(ctk.CTkFrame):
             messagebox.showwarning("Uyarı", "Veri yok!")
             return
 
+        if self.is_loading:
+            messagebox.showwarning("Uyarı", "Karakterler yükleniyor, yükleme bitince tekrar deneyin!")
+            return
+
         try:
             project_folder = self.project_manager.get_project_folder()
             if not project_folder:
@@ -648,6 +771,7 @@ class EnhancedMainWindow(ctk.CTk):
         self.lot_manager = LotDetailManager(self.project_manager)
         self.word_save_service = WordSaveAsService()
         self.auto_save_service = AutoSaveRecoveryService()
+        self.document_session = None
 
         self.setup_ui()
         self.setup_keyboard_shortcuts()
@@ -681,7 +805,8 @@ class EnhancedMainWindow(ctk.CTk):
         self.measurement_tab_content = MeasurementTab(
             self.measurement_tab,
             self.project_manager,
-            self.lot_manager
+            self.lot_manager,
+            on_loading_finished_callback=self.on_measurement_loaded
         )
         self.measurement_tab_content.pack(fill="both", expand=True)
 
@@ -800,7 +925,7 @@ class EnhancedMainWindow(ctk.CTk):
 
     def on_project_ready(self, project_folder: str, file_path: str = None):
         """Proje hazır olduğunda çağrılır"""
-        print(f"Proje hazır: {project_folder}")
+        log.info("Proje hazır: %s", project_folder)
 
         # Lot manager'ın veri kaynaklarını ayarla
         self.lot_manager.setup_project_sources()
@@ -811,16 +936,35 @@ class EnhancedMainWindow(ctk.CTk):
         if file_path:
             # Dosya seçildiyse, ölçüm sekmesine geç ve veri yükle
             self.tabview.set("📏 Ölçüm")
-            self.measurement_tab_content.load_data(file_path)
 
-            # Word save servisini ayarla
-            self.word_save_service.load_original_document(file_path)
+            # Doküman tek kez açılır; okuma, görüntüleme ve kaydetme aynı oturumu paylaşır
+            if self.document_session is not None:
+                self.document_session.release()
+            self.document_session = DocumentSession(file_path)
+
+            # Önceki dokümanın yazıcısı bırakılır; yeni doküman yükleme bitince bağlanır
+            self.word_save_service = WordSaveAsService()
+            self.measurement_tab_content.load_data(file_path, self.document_session)
+        else:
+            # Rapor özetlerini güncelle
+            self.update_report_summaries()
+
+    def on_measurement_loaded(self, file_path: str):
+        """Akış halinde yükleme bittiğinde çağrılır"""
+        # Word save servisini ayarla (tablo indeksi artık tam)
+        self.word_save_service.load_original_document(
+            file_path, self.measurement_tab_content.table_index, self.document_session
+        )
 
         # Rapor özetlerini güncelle
         self.update_report_summaries()
 
     def update_report_summaries(self):
         """Rapor özetlerini güncelle"""
+        # Yükleme sürerken özetler eksik listeyle hesaplanmaz; bitince güncellenir
+        if self.measurement_tab_content.is_loading:
+            return
+
         try:
             # Proje özeti
             project_info = self.project_manager.get_project_info()
@@ -835,19 +979,17 @@ class EnhancedMainWindow(ctk.CTk):
             # Ölçüm özeti
             karakterler = self.measurement_tab_content.karakterler
             if karakterler:
-                total = len(karakterler)
-                measured = len([k for k in karakterler if k.actual])
-                unmeasured = total - measured
-                completion_rate = (measured / total * 100) if total > 0 else 0
+                # Depo sayaçları ölçüm girildikçe güncellenir, karakterler dolaşılmaz
+                stats = karakterler.get_statistics()
 
-                measurement_text = f"""Toplam Karakter: {total}
-Ölçülen: {measured}
-Bekleyen: {unmeasured}
-Tamamlanma Oranı: %{completion_rate:.1f}
+                measurement_text = f"""Toplam Karakter: {stats['total']}
+Ölçülen: {stats['measured']}
+Bekleyen: {stats['unmeasured']}
+Tamamlanma Oranı: %{stats['completion_percentage']:.1f}
 
 Tolerance Analizi:
-• Toleranslı Ölçümler: {len([k for k in karakterler if hasattr(k, 'tolerance_type') and k.tolerance_type])}
-• Parse Edilen Dimensionlar: {len([k for k in karakterler if hasattr(k, 'parsed_dimension') and k.parsed_dimension])}
+• Toleranslı Ölçümler: {stats['tolerance_typed']}
+• Parse Edilen Dimensionlar: {stats['parsed_dimensions']}
 """
 
                 self.measurement_summary.delete("1.0", "end")
@@ -866,10 +1008,10 @@ Veri Kaynakları: {', '.join(lot_stats.get('data_sources', []))}
                 self.lot_summary.delete("1.0", "end")
                 self.lot_summary.insert("1.0", lot_text)
 
-            print("✓ Rapor özetleri güncellendi")
+            log.info("✓ Rapor özetleri güncellendi")
 
         except Exception as e:
-            print(f"HATA: Özet güncelleme hatası: {e}")
+            log.error("HATA: Özet güncelleme hatası: %s", e)
 
     def generate_word_report(self):
         """Word raporu oluştur"""
@@ -879,6 +1021,10 @@ Veri Kaynakları: {', '.join(lot_stats.get('data_sources', []))}
                 messagebox.showwarning("Uyarı", "Ölçüm verisi bulunamadı!")
                 return
 
+            if self.measurement_tab_content.is_loading:
+                messagebox.showwarning("Uyarı", "Karakterler yükleniyor, yükleme bitince tekrar deneyin!")
+                return
+
             if not self.word_save_service.current_document:
                 messagebox.showwarning("Uyarı", "Word dokümanı yüklenmemiş!")
                 return
@@ -983,13 +1129,18 @@ Raporu açmak istiyor musunuz?"""
     def open_project_folder(self):
         """Proje klasörünü aç"""
         if self.project_manager.open_project_folder():
-            print("✓ Proje klasörü açıldı")
+            log.info("✓ Proje klasörü açıldı")
         else:
             messagebox.showwarning("Uyarı", "Proje klasörü bulunamadı!")
 
     def quick_save(self):
         """Hızlı kaydetme (Ctrl+S)"""
         try:
+            # Eksik liste yedeğe yazılmaz
+            if self.measurement_tab_content.is_loading:
+                self.show_temporary_status("⏳ Yükleniyor, kaydedilmedi")
+                return
+
             karakterler = self.measurement_tab_content.karakterler
             if karakterler:
                 # Auto-save servisini güncelle
@@ -999,13 +1150,13 @@ Raporu açmak istiyor musunuz?"""
                 # Özet bilgileri güncelle
                 self.update_report_summaries()
 
-                print("✓ Hızlı kaydetme tamamlandı")
+                log.info("✓ Hızlı kaydetme tamamlandı")
 
                 # Status göster (kısa süreliğine)
                 self.show_temporary_status("💾 Kaydedildi")
 
         except Exception as e:
-            print(f"HATA: Hızlı kaydetme hatası: {e}")
+            log.error("HATA: Hızlı kaydetme hatası: %s", e)
 
     def show_temporary_status(self, message: str, duration: int = 2000):
         """Geçici status mesajı göster"""
@@ -1032,10 +1183,10 @@ Raporu açmak istiyor musunuz?"""
                 self.auto_save_service.update_data(karakterler)
                 self.auto_save_service.emergency_save()
 
-            print("✓ Uygulama güvenli şekilde kapatıldı")
+            log.info("✓ Uygulama güvenli şekilde kapatıldı")
 
         except Exception as e:
-            print(f"HATA: Kapatma hatası: {e}")
+            log.error("HATA: Kapatma hatası: %s", e)
         finally:
             self.destroy()
 
@@ -1053,17 +1204,19 @@ def main():
     # Kapatma event'ini ayarla
     app.protocol("WM_DELETE_WINDOW", app.on_closing)
 
-    print("🚀 Dijital IRS - Gelişmiş sistem başlatıldı")
-    print("📁 Project Manager aktif")
-    print("🔍 Lot Detail Manager aktif")
-    print("💾 Auto-save aktif")
-    print("⌨️  Klavye kısayolları:")
-    print("   Ctrl+S: Hızlı kaydetme")
-    print("   F5: Özet güncelleme")
-    print("   Ctrl+O: Proje klasörü aç")
+    log.info("🚀 Dijital IRS - Gelişmiş sistem başlatıldı")
+    log.info("📁 Project Manager aktif")
+    log.info("🔍 Lot Detail Manager aktif")
+    log.info("💾 Auto-save aktif")
+    log.info("⌨️  Klavye kısayolları:")
+    log.info("   Ctrl+S: Hızlı kaydetme")
+    log.info("   F5: Özet güncelleme")
+    log.info("   Ctrl+O: Proje klasörü aç")
 
     app.mainloop()
 
 
 if __name__ == "__main__":
+    # PyInstaller exe içinde toplu işleme süreçlerinin başlatılabilmesi için
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file
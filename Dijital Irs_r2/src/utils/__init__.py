@@ -0,0 +1,11 @@
+"""
+Yardımcı modüller - servis ve UI katmanlarının ortak altyapısı
+"""
+
+from .logger import StructuredLogger, get_logger, configure_logging
+
+__all__ = [
+    'StructuredLogger',
+    'get_logger',
+    'configure_logging'
+]
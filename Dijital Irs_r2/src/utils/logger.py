@@ -0,0 +1,175 @@
+# utils/logger.py
+"""
+Seviyeli, yapılandırılmış loglama - servislerdeki print() çağrılarının yerine geçer
+
+- Kapalı seviyeler sıcak döngülerde maliyetsizdir: mesaj %-argümanlarla verilir,
+  biçimlendirme sadece kayıt gerçekten yazılacaksa yapılır
+- Konsol çıktısı eski print() mesajlarıyla aynı görünür
+- İsteğe bağlı JSON-lines dosyası (post-mortem analiz için)
+
+Ortam değişkenleri:
+    DIJITAL_IRS_LOG_LEVEL: DEBUG / INFO / WARNING / ERROR (varsayılan INFO)
+    DIJITAL_IRS_LOG_JSON: JSON-lines log dosyasının yolu
+"""
+import json
+import logging
+import os
+import sys
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+ROOT_LOGGER_NAME = "dijital_irs"
+LOG_LEVEL_ENV = "DIJITAL_IRS_LOG_LEVEL"
+LOG_JSON_ENV = "DIJITAL_IRS_LOG_JSON"
+
+_loggers: Dict[str, 'StructuredLogger'] = {}
+_configured = False
+
+
+class ConsoleFormatter(logging.Formatter):
+    """Mesajı print() gibi yalın basar, yapılandırılmış alanları sona ekler"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        message = record.getMessage()
+        fields = getattr(record, "fields", None)
+        if fields:
+            message += "  " + " ".join(f"{key}={value}" for key, value in fields.items())
+        if record.exc_info:
+            message += "\n" + self.formatException(record.exc_info)
+        return message
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """Her kaydı tek satır JSON olarak yazar"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "timestamp": datetime.fromtimestamp(record.created).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        fields = getattr(record, "fields", None)
+        if fields:
+            data["fields"] = fields
+        if record.exc_info:
+            data["exception"] = self.formatException(record.exc_info)
+        return json.dumps(data, ensure_ascii=False, default=str)
+
+
+class StdoutHandler(logging.StreamHandler):
+    """
+    O anki sys.stdout'a yazar (redirect_stdout ile uyumlu)
+    PyInstaller pencereli build'de stdout None olduğunda sessizce atlar
+    """
+
+    def __init__(self):
+        super().__init__(sys.stdout)
+
+    @property
+    def stream(self):
+        return sys.stdout
+
+    @stream.setter
+    def stream(self, value):
+        pass
+
+    def emit(self, record: logging.LogRecord):
+        if sys.stdout is not None:
+            super().emit(record)
+
+
+class StructuredLogger:
+    """
+    logging.Logger sarmalayıcı
+
+    Kullanım:
+        log = get_logger(__name__)
+        log.info("✓ Word dosyası yüklendi: %s", file_path)
+        log.debug("Satır eklendi: %s", item_no, kolon=8)
+
+    Birden fazla satır hazırlayan sıcak döngülerde `if log.debug_enabled:` ile
+    argüman hazırlığı da atlanabilir.
+    """
+
+    def __init__(self, name: str):
+        self.logger = logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
+
+    # Seviye her erişimde okunur: configure_logging veya doğrudan setLevel
+    # sonrası da doğrudur; isEnabledFor sonucu logging içinde önbelleklidir
+    @property
+    def debug_enabled(self) -> bool:
+        return self.logger.isEnabledFor(logging.DEBUG)
+
+    @property
+    def info_enabled(self) -> bool:
+        return self.logger.isEnabledFor(logging.INFO)
+
+    def _log(self, level: int, msg: str, args: tuple, fields: Dict[str, Any], exc_info=None):
+        self.logger.log(level, msg, *args, exc_info=exc_info,
+                        extra={"fields": fields} if fields else None, stacklevel=3)
+
+    def debug(self, msg: str, *args, **fields):
+        if self.debug_enabled:
+            self._log(logging.DEBUG, msg, args, fields)
+
+    def info(self, msg: str, *args, **fields):
+        if self.info_enabled:
+            self._log(logging.INFO, msg, args, fields)
+
+    def warning(self, msg: str, *args, **fields):
+        self._log(logging.WARNING, msg, args, fields)
+
+    def error(self, msg: str, *args, exc_info=None, **fields):
+        self._log(logging.ERROR, msg, args, fields, exc_info=exc_info)
+
+    def log_operation(self, operation: str, details: Dict[str, Any]):
+        """Bir işlemi detaylarıyla yapılandırılmış kayıt olarak yazar"""
+        self.info("%s", operation, **details)
+
+
+def configure_logging(level: Optional[str] = None, json_path: Optional[str] = None, console: bool = True):
+    """
+    Kök logger'ı yapılandırır; tekrar çağrılırsa önceki handler'ları değiştirir
+
+    Args:
+        level: Log seviyesi (None ise ortam değişkeni veya INFO)
+        json_path: JSON-lines dosya yolu (None ise ortam değişkeni; o da yoksa kapalı)
+        console: Konsola yazılsın mı
+    """
+    global _configured
+
+    level = (level or os.environ.get(LOG_LEVEL_ENV) or "INFO").upper()
+    json_path = json_path or os.environ.get(LOG_JSON_ENV)
+
+    root = logging.getLogger(ROOT_LOGGER_NAME)
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+        handler.close()
+
+    root.setLevel(getattr(logging, level, logging.INFO))
+    root.propagate = False
+
+    if console:
+        console_handler = StdoutHandler()
+        console_handler.setFormatter(ConsoleFormatter())
+        root.addHandler(console_handler)
+
+    if json_path:
+        try:
+            json_handler = logging.FileHandler(json_path, encoding="utf-8")
+            json_handler.setFormatter(JsonLinesFormatter())
+            root.addHandler(json_handler)
+        except OSError as e:
+            print(f"⚠ JSON log dosyası açılamadı: {e}")
+
+    _configured = True
+
+
+def get_logger(name: str) -> StructuredLogger:
+    """Modül için logger döner (ilk çağrıda varsayılan yapılandırma uygulanır)"""
+    if not _configured:
+        configure_logging()
+    if name not in _loggers:
+        _loggers[name] = StructuredLogger(name)
+    return _loggers[name]